@@ -3,8 +3,17 @@
 
 from .getconflicts import ConflictSetsFileParser, random_conflicts, linear_conflicts
 from .mhs import SolutionSet, MinimalHittingSetsProblem
+from .stats import SolverStats, SolverHooks
 from .hsdag import HsDag
 from .rctree import RcTree
-from .algcompare import compare_from_file, compare
+from .bitset import BitsetHsDag, BitsetRcTree
+from .mmcs import Mmcs
+from .berge import Berge
+from .components import Decomposition, connected_components
+from .cache import CachedProblem, SolutionsCache
+from .binary import FamiliesReader, write_families
+from .verify import FamilyVerifier, verify_family
+from .algcompare import (compare_from_file, compare, solve_from_file,
+                         stream_from_file)
 
 VERSION = 'v1.0.1'
@@ -3,10 +3,15 @@
 
 """
 Parses the command line arguments when executing the package as a whole
-and passes them to `algcompare.compare_from_file()`.
+and passes them to `algcompare.compare_from_file()` or, when the amount of
+jobs is specified, to `algcompare.solve_from_file()` or, when streaming, to
+`algcompare.stream_from_file()`.
 """
 
-from .algcompare import compare_from_file
+from .algcompare import (ENGINES, compare_from_file, solve_from_file,
+                         stream_from_file)
+from .cache import SolutionsCache
+from .cli import choice_of, int_value_of, name_of, value_of
 
 import sys
 
@@ -14,11 +19,29 @@ render = False
 prune = False
 sort = False
 output_files_prefix = None
+max_cardinality = None
+subsume = True
+kernelize = False
+use_cache = False
+cache_directory = None
+jobs = None
+stream = False
+json_lines = False
+limit = None
+print_stats = False
+engine = 'rctree'
+engines = ('hsdag', 'rctree')
 help_text = """{:s}
 Usage:
 
 python -m minihit input_file_name [--render [--output_files_prefix=PREFIX]] 
-[--prune | --sort]
+[--prune | --sort] [--max_cardinality=N] [--nosubsume] [--kernelize]
+[--cache [--cache_dir=DIRECTORY]]
+[--engines=ENGINE,ENGINE...]
+[--jobs N [--engine=ENGINE]]
+[--stream [--engine=ENGINE] [--format=lines|json] [--limit K] [--stats]]
+
+The options taking a value accept both --option=VALUE and --option VALUE.
 
 input_file_name       Path to the file containing conflict sets to parse.
 render                Enables the generation a graphical representations of the 
@@ -30,27 +53,143 @@ prune                 Enables pruning of the generated DAGs (in doubt, set it).
 sort                  Sorts set of conflicts before starting the search for
                       minimal hitting sets.
                       Activating sorting disables pruning.
+max_cardinality       Finds only the minimal hitting sets with at most N
+                      elements, without expanding the DAGs any deeper.
+nosubsume             Keeps the duplicate conflicts and the supersets of other
+                      conflicts, which are removed by default before solving.
+kernelize             Removes the elements of the conflicts with a single
+                      element, which are in every minimal hitting set, and
+                      all but one of the elements contained in exactly the
+                      same conflicts before solving.
+cache                 Reuses the minimal hitting sets of the lines with the same
+                      conflicts, in any order, instead of solving them again.
+                      The cache hits and misses are printed at the end.
+cache_dir             Directory where the solved lines are stored, to reuse
+                      them in later executions. Enables the cache.
+engines               Comma-separated algorithms to compare, the ratios are
+                      relative to the first one. Defaults to hsdag,rctree.
+                      Available algorithms: {engines:s}.
+jobs                  Solves the lines of the input file in N parallel processes
+                      with a single algorithm, printing only the line number,
+                      minimal hitting sets, runtime and nodes constructed of
+                      each line, in the order of the file.
+engine                Algorithm used with jobs or stream, one of the available
+                      ones. Defaults to rctree.
+stream                Solves the lines of the input file one at a time with a
+                      single algorithm, printing each minimal hitting set as
+                      soon as it's found, e.g. "3: 1 2" for the set {{1, 2}} of
+                      line 3. Can't be used with jobs, ignores the cache and
+                      the rendering.
+format                Format of the streamed records: lines (default) or json,
+                      one JSON object per line.
+limit                 Stops solving each streamed line after K minimal hitting
+                      sets. Enables streaming.
+stats                 Prints after the streamed solutions of each line their
+                      amount, the solving time, the nodes constructed and the
+                      counters of the algorithm. Enables streaming.
 """
-if len(sys.argv) < 2:
-    print(help_text.format('Illegal amount of arguments'))
+
+
+def exit_with_help(message: str):
+    print(help_text.format(message, engines=', '.join(ENGINES)))
     exit(1)
-for argument in sys.argv[1:]:
-    argument = str(argument).lower().strip().lstrip('-')
-    if argument in ('h', 'help'):
-        print(help_text.format('Minihit'))
-        exit(0)
-    elif argument == 'render':
-        render = True
-    elif argument == 'sort':
-        sort = True
-        prune = False
-    elif argument == 'prune':
-        prune = True
-        sort = False
-    elif argument.startswith('outprefix'):
-        output_files_prefix = argument.split('=', 1)[1]
-compare_from_file(sys.argv[1],
-                  render=render,
-                  output_files_prefix=output_files_prefix,
-                  prune=prune,
-                  sort=sort)
+
+
+if len(sys.argv) < 2:
+    exit_with_help('Illegal amount of arguments')
+if sys.argv[1].strip().lstrip('-').lower() in ('h', 'help'):
+    print(help_text.format('Minihit', engines=', '.join(ENGINES)))
+    exit(0)
+arguments = iter(sys.argv[2:])  # The first one is the input file
+try:
+    for original_argument in arguments:
+        argument = name_of(original_argument)
+        if argument in ('h', 'help'):
+            print(help_text.format('Minihit', engines=', '.join(ENGINES)))
+            exit(0)
+        elif argument == 'render':
+            render = True
+        elif argument == 'sort':
+            sort = True
+            prune = False
+        elif argument == 'prune':
+            prune = True
+            sort = False
+        elif argument == 'nosubsume':
+            subsume = False
+        elif argument == 'kernelize':
+            kernelize = True
+        elif argument == 'cache':
+            use_cache = True
+        elif argument == 'cache_dir':
+            use_cache = True
+            cache_directory = value_of(original_argument, arguments)
+        elif argument == 'outprefix':
+            output_files_prefix = value_of(original_argument, arguments)
+        elif argument == 'max_cardinality':
+            max_cardinality = int_value_of(original_argument, arguments)
+        elif argument == 'jobs':
+            jobs = int_value_of(original_argument, arguments)
+        elif argument == 'stream':
+            stream = True
+        elif argument == 'format':
+            stream = True
+            json_lines = choice_of(original_argument, arguments,
+                                   ('lines', 'json')) == 'json'
+        elif argument == 'limit':
+            stream = True
+            limit = int_value_of(original_argument, arguments)
+        elif argument == 'stats':
+            stream = True
+            print_stats = True
+        elif argument == 'engines':
+            engines = tuple(value_of(original_argument, arguments)
+                            .lower().split(','))
+        elif argument == 'engine':
+            engine = value_of(original_argument, arguments).lower()
+except ValueError as error:
+    exit_with_help(str(error))
+if stream:
+    if jobs is not None:
+        exit_with_help('Streaming can\'t be used with jobs')
+    stream_from_file(sys.argv[1],
+                     engine=engine,
+                     json_lines=json_lines,
+                     limit=limit,
+                     print_stats=print_stats,
+                     prune=prune,
+                     sort=sort,
+                     max_cardinality=max_cardinality,
+                     subsume=subsume,
+                     kernelize=kernelize)
+    exit(0)
+solutions_cache = None
+if use_cache:
+    solutions_cache = SolutionsCache(directory=cache_directory)
+if jobs is None:
+    compare_from_file(sys.argv[1],
+                      render=render,
+                      output_files_prefix=output_files_prefix,
+                      prune=prune,
+                      sort=sort,
+                      max_cardinality=max_cardinality,
+                      engines=engines,
+                      subsume=subsume,
+                      kernelize=kernelize,
+                      solutions_cache=solutions_cache)
+else:
+    for result in solve_from_file(sys.argv[1],
+                                  engine=engine,
+                                  jobs=jobs,
+                                  prune=prune,
+                                  sort=sort,
+                                  max_cardinality=max_cardinality,
+                                  subsume=subsume,
+                                  kernelize=kernelize,
+                                  solutions_cache=solutions_cache):
+        print("Line {:d}: {:} [{:f} s, {:d} nodes, {:d} conflicts removed]"
+              .format(result.line, result.solutions, result.elapsed,
+                      result.nodes_constructed, result.conflicts_removed))
+    if solutions_cache is not None:
+        print("Cache hits: {:d}, misses: {:d}".format(solutions_cache.hits,
+                                                      solutions_cache.misses))
@@ -2,20 +2,48 @@
 # -*- coding: utf-8 -*-
 
 """
-High-level comparator between the HSDAG and RC-Tree algorithms.
+High-level comparator between the minimal hitting sets algorithms, by default
+HSDAG and RC-Tree.
 """
 
-from typing import List
+import collections
+import concurrent.futures
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Generator, List, TextIO, Tuple
 
-from . import getconflicts, hsdag, rctree
+from . import (berge, bitset, cache, components, getconflicts, hsdag, mmcs,
+               rctree, verify)
+
+ENGINES = collections.OrderedDict([
+    ('hsdag', hsdag.HsDag),
+    ('rctree', rctree.RcTree),
+    ('bitset_hsdag', bitset.BitsetHsDag),
+    ('bitset_rctree', bitset.BitsetRcTree),
+    ('mmcs', mmcs.Mmcs),
+    ('berge', berge.Berge),
+    ('components', components.Decomposition),
+])
+
+LineResult = collections.namedtuple(
+    'LineResult', ['line', 'solutions', 'elapsed', 'nodes_constructed',
+                   'conflicts_removed', 'cached'])
+
+_caches_of_process = dict()  # By maximum size and directory
 
 
 def compare_from_file(input_file_name, render: bool = False,
                       output_files_prefix: str = None, prune: bool = True,
-                      sort: bool = False):
+                      sort: bool = False, max_cardinality: int = None,
+                      engines: Tuple[str, ...] = ('hsdag', 'rctree'),
+                      subsume: bool = False, kernelize: bool = False,
+                      solutions_cache: cache.SolutionsCache = None):
     """
-    Executes both HSDAG and RC-Tree on the same set of conflicts read from
-    a file, comparing runtime and memory required.
+    Executes multiple algorithms (by default HSDAG and RC-Tree) on the same
+    set of conflicts read from a file, comparing runtime and memory required.
 
     Args:
         input_file_name: file containing iterables of conflicts (sets of
@@ -30,23 +58,292 @@ def compare_from_file(input_file_name, render: bool = False,
         sort: set to True to sort the conflicts by cardinality before executing
             the algorithms. This deactivates pruning, as it's no longer
             required.
+        max_cardinality: maximum cardinality of the minimal hitting sets to
+            find. Set to None to find all of them.
+        engines: names of the algorithms to compare, keys of `ENGINES`.
+            The ratios are relative to the first one.
+        subsume: set to True to remove the duplicate conflicts and the
+            supersets of other conflicts before solving.
+        kernelize: set to True to reduce the conflicts before solving,
+            removing the forced and dominated elements.
+        solutions_cache: cache of the already found minimal hitting sets,
+            used instead of solving again the same conflicts. None to
+            always solve them.
 
     Returns:
         None. The output is printed to STDOUT in human readable format.
     """
     parser = getconflicts.ConflictSetsFileParser()
-    parser.parse(input_file_name)
-    for line, list_of_conflicts in parser.sets_by_line.items():
+    for line, list_of_conflicts in parser.iter_parse(input_file_name):
         print("------\nLine: {:d}".format(line))
-        compare(list_of_conflicts, render, output_files_prefix, prune, sort)
+        compare(list_of_conflicts, render, output_files_prefix, prune, sort,
+                max_cardinality, engines, subsume, kernelize, solutions_cache)
+    if solutions_cache is not None:
+        print("------\nCache hits: {:d}, misses: {:d}".format(
+            solutions_cache.hits, solutions_cache.misses))
+
+
+def solve_from_file(input_file_name, engine: str = 'rctree',
+                    jobs: int = None, prune: bool = True, sort: bool = False,
+                    max_cardinality: int = None, subsume: bool = False,
+                    kernelize: bool = False,
+                    solutions_cache: cache.SolutionsCache = None,
+                    chunk_size: int = None
+                    ) -> Generator[LineResult, None, None]:
+    """
+    Solves each line of conflicts read from a file independently with the
+    same engine, spreading chunks of lines across a pool of processes.
+
+    The file is parsed lazily and only a few chunks per process are solved
+    ahead of the results provided, so the memory used doesn't grow with
+    the size of the file.
+
+    Args:
+        input_file_name: file containing iterables of conflicts (sets of
+            anything) to find the minimal hitting sets for.
+            The format has to be as specified in the `README.md`.
+        engine: name of the algorithm to use, one of the keys of `ENGINES`.
+        jobs: amount of processes solving the lines in parallel. Set to None
+            to use as many processes as CPUs.
+        prune: set to True to activate the pruning feature of the engine.
+        sort: set to True to sort the conflicts by cardinality before executing
+            the engine.
+        max_cardinality: maximum cardinality of the minimal hitting sets to
+            find. Set to None to find all of them.
+        subsume: set to True to remove the duplicate conflicts and the
+            supersets of other conflicts before solving.
+        kernelize: set to True to reduce the conflicts before solving,
+            removing the forced and dominated elements.
+        solutions_cache: cache of the already found minimal hitting sets,
+            used instead of solving again the same conflicts. None to
+            always solve them.
+        chunk_size: amount of lines sent to a process at once. Set to None
+            to send about a quarter of the lines of the file per process.
+
+    Returns:
+        generator of the `LineResult`s, one per parsed line in the order of
+        the file, each provided as soon as its chunk and the previous ones
+        are solved, with the line number, the list of minimal hitting sets,
+        the elapsed solving time in seconds, the amount of nodes
+        constructed, the amount of redundant conflicts removed and whether
+        the minimal hitting sets were cached. The worker processes share
+        only the on-disk tier of the cache, but its hits and misses are
+        counted.
+    """
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine '{:}', choose one of: {:}.".format(
+            engine, ', '.join(ENGINES)))
+    if jobs is not None and jobs < 1:
+        raise ValueError("The amount of jobs must be positive.")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+    workers = jobs or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, _amount_of_lines(input_file_name)
+                         // (4 * workers))
+    if solutions_cache is None:
+        cache_settings = None
+    else:
+        cache_settings = (solutions_cache.max_size, solutions_cache.directory)
+    solve_options = (engine, prune, sort, max_cardinality, subsume,
+                     kernelize, cache_settings)
+    return _solved_lines(input_file_name, workers, chunk_size, solve_options,
+                         solutions_cache)
+
+
+def _amount_of_lines(input_file_name) -> int:
+    """Counts the lines of the file without parsing them."""
+    amount = 1
+    with open(input_file_name, 'rb') as input_file:
+        for block in iter(lambda: input_file.read(1 << 20), b''):
+            amount += block.count(b'\n')
+    return amount
+
+
+def _solved_lines(input_file_name, workers: int, chunk_size: int,
+                  solve_options: tuple,
+                  solutions_cache: cache.SolutionsCache
+                  ) -> Generator[LineResult, None, None]:
+    """Generator of the results of `solve_from_file()` once its arguments
+    are checked."""
+    parsed_lines = getconflicts.ConflictSetsFileParser().iter_parse(
+        input_file_name)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # At most two chunks per worker are solved ahead, to bound the
+        # memory used by the results not provided yet
+        futures = collections.deque()
+        try:
+            while True:
+                chunk = list(itertools.islice(parsed_lines, chunk_size))
+                if chunk:
+                    futures.append(executor.submit(_solve_chunk, chunk,
+                                                   solve_options))
+                if futures and (not chunk or len(futures) >= 2 * workers):
+                    for result in futures.popleft().result():
+                        if solutions_cache is not None:
+                            if result.cached:
+                                solutions_cache.hits += 1
+                            else:
+                                solutions_cache.misses += 1
+                        yield result
+                elif not chunk:
+                    return
+        finally:
+            for future in futures:  # Not waited for if stopped early
+                future.cancel()
+
+
+def stream_from_file(input_file_name, engine: str = 'rctree',
+                     output: TextIO = None, json_lines: bool = False,
+                     limit: int = None, print_stats: bool = False,
+                     prune: bool = True, sort: bool = False,
+                     max_cardinality: int = None, subsume: bool = False,
+                     kernelize: bool = False) -> int:
+    """
+    Solves each line of conflicts read from a file with the same engine,
+    writing each minimal hitting set as soon as it's found, one per line.
+
+    The lines are parsed lazily and nothing is formatted but the records,
+    so memory and time are spent on solving rather than on reporting.
+
+    Args:
+        input_file_name: file containing iterables of conflicts (sets of
+            anything) to find the minimal hitting sets for.
+            The format has to be as specified in the `README.md`.
+        engine: name of the algorithm to use, one of the keys of `ENGINES`.
+        output: text stream to write the records to. None for STDOUT.
+        json_lines: set to True to write each record as a JSON object,
+            `{"line": 3, "solution": [1, 2]}`, instead of a plain line
+            `3: 1 2`.
+        limit: maximum amount of minimal hitting sets to find for each
+            line, stopping the engine as soon as it's reached. Set to None
+            to find all of them.
+        print_stats: set to True to write after the solutions of each line
+            a record with the amount of solutions, the solving time in
+            seconds, the nodes constructed, the redundant conflicts removed
+            and the counters of the engine, if it collects any. Plain
+            records start with `#`.
+        prune: set to True to activate the pruning feature of the engine.
+        sort: set to True to sort the conflicts by cardinality before executing
+            the engine.
+        max_cardinality: maximum cardinality of the minimal hitting sets to
+            find. Set to None to find all of them.
+        subsume: set to True to remove the duplicate conflicts and the
+            supersets of other conflicts before solving.
+        kernelize: set to True to reduce the conflicts before solving,
+            removing the forced and dominated elements.
+
+    Returns:
+        int: amount of minimal hitting sets written, of all lines.
+    """
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine '{:}', choose one of: {:}.".format(
+            engine, ', '.join(ENGINES)))
+    if limit is not None and limit < 1:
+        raise ValueError("The limit of solutions must be positive.")
+    if output is None:
+        output = sys.stdout
+    parser = getconflicts.ConflictSetsFileParser()
+    total_amount = 0
+    for line, list_of_conflicts in parser.iter_parse(input_file_name):
+        problem = ENGINES[engine](list_of_conflicts)
+        solutions = problem.iter_solve(prune=prune, sort=sort,
+                                       max_cardinality=max_cardinality,
+                                       subsume=subsume, kernelize=kernelize)
+        amount = 0
+        elapsed = 0.0
+        while limit is None or amount < limit:
+            start_time = time.perf_counter()
+            solution = next(solutions, None)
+            elapsed += time.perf_counter() - start_time
+            if solution is None:
+                break
+            amount += 1
+            output.write(_solution_record(line, solution, json_lines))
+            output.flush()  # Shown as soon as found, even if redirected
+        solutions.close()  # Stops the engine if the limit was reached
+        total_amount += amount
+        if print_stats:
+            output.write(_stats_record(line, problem, amount, elapsed,
+                                       json_lines))
+            output.flush()
+    return total_amount
+
+
+def _sorted_elements(solution) -> list:
+    try:
+        return sorted(solution)
+    except TypeError:  # Elements not comparable with each other
+        return list(solution)
+
+
+def _solution_record(line: int, solution, json_lines: bool) -> str:
+    elements = _sorted_elements(solution)
+    if json_lines:
+        return json.dumps({'line': line, 'solution': elements}) + '\n'
+    return '{:d}: {:s}\n'.format(line, ' '.join(map(str, elements)))
+
+
+def _stats_record(line: int, problem, amount: int, elapsed: float,
+                  json_lines: bool) -> str:
+    record = collections.OrderedDict([
+        ('line', line),
+        ('solutions', amount),
+        ('elapsed', elapsed),
+        ('nodes_constructed', problem.amount_of_nodes_constructed),
+        ('conflicts_removed', problem.amount_of_conflicts_removed)])
+    stats = getattr(problem, 'stats', None)
+    if json_lines:
+        if stats is not None:
+            record['stats'] = stats.as_dict()
+        return json.dumps(record) + '\n'
+    if stats is not None:
+        record.update((name, value) for name, value in stats.as_dict().items()
+                      if name != 'phase_times')
+    return '# {:s}\n'.format(' '.join(
+        ('{:s}={:f}' if isinstance(value, float) else '{:s}={:}').format(
+            name, value) for name, value in record.items()))
+
+
+def _solve_chunk(chunk: List[Tuple[int, List[set]]],
+                 solve_options: tuple) -> List[LineResult]:
+    return [_solve_line(line, list_of_conflicts, *solve_options)
+            for line, list_of_conflicts in chunk]
+
+
+def _solve_line(line: int, list_of_conflicts: List[set], engine: str,
+                prune: bool, sort: bool, max_cardinality: int,
+                subsume: bool, kernelize: bool,
+                cache_settings: tuple) -> LineResult:
+    if cache_settings is None:
+        problem = ENGINES[engine](list_of_conflicts)
+    else:
+        if cache_settings not in _caches_of_process:
+            _caches_of_process[cache_settings] = \
+                cache.SolutionsCache(*cache_settings)
+        problem = cache.CachedProblem(list_of_conflicts, ENGINES[engine],
+                                      _caches_of_process[cache_settings])
+    elapsed = problem.solve(prune=prune, sort=sort,
+                            max_cardinality=max_cardinality, subsume=subsume,
+                            kernelize=kernelize)
+    return LineResult(line,
+                      [set(solution) for solution
+                       in problem.generate_minimal_hitting_sets()],
+                      elapsed,
+                      problem.amount_of_nodes_constructed,
+                      problem.amount_of_conflicts_removed,
+                      cache_settings is not None and problem.was_cached)
 
 
 def compare(list_of_conflicts: List[set], render: bool = False,
             output_files_prefix: str = None, prune: bool = True,
-            sort: bool = False):
+            sort: bool = False, max_cardinality: int = None,
+            engines: Tuple[str, ...] = ('hsdag', 'rctree'),
+            subsume: bool = False, kernelize: bool = False,
+            solutions_cache: cache.SolutionsCache = None):
     """
-    Executes both HSDAG and RC-Tree on the same set of conflicts,
-    comparing runtime and memory required.
+    Executes multiple algorithms (by default HSDAG and RC-Tree) on the same
+    set of conflicts, comparing runtime and memory required.
 
     Args:
         list_of_conflicts: iterable of conflicts (sets of anything) to find
@@ -60,59 +357,94 @@ def compare(list_of_conflicts: List[set], render: bool = False,
         sort: set to True to sort the conflicts by cardinality before executing
             the algorithms. This deactivates pruning, as it's no longer
             required.
+        max_cardinality: maximum cardinality of the minimal hitting sets to
+            find. Set to None to find all of them.
+        engines: names of the algorithms to compare, keys of `ENGINES`.
+            The ratios are relative to the first one.
+        subsume: set to True to remove the duplicate conflicts and the
+            supersets of other conflicts before solving.
+        kernelize: set to True to reduce the conflicts before solving,
+            removing the forced and dominated elements.
+        solutions_cache: cache of the already found minimal hitting sets,
+            used instead of solving again the same conflicts. None to
+            always solve them.
 
     Returns:
         None. The output is printed to STDOUT in human readable format.
     """
-    hs_dag = hsdag.HsDag(list_of_conflicts)
-    elapsed_hsdag = hs_dag.solve(prune=prune, sort=sort)
-    solution_hsdag = list(hs_dag.generate_minimal_hitting_sets())
-    frozen_solution_hsdag = set(map(frozenset, solution_hsdag))
-    hs_dag_solution_is_correct = hs_dag.verify()
-    rc_tree = rctree.RcTree(list_of_conflicts)
-    elapsed_rctree = rc_tree.solve(prune=prune, sort=sort)
-    solution_rctree = list(rc_tree.generate_minimal_hitting_sets())
-    frozen_solution_rctree = set(map(frozenset, solution_rctree))
-    rc_tree_solution_is_correct = rc_tree.verify()
-    report = \
-        "Conflict sets: {:}\n" \
-        "HSDAG solution:   {:}\n" \
-        "RC-Tree solution: {:}\n" \
-        "Algorithm produce same result: {:}\n" \
-        "HSDAG solution is correct:     {:}\n" \
-        "RC-Tree solution is correct:   {:}\n" \
-        "HSDAG runtime [s]:   {:f}\n" \
-        "RC-Tree runtime [s]: {:f}\n" \
-        "HSDAG/RC-Tree runtime [%]: {:7.3f}\n" \
-        "HSDAG nodes constructed:   {:d}\n" \
-        "RC-Tree nodes constructed: {:d}\n" \
-        "RC-Tree/HSDAG constructions [%]: {:7.3f}\n" \
-        "HSDAG nodes:   {:d}\n" \
-        "RC-Tree nodes: {:d}\n" \
-        "RC-Tree/HSDAG nodes [%]: {:7.3f}".format(
-            list_of_conflicts,
-            solution_hsdag,
-            solution_rctree,
-            frozen_solution_hsdag == frozen_solution_rctree,
-            hs_dag_solution_is_correct,
-            rc_tree_solution_is_correct,
-            elapsed_hsdag,
-            elapsed_rctree,
-            elapsed_hsdag / elapsed_rctree * 100,
-            hs_dag.amount_of_nodes_constructed,
-            rc_tree.amount_of_nodes_constructed,
-            rc_tree.amount_of_nodes_constructed /
-            hs_dag.amount_of_nodes_constructed * 100,
-            len(list(hs_dag.breadth_first_explore(hs_dag.root))),
-            len(list(rc_tree.breadth_first_explore(rc_tree.root))),
-            len(list(rc_tree.breadth_first_explore(rc_tree.root)))
-            / len(list(hs_dag.breadth_first_explore(hs_dag.root))) * 100,
-        )
-    print(report)
-    if render:
-        if output_files_prefix:
-            hs_dag.render(output_files_prefix + '_hsdag')
-            rc_tree.render(output_files_prefix + '_rctree')
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(
+                "Unknown engine '{:}', choose one of: {:}.".format(
+                    engine, ', '.join(ENGINES)))
+    problems = []
+    elapsed = []
+    solutions = []
+    for engine in engines:
+        if solutions_cache is None:
+            problem = ENGINES[engine](list_of_conflicts)
         else:
-            hs_dag.render()
-            rc_tree.render()
+            problem = cache.CachedProblem(list_of_conflicts, ENGINES[engine],
+                                          solutions_cache)
+        elapsed.append(problem.solve(prune=prune, sort=sort,
+                                     max_cardinality=max_cardinality,
+                                     subsume=subsume,
+                                     kernelize=kernelize))
+        problems.append(problem)
+        solutions.append(list(problem.generate_minimal_hitting_sets()))
+    frozen_solutions = [set(map(frozenset, solution))
+                        for solution in solutions]
+    nodes_in_graph = [len(list(problem.breadth_first_explore(problem.root)))
+                      if isinstance(problem, hsdag.HsDag) else None
+                      for problem in problems]
+    rows = [("Conflict sets", list_of_conflicts)]
+    if subsume:
+        rows.append(("Redundant conflicts removed",
+                     problems[0].amount_of_conflicts_removed))
+    rows += [("{:s} solution".format(engine), solution)
+             for engine, solution in zip(engines, solutions)]
+    rows.append(("Algorithms produce same result",
+                 all(frozen_solution == frozen_solutions[0]
+                     for frozen_solution in frozen_solutions)))
+    verifier = verify.FamilyVerifier(list_of_conflicts)
+    rows += [("{:s} solution is correct".format(engine),
+              verifier.is_valid(solution))
+             for engine, solution in zip(engines, solutions)]
+    if solutions_cache is not None:
+        rows += [("{:s} solution was cached".format(engine),
+                  problem.was_cached)
+                 for engine, problem in zip(engines, problems)]
+    rows += [("{:s} runtime [s]".format(engine), "{:f}".format(runtime))
+             for engine, runtime in zip(engines, elapsed)]
+    rows += [("{:s}/{:s} runtime [%]".format(engine, engines[0]),
+              _percentage(runtime, elapsed[0]))
+             for engine, runtime in zip(engines[1:], elapsed[1:])]
+    rows += [("{:s} nodes constructed".format(engine),
+              problem.amount_of_nodes_constructed)
+             for engine, problem in zip(engines, problems)]
+    rows += [("{:s}/{:s} constructions [%]".format(engine, engines[0]),
+              _percentage(problem.amount_of_nodes_constructed,
+                          problems[0].amount_of_nodes_constructed))
+             for engine, problem in zip(engines[1:], problems[1:])]
+    rows += [("{:s} nodes".format(engine), nodes)
+             for engine, nodes in zip(engines, nodes_in_graph)
+             if nodes is not None]
+    rows += [("{:s}/{:s} nodes [%]".format(engine, engines[0]),
+              _percentage(nodes, nodes_in_graph[0]))
+             for engine, nodes in zip(engines[1:], nodes_in_graph[1:])
+             if nodes is not None and nodes_in_graph[0] is not None]
+    width = max(len(title) for title, _ in rows) + 2
+    print('\n'.join((title + ':').ljust(width) + str(value)
+                    for title, value in rows))
+    if render:
+        for engine, problem in zip(engines, problems):
+            if output_files_prefix:
+                problem.render(output_files_prefix + '_' + engine)
+            else:
+                problem.render()
+
+
+def _percentage(value, reference) -> str:
+    if reference == 0:
+        return "    n/a"  # E.g. nothing constructed for cached solutions
+    return "{:7.3f}".format(value / reference * 100)
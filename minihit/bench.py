@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Benchmark suite of the minimal hitting sets algorithms: times repeated runs
+of a matrix of engines and options on seeded workloads, writing the results
+as JSON or CSV, and finds the regressions between two results files.
+
+Usage:
+
+python -m minihit.bench run [--engines=ENGINE,ENGINE...] [--repeats=N]
+[--warmup=N] [--format=json|csv] [--output=FILE]
+
+python -m minihit.bench compare BASELINE_FILE CURRENT_FILE [--threshold=R]
+[--min_difference=SECONDS]
+
+The options taking a value accept both --option=VALUE and --option VALUE.
+The compare command exits with status 1 if any regression is found.
+"""
+
+import collections
+import csv
+import io
+import json
+import statistics
+import sys
+import time
+from typing import Iterable, List, Tuple
+
+from . import algcompare, getconflicts
+from .cli import (choice_of, float_value_of, int_value_of, name_of,
+                  value_of)
+
+WORKLOAD_FAMILIES = collections.OrderedDict([
+    ('random', getconflicts.random_conflicts),
+    ('linear', getconflicts.linear_conflicts),
+])
+
+# Family and parameters of the workloads run by default
+DEFAULT_WORKLOADS = (
+    ('random', dict(amount_conflicts=10, max_cardinality=6, seed=1)),
+    ('random', dict(amount_conflicts=30, max_cardinality=10, seed=3)),
+    ('random', dict(amount_conflicts=40, max_cardinality=14, seed=4)),
+    ('linear', dict(amount_conflicts=8, cardinality=3, overlap=1)),
+    ('linear', dict(amount_conflicts=7, cardinality=4, overlap=2)),
+    # Hundreds of minimal hitting sets, so many ticked paths to close the
+    # nodes against: where the bitset engines are faster
+    ('linear', dict(amount_conflicts=10, cardinality=3, overlap=1)),
+)
+
+# Pairs of the prune and sort options of the solvers
+DEFAULT_OPTIONS = ((False, False), (True, False), (False, True), (True, True))
+
+Workload = collections.namedtuple(
+    'Workload', ['name', 'family', 'parameters', 'list_of_conflicts'])
+
+BenchResult = collections.namedtuple(
+    'BenchResult', ['workload', 'engine', 'prune', 'sort', 'repeats', 'min',
+                    'median', 'mean', 'stdev', 'nodes_constructed',
+                    'solutions'])
+
+Regression = collections.namedtuple(
+    'Regression', ['workload', 'engine', 'prune', 'sort', 'quantity',
+                   'baseline', 'current'])
+
+_FIELD_TYPES = dict(workload=str, engine=str,
+                    prune=lambda value: value in (True, 'True'),
+                    sort=lambda value: value in (True, 'True'),
+                    repeats=int, min=float, median=float, mean=float,
+                    stdev=float, nodes_constructed=int, solutions=int)
+
+
+def make_workload(family: str, **parameters) -> Workload:
+    """
+    Generates the conflicts of a workload.
+
+    Args:
+        family: name of the workload family, one of `WORKLOAD_FAMILIES`.
+        **parameters: arguments of the generator of the family. Random
+            workloads should have a seed, so they are the same every time.
+
+    Returns:
+        the workload, named after its family and parameters.
+    """
+    if family not in WORKLOAD_FAMILIES:
+        raise ValueError("Unknown workload family '{:}', choose one of: "
+                         "{:}.".format(family, ', '.join(WORKLOAD_FAMILIES)))
+    name = '{:s}({:s})'.format(family, ', '.join(
+        '{:s}={:}'.format(key, value) for key, value in parameters.items()))
+    return Workload(name, family, parameters,
+                    list(WORKLOAD_FAMILIES[family](**parameters)))
+
+
+def run(workloads: Iterable[Workload],
+        engines: Tuple[str, ...] = tuple(algcompare.ENGINES),
+        options: Iterable[Tuple[bool, bool]] = DEFAULT_OPTIONS,
+        repeats: int = 5, warmup: int = 1) -> List[BenchResult]:
+    """
+    Solves every workload with every engine and pair of options, timing
+    repeated runs with `time.perf_counter()`.
+
+    Args:
+        workloads: the workloads to solve.
+        engines: names of the algorithms to run, keys of
+            `algcompare.ENGINES`.
+        options: pairs of the `prune` and `sort` arguments of `solve()`.
+        repeats: amount of timed runs of each combination.
+        warmup: amount of untimed runs of each combination before the timed
+            ones.
+
+    Returns:
+        list of `BenchResult`s, one per combination, with the statistics of
+        the timed runs in seconds, the amount of nodes constructed and the
+        amount of minimal hitting sets found.
+    """
+    _check_run_arguments(engines, repeats, warmup)
+    options = list(options)
+    results = []
+    for workload in workloads:
+        for engine in engines:
+            for prune, sort in options:
+                problem = algcompare.ENGINES[engine](
+                    workload.list_of_conflicts)
+                times = []
+                for run_index in range(warmup + repeats):
+                    start_time = time.perf_counter()
+                    problem.solve(prune=prune, sort=sort)
+                    elapsed = time.perf_counter() - start_time
+                    if run_index >= warmup:
+                        times.append(elapsed)
+                results.append(BenchResult(
+                    workload.name, engine, prune, sort, repeats, min(times),
+                    statistics.median(times), statistics.mean(times),
+                    statistics.stdev(times) if repeats > 1 else 0.0,
+                    problem.amount_of_nodes_constructed,
+                    sum(1 for _ in problem.generate_minimal_hitting_sets())))
+    return results
+
+
+def _check_run_arguments(engines: Tuple[str, ...], repeats: int,
+                         warmup: int):
+    for engine in engines:
+        if engine not in algcompare.ENGINES:
+            raise ValueError("Unknown engine '{:}', choose one of: {:}."
+                             .format(engine, ', '.join(algcompare.ENGINES)))
+    if repeats < 1:
+        raise ValueError("The amount of repeats must be positive.")
+    if warmup < 0:
+        raise ValueError("The amount of warmup runs must be non-negative.")
+
+
+def write_results(results: Iterable[BenchResult], output_file,
+                  output_format: str = 'json'):
+    """
+    Writes the results of a benchmark to a text file.
+
+    Args:
+        results: the results to write.
+        output_file: text file object to write into.
+        output_format: 'json' for a list of objects, 'csv' for a header row
+            followed by one row per result.
+    """
+    if output_format == 'json':
+        json.dump([result._asdict() for result in results], output_file,
+                  indent=2)
+        output_file.write('\n')
+    elif output_format == 'csv':
+        writer = csv.writer(output_file, lineterminator='\n')
+        writer.writerow(BenchResult._fields)
+        writer.writerows(results)
+    else:
+        raise ValueError("Unknown output format '{:}', choose one of: "
+                         "json, csv.".format(output_format))
+
+
+def read_results(input_file) -> List[BenchResult]:
+    """
+    Reads the results of a benchmark written by `write_results()`, in
+    either format.
+
+    Args:
+        input_file: text file object to read from.
+
+    Returns:
+        list of `BenchResult`s in the order of the file.
+    """
+    content = input_file.read()
+    if content.lstrip().startswith('['):
+        rows = json.loads(content)
+    else:
+        rows = list(csv.DictReader(io.StringIO(content)))
+    return [BenchResult(**{field: _FIELD_TYPES[field](row[field])
+                           for field in BenchResult._fields})
+            for row in rows]
+
+
+def find_regressions(baseline: Iterable[BenchResult],
+                     current: Iterable[BenchResult],
+                     threshold: float = 0.2,
+                     min_difference: float = 0.001) -> List[Regression]:
+    """
+    Compares the results of two benchmarks of the same combinations.
+
+    Args:
+        baseline: the reference results.
+        current: the results to check.
+        threshold: relative increase of the median runtime considered a
+            regression, e.g. 0.1 for 10% slower.
+        min_difference: absolute increase of the median runtime in seconds
+            below which it's considered noise.
+
+    Returns:
+        list of `Regression`s in the order of the current results: the
+        median runtimes increased beyond both limits and any increase of the
+        nodes constructed, which doesn't depend on the machine. The
+        combinations missing in the baseline are ignored.
+    """
+    baseline_by_key = {_key_of(result): result for result in baseline}
+    regressions = []
+    for result in current:
+        reference = baseline_by_key.get(_key_of(result))
+        if reference is None:
+            continue
+        if (result.median > reference.median * (1 + threshold)
+                and result.median - reference.median > min_difference):
+            regressions.append(Regression(*_key_of(result), 'median [s]',
+                                          reference.median, result.median))
+        if result.nodes_constructed > reference.nodes_constructed:
+            regressions.append(Regression(*_key_of(result),
+                                          'nodes constructed',
+                                          reference.nodes_constructed,
+                                          result.nodes_constructed))
+    return regressions
+
+
+def _key_of(result: BenchResult) -> tuple:
+    return result.workload, result.engine, result.prune, result.sort
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Executes a command of the benchmark suite, as described in the
+    docstring of the module.
+
+    Args:
+        arguments: the command line arguments, without the program name.
+
+    Returns:
+        exit status of the program.
+    """
+    if not arguments or arguments[0].lower() not in ('run', 'compare'):
+        print(__doc__)
+        return 0 if arguments and arguments[0].lstrip('-') in ('h', 'help') \
+            else 1
+    command = arguments[0].lower()
+    file_names = []
+    engines = tuple(algcompare.ENGINES)
+    repeats = 5
+    warmup = 1
+    output_format = 'json'
+    output_file_name = None
+    threshold = 0.2
+    min_difference = 0.001
+    remaining_arguments = iter(arguments[1:])
+    try:
+        for argument in remaining_arguments:
+            if not argument.startswith('-'):
+                file_names.append(argument)
+                continue
+            name = name_of(argument)
+            if name == 'engines':
+                engines = tuple(value_of(argument, remaining_arguments)
+                                .lower().split(','))
+            elif name == 'repeats':
+                repeats = int_value_of(argument, remaining_arguments)
+            elif name == 'warmup':
+                warmup = int_value_of(argument, remaining_arguments)
+            elif name == 'format':
+                output_format = choice_of(argument, remaining_arguments,
+                                          ('json', 'csv'))
+            elif name == 'output':
+                output_file_name = value_of(argument, remaining_arguments)
+            elif name == 'threshold':
+                threshold = float_value_of(argument, remaining_arguments)
+            elif name == 'min_difference':
+                min_difference = float_value_of(argument,
+                                                remaining_arguments)
+        if command == 'run':
+            _check_run_arguments(engines, repeats, warmup)
+    except ValueError as error:
+        print(__doc__)
+        print(error)
+        return 1
+    if command == 'run':
+        workloads = [make_workload(family, **parameters)
+                     for family, parameters in DEFAULT_WORKLOADS]
+        results = run(workloads, engines, repeats=repeats, warmup=warmup)
+        if output_file_name is None:
+            write_results(results, sys.stdout, output_format)
+        else:
+            with open(output_file_name, 'w', newline='') as output_file:
+                write_results(results, output_file, output_format)
+        return 0
+    if len(file_names) != 2:
+        print("The compare command requires the baseline and current "
+              "results files.")
+        return 2
+    with open(file_names[0]) as baseline_file:
+        baseline = read_results(baseline_file)
+    with open(file_names[1]) as current_file:
+        current = read_results(current_file)
+    regressions = find_regressions(baseline, current, threshold,
+                                   min_difference)
+    for regression in regressions:
+        print("REGRESSION {:s} {:s} prune={:} sort={:} {:s}: {:} -> {:}"
+              .format(*regression))
+    print("{:d} regressions in {:d} results".format(len(regressions),
+                                                   len(current)))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import time
+from typing import Generator
+
+from . import mhs
+from . import settrie
+
+
+class Berge(mhs.MinimalHittingSetsProblem):
+    """
+    Minimal hitting sets solver based on Berge's algorithm, processing the
+    conflicts one at a time while keeping the family of the minimal hitting
+    sets of the conflicts processed so far.
+
+    For each new conflict, the minimal hitting sets already hitting it are
+    kept, while each of the other ones is extended with every element of the
+    conflict. An extension is minimal unless one of the kept sets is a
+    subset of it, so only those are checked, with a set-trie.
+    """
+
+    def __init__(self, list_of_conflicts=None):
+        super().__init__(list_of_conflicts)
+        self._solutions = []
+        self._max_cardinality = None
+        self._solve_options = None
+
+    def generate_minimal_hitting_sets(self):
+        yield from self._lifted(self._kernel_solutions())
+
+    def _kernel_solutions(self):
+        return iter(self._solutions)
+
+    def render(self, out_file=None):
+        """Berge's algorithm constructs no graph, so there is nothing to
+        render."""
+        pass
+
+    def solve(self, prune=True, sort=False, vectorize=False,
+              max_cardinality=None, subsume=False, kernelize=False):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts.
+
+        Args:
+            prune (bool): unused, as the family is kept minimal after each
+                conflict. Accepted for compatibility with `HsDag.solve()`.
+            sort (bool): sorts the list of conflicts by cardinality of the
+                conflicts before executing the solving algorithm. Smaller
+                conflicts first usually keep the intermediate families
+                smaller.
+            vectorize (bool): unused, as the family is updated one conflict
+                at a time. Accepted for compatibility with `HsDag.solve()`.
+            max_cardinality (int): maximum cardinality of the minimal
+                hitting sets to find. Larger sets are discarded from the
+                intermediate families, as their extensions would be larger
+                too. None to find all of them.
+            subsume (bool): same as in `HsDag.solve()`. The conflicts added
+                afterwards with `add_conflict()` are never removed.
+            kernelize (bool): same as in `HsDag.solve()`. Adding a conflict
+                with `add_conflict()` then solves again from scratch.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        self.reset()
+        if max_cardinality is not None and max_cardinality < 0:
+            raise ValueError("The maximum cardinality must be non-negative.")
+        self._max_cardinality = max_cardinality
+        self._solve_options = dict(prune=prune, sort=sort,
+                                   vectorize=vectorize,
+                                   max_cardinality=max_cardinality,
+                                   subsume=subsume, kernelize=kernelize)
+        if self.list_of_conflicts:
+            self._clone_list_of_conflicts(sort, subsume, kernelize)
+            self._solutions = [mhs.SolutionSet()]
+            for conflict in self._working_list_of_conflicts:
+                self._update_with(conflict)
+            self._working_list_of_conflicts = None  # To reduce used memory
+        return time.time() - start_time
+
+    def add_conflict(self, conflict):
+        """
+        Appends a conflict to the list of conflicts and updates the already
+        computed minimal hitting sets with it, without solving again from
+        scratch.
+
+        If nothing was solved yet, the conflict is just appended. If the
+        conflicts were kernelized, it's solved again from scratch with the
+        same options.
+
+        Args:
+            conflict (set): the conflict to add. The list of conflicts
+                passed to the constructor is not modified.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        if isinstance(self.list_of_conflicts, Generator):
+            self.list_of_conflicts = list(self.list_of_conflicts)
+        self.list_of_conflicts = list(self.list_of_conflicts or [])
+        self.list_of_conflicts.append(conflict)
+        if self._solve_options is None:
+            pass
+        elif len(self.list_of_conflicts) == 1 or self._kernel is not None:
+            self.solve(**self._solve_options)
+        else:
+            self._update_with(conflict)
+        return time.time() - start_time
+
+    def reset(self):
+        self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._kernel = None
+        self._working_list_of_conflicts = None
+        self._solutions = []
+        self._max_cardinality = None
+        self._solve_options = None
+
+    def _update_with(self, conflict):
+        hitting = []
+        not_hitting = []
+        for solution in self._solutions:
+            if solution.isdisjoint(conflict):
+                not_hitting.append(solution)
+            else:
+                hitting.append(solution)
+        minimal_ones = settrie.SetTrie(hitting)
+        updated_solutions = hitting
+        for solution in not_hitting:
+            if (self._max_cardinality is not None
+                    and len(solution) >= self._max_cardinality):
+                continue
+            for element in conflict:
+                candidate = mhs.SolutionSet(solution)
+                candidate.add(element)
+                self.amount_of_nodes_constructed += 1
+                if not minimal_ones.has_subset_of(candidate):
+                    updated_solutions.append(candidate)
+        self._solutions = updated_solutions
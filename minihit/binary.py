@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Compact binary container of many families of sets of integers, like the
+lists of conflicts of many problems or their minimal hitting sets, in a
+compressed sparse row (CSR) layout:
+
+- header: magic bytes, version, amount of families, of sets and of elements
+- family offsets: amount of families + 1 indexes of the first set of each
+  family in the set offsets, the last one being the amount of sets
+- set offsets: amount of sets + 1 indexes of the first element of each set
+  in the elements, the last one being the amount of elements
+- elements: the elements of all sets, each set sorted
+
+All the values are little-endian signed 64 bit integers, so the arrays are
+read without copying them through a memory map.
+"""
+
+import array
+import mmap
+import struct
+import sys
+from typing import Generator, Iterable, List
+
+_MAGIC = b'MHCS'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHQQQ')
+_TYPECODE = 'q'
+_ITEM_SIZE = 8
+
+
+def write_families(output_file_name: str,
+                   families: Iterable[Iterable[Iterable[int]]]) -> int:
+    """
+    Writes the families of sets of integers into a binary file.
+
+    Args:
+        output_file_name: path of the file to write, overwritten if
+            existing.
+        families: the families to write, e.g. lists of conflicts or the
+            generators of the minimal hitting sets of solved problems.
+
+    Returns:
+        int: amount of families written.
+    """
+    family_offsets = array.array(_TYPECODE, [0])
+    set_offsets = array.array(_TYPECODE, [0])
+    elements = array.array(_TYPECODE)
+    for family in families:
+        for set_of_elements in family:
+            try:
+                elements.extend(sorted(set_of_elements))
+            except (TypeError, OverflowError):
+                raise ValueError("Only sets of 64 bit integers can be "
+                                 "written, found: {:}.".format(
+                                     set_of_elements))
+            set_offsets.append(len(elements))
+        family_offsets.append(len(set_offsets) - 1)
+    arrays = (family_offsets, set_offsets, elements)
+    if sys.byteorder == 'big':
+        for values in arrays:
+            values.byteswap()
+    with open(output_file_name, 'wb') as output_file:
+        output_file.write(_HEADER.pack(_MAGIC, _VERSION, 0,
+                                       len(family_offsets) - 1,
+                                       len(set_offsets) - 1, len(elements)))
+        for values in arrays:
+            values.tofile(output_file)
+    return len(family_offsets) - 1
+
+
+class FamiliesReader(object):
+    """
+    Reader of a binary file written by `write_families()`, providing each
+    family as a list of sets, ready to be solved.
+
+    The file is memory mapped and the offsets and the elements are
+    memoryviews of it, so opening it reads only the header and each family
+    reads only its own elements.
+    """
+
+    def __init__(self, input_file_name: str):
+        """
+        Opens the binary file.
+
+        Args:
+            input_file_name: path of the file to read.
+        """
+        self.input_file_name = input_file_name
+        self._views = []
+        self._mapped_file = None
+        with open(input_file_name, 'rb') as input_file:
+            try:
+                self._mapped_file = mmap.mmap(input_file.fileno(), 0,
+                                              access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                self._raise_invalid()
+        if len(self._mapped_file) < _HEADER.size:
+            self._raise_invalid()
+        magic, version, _, amount_of_families, amount_of_sets, \
+            amount_of_elements = _HEADER.unpack_from(self._mapped_file)
+        if magic != _MAGIC or version != _VERSION:
+            self._raise_invalid()
+        lengths = (amount_of_families + 1, amount_of_sets + 1,
+                   amount_of_elements)
+        if len(self._mapped_file) != _HEADER.size + sum(lengths) * _ITEM_SIZE:
+            self._raise_invalid()
+        start = _HEADER.size
+        for length in lengths:
+            end = start + length * _ITEM_SIZE
+            self._views.append(self._array_at(start, end))
+            start = end
+        self.family_offsets, self.set_offsets, self.elements = self._views
+
+    def _array_at(self, start: int, end: int):
+        view = memoryview(self._mapped_file)[start:end]
+        if sys.byteorder == 'little':
+            return view.cast(_TYPECODE)
+        values = array.array(_TYPECODE, view.tobytes())  # Copied
+        view.release()
+        values.byteswap()
+        return values
+
+    def _raise_invalid(self):
+        self.close()
+        raise ValueError("'{:}' is not a binary families file of version "
+                         "{:d}.".format(self.input_file_name, _VERSION))
+
+    def __len__(self):
+        return len(self.family_offsets) - 1
+
+    def __getitem__(self, index: int) -> List[set]:
+        return [set(view) for view in self.views(index)]
+
+    def __iter__(self) -> Generator[List[set], None, None]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def views(self, index: int) -> List[memoryview]:
+        """
+        Provides the sets of a family without copying them.
+
+        Args:
+            index: index of the family, negative to count from the last.
+
+        Returns:
+            List[memoryview]: the sorted elements of each set of the
+                family, valid until the reader is closed.
+        """
+        index = range(len(self))[index]  # Raises IndexError if invalid
+        return [self.elements[self.set_offsets[set_index]:
+                              self.set_offsets[set_index + 1]]
+                for set_index in range(self.family_offsets[index],
+                                       self.family_offsets[index + 1])]
+
+    def close(self):
+        """Releases the memoryviews and unmaps the file."""
+        for view in self._views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._views = []
+        if self._mapped_file is not None:
+            try:
+                self._mapped_file.close()
+            except BufferError:
+                pass  # Views still in use: unmapped once they are released
+            self._mapped_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Variants of the HSDAG and RC-Tree algorithms where every set of elements
+(conflicts, paths, labels and thetas) is an integer bitmask, with one bit
+for each distinct element in the list of conflicts.
+"""
+
+from typing import Generator, List
+
+from . import hsdag, mhs, rctree
+
+
+def bit_positions(mask: int) -> Generator[int, None, None]:
+    """
+    Generator of the positions of the bits set in a bitmask, from the
+    least significant one.
+
+    Args:
+        mask: the bitmask to scan.
+
+    Returns:
+        Generator[int, None, None]: the positions of the set bits.
+    """
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+class BitmaskFamily(object):
+    """
+    Collection of sets encoded as bitmasks, providing the same queries as
+    `settrie.SetTrie`.
+
+    Each stored mask gets a slot and each bit of the elements has an
+    inverted index, a bitmask of the slots of the masks containing it, so a
+    query costs a few integer operations per element, rather than one per
+    stored mask.
+    """
+
+    def __init__(self):
+        self._slot_of = dict()  # Mask to its slot
+        self._mask_in = []  # Slot to its mask, None if free
+        self._free_slots = []
+        self._used_slots = 0
+        self._slots_with_bit = []  # Bit position to slots bitmask
+        self._bits_in_use = 0
+
+    def add(self, mask: int) -> bool:
+        if mask in self._slot_of:
+            return False
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._mask_in[slot] = mask
+        else:
+            slot = len(self._mask_in)
+            self._mask_in.append(mask)
+        self._slot_of[mask] = slot
+        slot_bit = 1 << slot
+        self._used_slots |= slot_bit
+        if mask.bit_length() > len(self._slots_with_bit):
+            self._slots_with_bit.extend(
+                [0] * (mask.bit_length() - len(self._slots_with_bit)))
+        for bit in bit_positions(mask):
+            self._slots_with_bit[bit] |= slot_bit
+        self._bits_in_use |= mask
+        return True
+
+    def discard(self, mask: int) -> bool:
+        slot = self._slot_of.pop(mask, None)
+        if slot is None:
+            return False
+        self._mask_in[slot] = None
+        self._free_slots.append(slot)
+        slot_bit = 1 << slot
+        self._used_slots &= ~slot_bit
+        for bit in bit_positions(mask):
+            self._slots_with_bit[bit] &= ~slot_bit
+            if not self._slots_with_bit[bit]:
+                self._bits_in_use &= ~(1 << bit)
+        return True
+
+    def clear(self):
+        self._slot_of.clear()
+        self._mask_in.clear()
+        self._free_slots.clear()
+        self._used_slots = 0
+        self._slots_with_bit.clear()
+        self._bits_in_use = 0
+
+    def has_subset_of(self, mask: int, strict: bool = False) -> bool:
+        if not strict and mask in self._slot_of:
+            return True
+        # The subsets are the masks without any bit outside the given one
+        slots = self._used_slots
+        for bit in bit_positions(self._bits_in_use & ~mask):
+            slots &= ~self._slots_with_bit[bit]
+            if not slots:
+                return False
+        if strict and mask in self._slot_of:
+            slots &= ~(1 << self._slot_of[mask])
+        return slots != 0
+
+    def supersets_of(self, mask: int, strict: bool = False
+                     ) -> Generator[int, None, None]:
+        slots = self._used_slots
+        for bit in bit_positions(mask):
+            if bit >= len(self._slots_with_bit):
+                return
+            slots &= self._slots_with_bit[bit]
+            if not slots:
+                return
+        if strict and mask in self._slot_of:
+            slots &= ~(1 << self._slot_of[mask])
+        # Collected before providing them, as the caller may change them
+        yield from [self._mask_in[slot] for slot in bit_positions(slots)]
+
+    def __contains__(self, mask):
+        return mask in self._slot_of
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __iter__(self):
+        return iter(self._slot_of)
+
+
+class BitsetHsDagNode(hsdag.HsDagNode):
+    __slots__ = ()
+
+    def reinitialize(self):
+        super().reinitialize()
+        self.path_from_root = 0
+
+
+class BitsetRcTreeNode(rctree.RcTreeNode):
+    __slots__ = ()
+
+    def reinitialize(self):
+        super().reinitialize()
+        self.path_from_root = 0
+
+    def allow_all_edges(self):
+        self.theta_c = 0
+        self.theta = 0
+
+
+class _BitsetEncoding(object):
+    """
+    Replaces the set operations of the HSDAG and RC-Tree algorithms with
+    bitwise operations. Edges are identified by the bit position of the
+    element instead of the element itself.
+    """
+
+    def __init__(self, list_of_conflicts=None):
+        super().__init__(list_of_conflicts)
+        self._ticked_paths = BitmaskFamily()
+        self._labels_in_use = BitmaskFamily()
+        self._bit_of_element = dict()
+        self._element_of_bit = []
+
+    def reset(self):
+        super().reset()
+        self._bit_of_element.clear()
+        self._element_of_bit.clear()
+
+    def _solution_of(self, node) -> mhs.SolutionSet:
+        return self._decoded(node.path_from_root)
+
+    def _encoded(self, conflict) -> int:
+        mask = 0
+        for element in conflict:
+            bit = self._bit_of_element.get(element)
+            if bit is None:
+                bit = len(self._element_of_bit)
+                self._bit_of_element[element] = bit
+                self._element_of_bit.append(element)
+            mask |= 1 << bit
+        return mask
+
+    def _decoded(self, mask: int) -> mhs.SolutionSet:
+        return mhs.SolutionSet(
+            self._element_of_bit[bit] for bit in bit_positions(mask))
+
+    @staticmethod
+    def _frozen(mask: int) -> int:
+        return mask
+
+    @staticmethod
+    def _cardinality(mask: int) -> int:
+        return bin(mask).count('1')
+
+    @staticmethod
+    def _elements_of(mask: int) -> List[int]:
+        return list(bit_positions(mask))
+
+    def _scan_for_disjoint_conflict(self, path_from_root: int):
+        self.stats.label_scans += 1
+        examined = 0
+        for examined, conflict_mask in enumerate(
+                self._working_list_of_conflicts, 1):
+            if not conflict_mask & path_from_root:
+                self.stats.conflicts_examined += examined
+                return conflict_mask
+        self.stats.conflicts_examined += examined
+        return None
+
+    @staticmethod
+    def _path_with(path_from_root: int, bit: int) -> int:
+        return path_from_root | (1 << bit)
+
+    def render(self, out_file=None):
+        from graphviz import Digraph
+        graph = Digraph(comment=self.__class__.__name__)
+        for node in self.breadth_first_explore(self.root):
+            node_id = str(node.path_from_root)
+            graph.node(node_id, self._name_for_render(node))
+            for bit, child in node.children.items():
+                graph.edge(node_id,
+                           str(child.path_from_root),
+                           label=str(self._element_of_bit[bit]))
+        if out_file is None:
+            out_file = self._get_temp_file_name()
+        graph.render(out_file, view=True)
+
+    def _name_for_render(self, node):
+        if node.is_ticked:
+            label = '✓'
+        elif node.label is None:
+            label = None
+        else:
+            label = self._decoded(node.label)
+        name = "L: {:s}\nP: {:s}".format(
+            str(label), str(self._decoded(node.path_from_root)))
+        if isinstance(node, rctree.RcTreeNode):
+            name += "\nT: {:s}\nTc: {:s}".format(
+                str(self._decoded(node.theta)),
+                str(self._decoded(node.theta_c)))
+        if node.is_closed:
+            name += ", closed"
+        return name
+
+
+class BitsetHsDag(_BitsetEncoding, hsdag.HsDag):
+    """
+    HSDAG algorithm working on bitmasks. The found minimal hitting sets are
+    the same as the ones of `hsdag.HsDag`.
+    """
+    _node_class = BitsetHsDagNode
+
+    def __init__(self, list_of_conflicts: List[set] = None):
+        super().__init__(list_of_conflicts)
+
+    def _relabel_and_trim(self, node_in_processing: BitsetHsDagNode,
+                          other_node: BitsetHsDagNode):
+        difference = other_node.label & ~node_in_processing.label
+        previous_label = other_node.label
+        self._set_label(other_node, node_in_processing.label)
+        for bit in bit_positions(difference):
+            self._trim_subdag(other_node, bit)
+            self._working_list_of_conflicts.retire(previous_label)
+
+    def _create_children(self, node_in_processing: BitsetHsDagNode):
+        for bit in bit_positions(node_in_processing.label):
+            child_node = self._edge_termination(node_in_processing, bit)
+            child_node.parents[bit] = node_in_processing
+            child_node.path_from_root = \
+                node_in_processing.path_from_root | (1 << bit)
+            node_in_processing.children[bit] = child_node
+
+
+class BitsetRcTree(_BitsetEncoding, rctree.RcTree):
+    """
+    RC-Tree algorithm working on bitmasks. The found minimal hitting sets
+    are the same as the ones of `rctree.RcTree`.
+    """
+    _node_class = BitsetRcTreeNode
+
+    def __init__(self, list_of_conflicts: List[set] = None):
+        super().__init__(list_of_conflicts)
+
+    def _relabel_and_trim(self, node_in_processing: BitsetRcTreeNode,
+                          other_node: BitsetRcTreeNode):
+        difference = other_node.label & ~node_in_processing.label
+        previous_label = other_node.label
+        self._set_label(other_node, node_in_processing.label)
+        other_node.theta_c &= ~difference
+        for bit in bit_positions(difference):
+            self._trim_subdag(other_node, bit)
+        self._propagate_thetas_changes(other_node, difference)
+        self._create_newly_allowed_descendants(other_node)
+        self._working_list_of_conflicts.retire(previous_label)
+
+    def _excluded_elements(self, node: BitsetRcTreeNode):
+        return self._decoded(node.theta)
+
+    def _propagate_thetas_changes(self, other_node: BitsetRcTreeNode,
+                                  difference: int):
+        for descendant in self.breadth_first_explore(other_node):
+            if descendant is other_node:
+                continue  # Children only, skip the subdag root
+            descendant.theta_c &= ~difference
+            descendant.theta = descendant.theta_c | descendant.parent.theta
+
+    def _create_children(self, node_in_processing: BitsetRcTreeNode):
+        if node_in_processing.label is None:
+            return
+        conflicts_generating_edges = \
+            node_in_processing.label & ~node_in_processing.theta
+        for bit in bit_positions(conflicts_generating_edges):
+            # Discard the outdated subtree, if the edge already existed
+            self._trim_subdag(node_in_processing, bit)
+            node_in_processing.children[bit] = None
+            child_node = self._child_node(node_in_processing, bit)
+            node_in_processing.children[bit] = child_node
+            self.nodes_to_process.append(child_node)
+
+    def _child_node(self, node_in_processing: BitsetRcTreeNode, bit: int):
+        child_node = self._new_node()
+        child_node.parents[bit] = node_in_processing
+        child_node.path_from_root = \
+            node_in_processing.path_from_root | (1 << bit)
+        edges_mask = 0
+        for edge in node_in_processing.children:
+            edges_mask |= 1 << edge
+        child_node.theta_c = node_in_processing.label & edges_mask
+        child_node.theta = child_node.theta_c | node_in_processing.theta
+        self._node_created(child_node.path_from_root)
+        return child_node
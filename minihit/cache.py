@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+from . import mhs
+from . import rctree
+
+
+def canonical_form(list_of_conflicts: List[set]) -> Tuple[tuple, list]:
+    """
+    Provides a representation of the conflicts independent of their order,
+    of the order of their elements and of duplicate conflicts.
+
+    The elements are relabelled with integers, ordered by the amount and
+    cardinalities of the conflicts containing them and then by their
+    representation, so renamed elements often obtain the same labels.
+
+    Args:
+        list_of_conflicts (List[set]): the conflicts to represent. This
+            input list is never modified.
+
+    Returns:
+        Tuple[tuple, list]: the sorted tuple of the sorted tuples of the
+            labels of each distinct conflict and the list of the elements
+            in order of label.
+    """
+    distinct_conflicts = set(map(frozenset, list_of_conflicts))
+    cardinalities_by_element = dict()
+    for conflict in distinct_conflicts:
+        for element in conflict:
+            cardinalities_by_element.setdefault(element, []).append(
+                len(conflict))
+    elements = sorted(cardinalities_by_element, key=lambda element: (
+        len(cardinalities_by_element[element]),
+        sorted(cardinalities_by_element[element]),
+        type(element).__name__,
+        repr(element)))
+    label_of_element = {element: label
+                        for label, element in enumerate(elements)}
+    family = tuple(sorted(tuple(sorted(label_of_element[element]
+                                       for element in conflict))
+                          for conflict in distinct_conflicts))
+    return family, elements
+
+
+class SolutionsCache(object):
+    """
+    Cache of the minimal hitting sets of already solved problems, with an
+    in-memory least-recently-used tier and an optional on-disk tier, which
+    survives across executions.
+
+    The entries are stored by key as lists of minimal hitting sets of
+    labels, where each label is an integer. The in-memory tier evicts the
+    least recently used entries when the total amount of stored labels
+    exceeds its maximum size. The on-disk tier stores one JSON file per key
+    and is never evicted.
+    """
+
+    def __init__(self, max_size: int = 1000000, directory: str = None):
+        """
+        Constructs an empty cache.
+
+        Args:
+            max_size (int): maximum amount of labels stored in memory.
+            directory (str): directory of the on-disk tier, created if
+                missing. None to keep the entries only in memory.
+        """
+        if max_size < 0:
+            raise ValueError("The maximum size must be non-negative.")
+        self.max_size = max_size
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._size = 0
+
+    def get(self, key: str):
+        """
+        Provides the entry stored with the key, counting a hit or a miss.
+
+        Args:
+            key (str): the key of the entry.
+
+        Returns:
+            List[List[int]]: the stored minimal hitting sets of labels or
+                None if the key is not in the cache.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.directory is not None:
+            try:
+                with open(self._file_name(key)) as cache_file:
+                    stored_key, solutions = json.load(cache_file)
+            except (OSError, ValueError):
+                stored_key = None
+            if stored_key == key:
+                self._store_in_memory(key, solutions)
+                self.hits += 1
+                return solutions
+        self.misses += 1
+        return None
+
+    def put(self, key: str, solutions: List[List[int]]):
+        """
+        Stores an entry in both tiers.
+
+        Args:
+            key (str): the key of the entry.
+            solutions (List[List[int]]): the minimal hitting sets of labels.
+        """
+        self._store_in_memory(key, solutions)
+        if self.directory is not None:
+            # Written to a temporary file first, so concurrent processes
+            # never read a partial file
+            file_descriptor, temp_file_name = tempfile.mkstemp(
+                dir=self.directory)
+            with os.fdopen(file_descriptor, 'w') as cache_file:
+                json.dump([key, solutions], cache_file)
+            os.replace(temp_file_name, self._file_name(key))
+
+    def clear(self):
+        """Removes all entries from memory, keeping the on-disk ones."""
+        self._entries.clear()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _store_in_memory(self, key: str, solutions: List[List[int]]):
+        if key in self._entries:
+            self._size -= self._size_of(self._entries.pop(key))
+        self._entries[key] = solutions
+        self._size += self._size_of(solutions)
+        while self._size > self.max_size and self._entries:
+            _, evicted_solutions = self._entries.popitem(last=False)
+            self._size -= self._size_of(evicted_solutions)
+            self.evictions += 1
+
+    @staticmethod
+    def _size_of(solutions: List[List[int]]) -> int:
+        return sum(len(solution) for solution in solutions) + 1
+
+    def _file_name(self, key: str) -> str:
+        return os.path.join(
+            self.directory,
+            hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+
+class CachedProblem(mhs.MinimalHittingSetsProblem):
+    """
+    Minimal hitting sets solver looking up the solutions of the conflicts
+    in a `SolutionsCache` before solving them with another solver.
+
+    The key of the cache is made of the solver, its options and the
+    canonical form of the conflicts, so the solutions are reused for the
+    same conflicts in any order and with duplicates.
+
+    When the solutions are found in the cache, `amount_of_nodes_constructed`
+    is 0, as nothing is constructed, while `amount_of_conflicts_removed`
+    is the same as if they were solved.
+    """
+
+    def __init__(self, list_of_conflicts=None, engine_class=rctree.RcTree,
+                 cache: SolutionsCache = None):
+        """
+        Constructs the minimal hitting sets problem to be solved with an
+        optional list of conflicts to initialize it.
+
+        Args:
+            list_of_conflicts (List[set]): conflicts to find the minimal
+                hitting sets for.
+            engine_class (type): `MinimalHittingSetsProblem` subclass solving
+                the conflicts not found in the cache.
+            cache (SolutionsCache): cache to use. None to use a new
+                in-memory one.
+        """
+        super().__init__(list_of_conflicts)
+        self.engine_class = engine_class
+        if cache is None:
+            cache = SolutionsCache()
+        self.cache = cache
+        self.problem = None
+        self.was_cached = False
+        self._solutions = []
+
+    def solve(self, **solve_options):
+        """
+        Provides the cached minimal hitting sets of the list of conflicts or
+        finds them with the solver, storing them in the cache.
+
+        Args:
+            **solve_options: arguments of the `solve()` method of the
+                solver, like `prune` and `sort`.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        self.reset()
+        if not self.list_of_conflicts:
+            return time.time() - start_time
+        self._clone_list_of_conflicts(sort=False)
+        family, elements = canonical_form(self._working_list_of_conflicts)
+        key = json.dumps([self.engine_class.__module__ + '.' +
+                          self.engine_class.__qualname__,
+                          sorted(solve_options.items()), family])
+        labelled_solutions = self.cache.get(key)
+        self.was_cached = labelled_solutions is not None
+        if self.was_cached:
+            if solve_options.get('subsume'):
+                self.amount_of_conflicts_removed = \
+                    len(self.list_of_conflicts) - len(
+                        mhs.remove_redundant_conflicts(
+                            self._working_list_of_conflicts))
+        else:
+            self.problem = self.engine_class(self._working_list_of_conflicts)
+            self.problem.solve(**solve_options)
+            self.amount_of_nodes_constructed = \
+                self.problem.amount_of_nodes_constructed
+            self.amount_of_conflicts_removed = \
+                self.problem.amount_of_conflicts_removed
+            label_of_element = {element: label
+                                for label, element in enumerate(elements)}
+            labelled_solutions = [
+                sorted(label_of_element[element] for element in solution)
+                for solution in self.problem.generate_minimal_hitting_sets()]
+            if getattr(self.problem, 'is_complete', True):
+                self.cache.put(key, labelled_solutions)
+        self._solutions = [mhs.SolutionSet(elements[label]
+                                           for label in solution)
+                           for solution in labelled_solutions]
+        self._working_list_of_conflicts = None  # To reduce used memory
+        return time.time() - start_time
+
+    def reset(self):
+        self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._working_list_of_conflicts = None
+        self.problem = None
+        self.was_cached = False
+        self._solutions = []
+
+    def generate_minimal_hitting_sets(self):
+        yield from self._solutions
+
+    def render(self, out_file=None):
+        """Renders the solver, if the solutions were not cached."""
+        if self.problem is not None:
+            self.problem.render(out_file)
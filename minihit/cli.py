@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Parsing of the values of the command line options, shared by the command
+line interfaces of the package. Each option taking a value accepts both
+--option=VALUE and --option VALUE.
+"""
+
+from typing import Iterable, Iterator
+
+
+def name_of(original_argument: str) -> str:
+    """Name of an option without the leading dashes, lowercase, with its
+    value removed if given as --option=VALUE."""
+    return original_argument.strip().lstrip('-').split('=', 1)[0].lower()
+
+
+def value_of(original_argument: str, arguments: Iterator[str]) -> str:
+    """
+    Provides the value of an option given either as --option=VALUE or as
+    --option VALUE.
+
+    Args:
+        original_argument: the option as written on the command line.
+        arguments: iterator of the following command line arguments, from
+            which the value is consumed in the --option VALUE form.
+
+    Returns:
+        str: the value of the option, as written.
+
+    Raises:
+        ValueError: if the value is missing.
+    """
+    if '=' in original_argument:
+        value = original_argument.split('=', 1)[1]
+    else:
+        value = next(arguments, '')
+    if not value:
+        raise ValueError('Missing value of --{:s}'.format(
+            name_of(original_argument)))
+    return value
+
+
+def int_value_of(original_argument: str, arguments: Iterator[str]) -> int:
+    """Same as `value_of()`, for an integer value."""
+    value = value_of(original_argument, arguments)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError('Invalid integer value of --{:s}: {:s}'.format(
+            name_of(original_argument), value))
+
+
+def float_value_of(original_argument: str,
+                   arguments: Iterator[str]) -> float:
+    """Same as `value_of()`, for a real value."""
+    value = value_of(original_argument, arguments)
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError('Invalid real value of --{:s}: {:s}'.format(
+            name_of(original_argument), value))
+
+
+def choice_of(original_argument: str, arguments: Iterator[str],
+              choices: Iterable[str]) -> str:
+    """Same as `value_of()`, for a value among the choices, ignoring the
+    case."""
+    value = value_of(original_argument, arguments).lower()
+    choices = tuple(choices)
+    if value not in choices:
+        raise ValueError('Invalid value of --{:s}: {:s}, choose one of: '
+                         '{:s}'.format(name_of(original_argument), value,
+                                       ', '.join(choices)))
+    return value
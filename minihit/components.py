@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import concurrent.futures
+import time
+from typing import List
+
+from . import mhs
+from . import rctree
+
+
+def connected_components(list_of_conflicts: List[set]) -> List[List[set]]:
+    """
+    Splits the conflicts into connected components: two conflicts are in
+    the same component if they share an element, directly or through other
+    conflicts of the component.
+
+    Args:
+        list_of_conflicts (List[set]): the conflicts to split. This input
+            list is never modified.
+
+    Returns:
+        List[List[set]]: the components, ordered by their first conflict,
+            each with its conflicts in their original order.
+    """
+    parent_of_element = dict()
+
+    def root_of(element):
+        root = element
+        while parent_of_element[root] != root:
+            root = parent_of_element[root]
+        while parent_of_element[element] != root:  # Path compression
+            parent_of_element[element], element = root, \
+                parent_of_element[element]
+        return root
+
+    for conflict in list_of_conflicts:
+        conflict_root = None
+        for element in conflict:
+            root = root_of(parent_of_element.setdefault(element, element))
+            if conflict_root is None:
+                conflict_root = root
+            elif root != conflict_root:
+                parent_of_element[root] = conflict_root
+    components_by_root = dict()
+    components = []
+    for conflict in list_of_conflicts:
+        if not conflict:
+            components.append([conflict])
+            continue
+        root = root_of(next(iter(conflict)))
+        if root not in components_by_root:
+            components_by_root[root] = []
+            components.append(components_by_root[root])
+        components_by_root[root].append(conflict)
+    return components
+
+
+def _solve_component(engine_class, list_of_conflicts: List[set],
+                     solve_options: dict):
+    """Solves a component in a worker process, providing the minimal
+    hitting sets, the amount of nodes constructed and the amount of
+    conflicts removed."""
+    engine = engine_class(list_of_conflicts)
+    engine.solve(**solve_options)
+    return (list(engine.generate_minimal_hitting_sets()),
+            engine.amount_of_nodes_constructed,
+            engine.amount_of_conflicts_removed)
+
+
+class Decomposition(mhs.MinimalHittingSetsProblem):
+    """
+    Minimal hitting sets solver splitting the conflicts into connected
+    components, which are solved independently by another solver.
+
+    Each minimal hitting set is the union of one minimal hitting set of
+    each component, so the solutions are generated lazily as the product of
+    the solutions of the components. The solvers construct one DAG/Tree per
+    component, growing with the sum of the components instead of their
+    product.
+    """
+
+    def __init__(self, list_of_conflicts=None, engine_class=rctree.RcTree):
+        """
+        Constructs the minimal hitting sets problem to be solved with an
+        optional list of conflicts to initialize it.
+
+        Args:
+            list_of_conflicts (List[set]): conflicts to find the minimal
+                hitting sets for.
+            engine_class (type): `MinimalHittingSetsProblem` subclass solving
+                each component.
+        """
+        super().__init__(list_of_conflicts)
+        self.engine_class = engine_class
+        self.components = []
+        self._solutions_of_components = []
+        self._problems = []
+
+    def solve(self, prune=True, sort=False, *, workers=None,
+              max_cardinality=None, **solve_options):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts.
+
+        Args:
+            prune (bool): same as in `HsDag.solve()`, applied to each
+                component.
+            sort (bool): same as in `HsDag.solve()`, applied to each
+                component.
+            workers (int): amount of processes solving the components in
+                parallel. None or 1 to solve them in this process.
+            max_cardinality (int): maximum cardinality of the minimal
+                hitting sets to find. Applied to each component and to the
+                unions of their solutions. None to find all of them.
+            **solve_options: arguments of the `solve()` method of the
+                solver of each component, like `subsume`.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        self.reset()
+        if workers is not None and workers < 1:
+            raise ValueError("The amount of workers must be positive.")
+        if max_cardinality is not None and max_cardinality < 0:
+            raise ValueError("The maximum cardinality must be non-negative.")
+        self._max_cardinality = max_cardinality
+        if not self.list_of_conflicts:
+            return time.time() - start_time
+        self._clone_list_of_conflicts(sort=False)
+        self.components = connected_components(
+            self._working_list_of_conflicts)
+        self._working_list_of_conflicts = None  # To reduce used memory
+        solve_options.update(prune=prune, sort=sort,
+                             max_cardinality=max_cardinality)
+        if workers is None or workers == 1:
+            for component in self.components:
+                problem = self.engine_class(component)
+                problem.solve(**solve_options)
+                self._problems.append(problem)
+                self.amount_of_nodes_constructed += \
+                    problem.amount_of_nodes_constructed
+                self.amount_of_conflicts_removed += \
+                    problem.amount_of_conflicts_removed
+                self._solutions_of_components.append(
+                    list(problem.generate_minimal_hitting_sets()))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                futures = [executor.submit(_solve_component,
+                                           self.engine_class, component,
+                                           solve_options)
+                           for component in self.components]
+                for future in futures:
+                    solutions, amount_of_nodes, amount_of_conflicts = \
+                        future.result()
+                    self.amount_of_nodes_constructed += amount_of_nodes
+                    self.amount_of_conflicts_removed += amount_of_conflicts
+                    self._solutions_of_components.append(solutions)
+        for solutions in self._solutions_of_components:
+            solutions.sort(key=len)  # To stop the product early
+        return time.time() - start_time
+
+    def reset(self):
+        self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._working_list_of_conflicts = None
+        self._max_cardinality = None
+        self.components = []
+        self._solutions_of_components = []
+        self._problems = []
+
+    def generate_minimal_hitting_sets(self):
+        if self._solutions_of_components:
+            yield from self._product(0, mhs.SolutionSet())
+
+    def _product(self, component_index: int, partial: mhs.SolutionSet):
+        """Generator of the unions of the partial solution with one solution
+        of each component from the given one onwards."""
+        if component_index == len(self._solutions_of_components):
+            yield mhs.SolutionSet(partial)
+            return
+        for solution in self._solutions_of_components[component_index]:
+            if (self._max_cardinality is not None and
+                    len(partial) + len(solution) > self._max_cardinality):
+                break  # The solutions are sorted by cardinality
+            yield from self._product(component_index + 1,
+                                     partial.union(solution))
+
+    def render(self, out_file=None):
+        """Renders the solver of each component, if they were solved in this
+        process, adding the index of the component to the file name."""
+        for index, problem in enumerate(self._problems):
+            if out_file is None:
+                problem.render()
+            else:
+                problem.render('{:s}_{:d}'.format(out_file, index))
@@ -7,9 +7,13 @@
 # the BSD 3-clause license.
 
 import collections
+import concurrent.futures
+import itertools
+import mmap
+import os
 import random
 
-from typing import Generator, Set
+from typing import Generator, List, Set, Tuple
 
 
 class ConflictSetsFileParser(object):
@@ -28,46 +32,78 @@ class ConflictSetsFileParser(object):
 
     def parse(self, input_file_name):
         self._reset()
-        self.input_file_name = input_file_name
-        for line in self._clean_lines():
-            self.sets_by_line[self.lines_in_file] = self._line_to_sets(line)
+        for line_number, conflicts in self.iter_parse(input_file_name):
+            self.sets_by_line[line_number] = conflicts
         return self.sets_by_line
 
+    def iter_parse(self, input_file_name, workers: int = None,
+                   chunk_size: int = 10000
+                   ) -> Generator[Tuple[int, List[set]], None, None]:
+        """
+        Parses the file lazily, reading it through a memory map, so only
+        the line being parsed is kept in memory, unlike `parse()` which
+        stores all of them in `sets_by_line`.
+
+        Whitespace and brackets are ignored, a closing and an opening
+        curly bracket separated by a comma separate two sets, as in Python
+        syntax, and empty sets are dropped, as in `parse()`.
+
+        Args:
+            input_file_name: path of the file to parse.
+            workers: amount of processes parsing chunks of lines in
+                parallel, which requires a picklable element caster
+                function (e.g. not a lambda). None or 1 to parse the lines
+                in this process.
+            chunk_size: amount of lines sent to a worker process at once.
+
+        Returns:
+            generator of the pairs of line number, starting from 1, and list
+            of conflicts of each line that is not empty or only a comment,
+            in the order of the file. `lines_in_file` counts the lines read
+            so far.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("The amount of workers must be positive.")
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be positive.")
+        self.input_file_name = input_file_name
+        self.lines_in_file = 0
+        numbered_lines = self._numbered_lines(input_file_name)
+        if workers is None or workers == 1:
+            yield from _parsed_lines(self._settings(), numbered_lines)
+            return
+        settings = self._settings()
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            # At most two chunks per worker are read ahead, to bound the
+            # memory used by the lines not parsed yet
+            futures = collections.deque()
+            while True:
+                chunk = list(itertools.islice(numbered_lines, chunk_size))
+                if chunk:
+                    futures.append(executor.submit(_parse_chunk, settings,
+                                                   chunk))
+                if futures and (not chunk or len(futures) >= 2 * workers):
+                    yield from futures.popleft().result()
+                elif not chunk:
+                    return
+
     def _reset(self):
         self.sets_by_line.clear()
         self.lines_in_file = 0
 
-    def _clean_lines(self):
-        with open(self.input_file_name) as input_file:
-            for line in input_file:
-                self.lines_in_file += 1
-                line = self._cleaned_line(line)
-                if line:
-                    yield line
-
-    def _cleaned_line(self, line):
-        no_whitespaces = ''.join(line.split())
-        processed = no_whitespaces.split(self.comment_char, 1)[0]
-        processed = processed.replace('},{', self.set_separator)
-        processed = processed.replace('{', '').replace('}', '')
-        processed = processed.replace('[', '').replace(']', '')
-        processed = processed.replace('(', '').replace(')', '')
-        return processed
-
-    def _line_to_sets(self, line):
-        line = line.strip(self.set_separator)
-        sets_as_strings = line.split(self.set_separator)
-        all_sets = map(self._string_to_set, sets_as_strings)
-        filtered_sets = list(filter(None, all_sets))
-        return filtered_sets
-
-    def _string_to_set(self, set_as_string):
-        set_as_string = set_as_string.strip(self.element_separator)
-        elements_as_strings = set_as_string.split(self.element_separator)
-        elements_as_strings = filter(None, elements_as_strings)
-        elements = map(self.element_caster_function, elements_as_strings)
-        elements = set(elements)
-        return elements
+    def _numbered_lines(self, input_file_name):
+        with open(input_file_name, 'rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                return  # Empty files can't be memory mapped
+            with mmap.mmap(input_file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped_file:
+                for line in iter(mapped_file.readline, b''):
+                    self.lines_in_file += 1
+                    yield self.lines_in_file, line.decode('utf-8')
+
+    def _settings(self) -> tuple:
+        return (self.comment_char, self.set_separator,
+                self.element_separator, self.element_caster_function)
 
     def __str__(self):
         strings = []
@@ -79,7 +115,41 @@ class ConflictSetsFileParser(object):
         return list(self.sets_by_line.values())
 
 
-def random_conflicts(amount_conflicts: int, max_cardinality: int
+# Removes all the brackets in a single pass
+_BRACKETS_REMOVER = str.maketrans('', '', '{}[]()')
+
+
+def _parsed_lines(settings: tuple, numbered_lines
+                  ) -> Generator[Tuple[int, List[set]], None, None]:
+    """Generator of the pairs of line number and list of conflicts of the
+    numbered lines that are not empty."""
+    comment_char, set_separator, element_separator, element_caster_function \
+        = settings
+    for line_number, line in numbered_lines:
+        line = ''.join(line.split()).split(comment_char, 1)[0]
+        if '}' in line:  # Python syntax, sets separated by '},{'
+            line = line.replace('},{', set_separator)
+        line = line.translate(_BRACKETS_REMOVER)
+        if not line:
+            continue
+        conflicts = []
+        for set_as_string in line.strip(set_separator).split(set_separator):
+            conflict = set(map(element_caster_function, filter(
+                None, set_as_string.strip(element_separator).split(
+                    element_separator))))
+            if conflict:
+                conflicts.append(conflict)
+        yield line_number, conflicts
+
+
+def _parse_chunk(settings: tuple, numbered_lines: List[Tuple[int, str]]
+                 ) -> List[Tuple[int, List[set]]]:
+    """Parses a chunk of lines in a worker process."""
+    return list(_parsed_lines(settings, numbered_lines))
+
+
+def random_conflicts(amount_conflicts: int, max_cardinality: int,
+                     seed: int = None
                      ) -> Generator[Set[int], None, None]:
     """
     Generator of a random sequence of conflicts containing integers.
@@ -88,13 +158,17 @@ def random_conflicts(amount_conflicts: int, max_cardinality: int
         amount_conflicts: number of conflicts to generate
         max_cardinality: maximum possible size of each conflict in the sequence
             and maximum value that each conflict element can have.
+        seed: seed of a dedicated random generator, to obtain the same
+            sequence every time. None to use the global one of the `random`
+            module.
 
     Returns:
         generator of the conflicts.
     """
+    generator = random if seed is None else random.Random(seed)
     for i in range(amount_conflicts):
-        cardinality = random.randint(1, max_cardinality)
-        conflict = set(random.randint(1, max_cardinality)
+        cardinality = generator.randint(1, max_cardinality)
+        conflict = set(generator.randint(1, max_cardinality)
                        for i in range(cardinality))
         yield conflict
 
@@ -11,17 +11,29 @@ import time
 from typing import Generator
 
 from . import mhs
+from . import settrie
+from . import stats
+from . import verify
 
 
 class HsDagNode(object):
+    __slots__ = ('path_from_root', 'children', 'parents',
+                 '_closed', '_ticked', '_label')
+
     def __init__(self):
-        self.path_from_root = mhs.SolutionSet()  # a.k.a. h(node)
         self.children = dict()
         self.parents = dict()
+        self.reinitialize()
+
+    def reinitialize(self):
+        """Brings the node back to the state of a newly constructed one,
+        so it can be reused."""
+        self.path_from_root = mhs.SolutionSet()  # a.k.a. h(node)
+        self.children.clear()
+        self.parents.clear()
         self._closed = False
         self._ticked = False
         self._label = None
-        self.label = None
 
     @property
     def is_closed(self):
@@ -38,6 +50,9 @@ class HsDagNode(object):
         self._label = None
         self._ticked = True
 
+    def untick(self):
+        self._ticked = False
+
     @property
     def label(self):
         return self._label
@@ -85,16 +100,89 @@ class HsDagNode(object):
         return format_string.format(str(label), str(self.path_from_root))
 
 
+class _WorkingConflicts(object):
+    """
+    Ordered collection of conflicts where a conflict can be retired by value
+    in constant time, without shifting the other conflicts.
+    """
+
+    def __init__(self, conflicts, freeze=frozenset):
+        self._freeze = freeze
+        self._conflicts = dict(enumerate(conflicts))
+        self._positions = dict()
+        for position, conflict in self._conflicts.items():
+            self._positions.setdefault(
+                freeze(conflict), queue.deque()).append(position)
+
+    def __iter__(self):
+        return iter(self._conflicts.values())
+
+    def __len__(self):
+        return len(self._conflicts)
+
+    def items(self):
+        """Pairs of position and conflict, in order."""
+        return self._conflicts.items()
+
+    def get(self, position):
+        """Conflict at the position, None if retired."""
+        return self._conflicts.get(position)
+
+    def retire(self, conflict):
+        """Removes the first conflict equal to the given one, if any."""
+        positions = self._positions.get(self._freeze(conflict))
+        if positions:
+            del self._conflicts[positions.popleft()]
+
+
 class HsDag(mhs.MinimalHittingSetsProblem):
+    _node_class = HsDagNode
+
     def __init__(self, list_of_conflicts=None):
         super().__init__(list_of_conflicts)
         self.nodes_to_process = queue.deque()
         self.root = None
+        self._nodes_by_path = dict()
+        self._ticked_paths = settrie.SetTrie()
+        self._nodes_by_label = dict()
+        self._labels_in_use = settrie.SetTrie()
+        self._level_batch = None
+        self._max_cardinality = None
+        self._solve_options = None
+        self._free_nodes = []
+        self._detached_nodes = dict()  # Used as insertion-ordered set
+        self.stats = stats.SolverStats()
+        self.hooks = stats.SolverHooks()
+        self._max_nodes = None
+        self._deadline = None
+        self.is_complete = True
+        self.completed_cardinality = None
+        self.frontier_size = 0
 
     def generate_minimal_hitting_sets(self):
+        if self.is_complete:
+            yield from self._lifted(self._kernel_solutions())
+        else:
+            # Ticked deeper than the completed levels, a path may be a
+            # superset of a solution whose node was not constructed yet
+            verifier = verify.FamilyVerifier(self.list_of_conflicts)
+            for solution in self._lifted(self._kernel_solutions()):
+                if verifier.is_minimal_hitting(solution):
+                    yield solution
+
+    def _kernel_solutions(self):
         for node in self.breadth_first_explore(self.root):
             if node.is_ticked:
-                yield node.path_from_root
+                yield self._solution_of(node)
+
+    @staticmethod
+    def _solution_of(node: HsDagNode) -> mhs.SolutionSet:
+        return node.path_from_root
+
+    @staticmethod
+    def _decoded(elements) -> mhs.SolutionSet:
+        """Copy of a path or a label as a set of elements."""
+        return mhs.SolutionSet(elements)
 
     def render(self, out_file=None):
         from graphviz import Digraph
@@ -119,7 +207,9 @@ class HsDag(mhs.MinimalHittingSetsProblem):
             'temp_{:s}'.format(self.__class__.__name__))
         return out_file
 
-    def solve(self, prune=True, sort=False):
+    def solve(self, prune=True, sort=False, vectorize=False,
+              max_cardinality=None, subsume=False, kernelize=False, *,
+              timeout=None, max_nodes=None):
         """
         Runs the algorithm that finds the minimal hitting sets for the
         list of conflicts.
@@ -132,80 +222,471 @@ class HsDag(mhs.MinimalHittingSetsProblem):
                 completely removes the need for pruning (thus also deactivates
                 it automatically). A sorted list of conflicts is the
                 best-case scenario for the algorithm.
+            vectorize (bool): labels and attempts to close all the nodes
+                with the same path cardinality at once, with NumPy matrix
+                operations instead of a loop over the conflicts and the
+                solutions for each node. Requires NumPy.
+            max_cardinality (int): maximum cardinality of the minimal
+                hitting sets to find. The nodes with a path of this
+                cardinality are not expanded. None to find all of them.
+            subsume (bool): removes the duplicate conflicts and the
+                conflicts that are supersets of other conflicts before
+                solving, as they would only create redundant labels.
+                The amount of removed conflicts is stored in
+                `amount_of_conflicts_removed`.
+            kernelize (bool): reduces the conflicts before solving, removing
+                the elements of the conflicts with a single element, which
+                are in every minimal hitting set, with the conflicts they hit,
+                and keeping only one of the elements contained in exactly
+                the same conflicts. The minimal hitting sets are lifted back
+                when generated. See `kernel.Kernel`.
+            timeout (float): keyword-only, maximum time in seconds to spend
+                constructing the DAG, checked before processing each node.
+                None for no limit. See `is_complete`.
+            max_nodes (int): keyword-only, maximum amount of nodes to
+                construct: no more nodes are processed once reached, so the
+                ones created by the last processed node may exceed it. None
+                for no limit. See `is_complete`.
+
+        When a limit is reached, the construction stops and `is_complete`
+        is False. Since the nodes are processed breadth-first, the
+        generated minimal hitting sets are then all the ones with at most
+        `completed_cardinality` elements, plus the ones found with more
+        elements; `frontier_size` is the amount of nodes left to process.
 
         Returns:
             float: elapsed execution time in seconds.
         """
         start_time = time.time()
         self.reset()
+        self._set_max_cardinality(max_cardinality)
+        self._set_limits(timeout, max_nodes)
+        self._solve_options = dict(prune=prune, sort=sort,
+                                   vectorize=vectorize,
+                                   max_cardinality=max_cardinality,
+                                   subsume=subsume, kernelize=kernelize,
+                                   timeout=timeout, max_nodes=max_nodes)
         if self.list_of_conflicts:
-            self._prepare_to_process_nodes(sort)
+            self._prepare_to_process_nodes(sort, subsume, kernelize)
             if sort:
                 prune = False
-            self._process_nodes(prune)
+            for _ in self._process_nodes(prune, vectorize):
+                pass
+            self._working_list_of_conflicts = None  # To reduce used memory
+            self._level_batch = None
+        return time.time() - start_time
+
+    def iter_solve(self, prune=True, sort=False, vectorize=False,
+                   max_cardinality=None, subsume=False, kernelize=False, *,
+                   timeout=None, max_nodes=None):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts lazily, providing each minimal hitting set as
+        soon as its node is ticked.
+
+        The DAG is constructed only while the generator is consumed, so
+        stopping the iteration early also stops the construction.
+        Every provided set is checked to be a minimal hitting set of the
+        list of conflicts and is provided only once, even if pruning
+        removes its node and a new node with the same path is ticked later.
+
+        Args:
+            prune (bool): same as in `solve()`.
+            sort (bool): same as in `solve()`.
+            vectorize (bool): same as in `solve()`.
+            max_cardinality (int): same as in `solve()`.
+            subsume (bool): same as in `solve()`.
+            kernelize (bool): same as in `solve()`.
+            timeout (float): same as in `solve()`. The time spent by the
+                consumer between two solutions counts too.
+            max_nodes (int): same as in `solve()`.
+
+        Returns:
+            Generator[SolutionSet, None, None]: generator of the solutions
+                (minimal hitting sets) in order of discovery.
+        """
+        self.reset()
+        self._set_max_cardinality(max_cardinality)
+        self._set_limits(timeout, max_nodes)
+        self._solve_options = dict(prune=prune, sort=sort,
+                                   vectorize=vectorize,
+                                   max_cardinality=max_cardinality,
+                                   subsume=subsume, kernelize=kernelize,
+                                   timeout=timeout, max_nodes=max_nodes)
+        if not self.list_of_conflicts:
+            return
+        self._prepare_to_process_nodes(sort, subsume, kernelize)
+        if sort:
+            prune = False
+        provided_solutions = set()
+        verifier = verify.FamilyVerifier(self.list_of_conflicts)
+        for ticked_node in self._process_nodes(prune, vectorize):
+            for solution in self._lifted([self._solution_of(ticked_node)]):
+                frozen_solution = frozenset(solution)
+                if (frozen_solution not in provided_solutions
+                        and verifier.is_minimal_hitting(solution)):
+                    provided_solutions.add(frozen_solution)
+                    yield solution
+        self._working_list_of_conflicts = None  # To reduce used memory
+        self._level_batch = None
+
+    def add_conflict(self, conflict):
+        """
+        Appends a conflict to the list of conflicts and updates the already
+        constructed DAG, so the minimal hitting sets are the ones of the
+        extended list without solving again from scratch.
+
+        The minimal hitting sets of the extended list are the previous ones
+        hitting the new conflict and the minimal ones among the previous
+        ones extended with an element of the new conflict. So the ticked
+        nodes not hitting the new conflict are reopened, labelled with it and
+        expanded by one level, where the new nodes are ticked or closed.
+        Pruning is not needed for this expansion.
+
+        If nothing was solved yet, the conflict is just appended. If the
+        solving did not complete (e.g. `iter_solve()` was stopped) or the
+        conflicts were kernelized, it's run again from scratch with the
+        same options.
+
+        Args:
+            conflict (set): the conflict to add. The list of conflicts
+                passed to the constructor is not modified.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        if isinstance(self.list_of_conflicts, Generator):
+            self.list_of_conflicts = list(self.list_of_conflicts)
+        self.list_of_conflicts = list(self.list_of_conflicts or [])
+        self.list_of_conflicts.append(conflict)
+        if self._solve_options is None:
+            pass
+        elif not self._is_fully_constructed() or self._kernel is not None:
+            self.solve(**self._solve_options)
+        else:
+            self._clone_list_of_conflicts(sort=False)
+            # The same limits apply to this update, counted from now
+            self._set_limits(self._solve_options['timeout'],
+                             self._solve_options['max_nodes'])
+            if self._max_nodes is not None:
+                self._max_nodes += self.amount_of_nodes_constructed
+            ticked_nodes = [node
+                            for node in self.breadth_first_explore(self.root)
+                            if node.is_ticked]
+            for node in ticked_nodes:
+                if self._scan_for_disjoint_conflict(
+                        node.path_from_root) is not None:
+                    self._reopen(node)
+                    self._label_node(node)
+                    if self._may_expand(node):
+                        self._create_children_of_reopened(node)
+            for _ in self._process_nodes(prune=False):
+                pass
             self._working_list_of_conflicts = None  # To reduce used memory
         return time.time() - start_time
 
+    def _is_fully_constructed(self) -> bool:
+        return self.root is not None and not self.nodes_to_process
+
+    def _reopen(self, node: HsDagNode):
+        self._ticked_paths.discard(self._frozen(node.path_from_root))
+        node.untick()
+
+    def _create_children_of_reopened(self, node: HsDagNode):
+        # Nodes with the same path are already reused in a DAG
+        self._create_children(node)
+
+    def _set_max_cardinality(self, max_cardinality):
+        if max_cardinality is not None and max_cardinality < 0:
+            raise ValueError("The maximum cardinality must be non-negative.")
+        self._max_cardinality = max_cardinality
+
+    def _set_limits(self, timeout, max_nodes):
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout must be positive.")
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("The maximum amount of nodes must be positive.")
+        self._max_nodes = max_nodes
+        if timeout is None:
+            self._deadline = None
+        else:
+            self._deadline = time.perf_counter() + timeout
+
+    def _limit_reached(self) -> bool:
+        """Checks the limits before processing the next node, recording
+        the completed levels and the frontier if any is reached."""
+        if ((self._max_nodes is None
+             or self.amount_of_nodes_constructed < self._max_nodes)
+                and (self._deadline is None
+                     or time.perf_counter() < self._deadline)):
+            return False
+        self.is_complete = False
+        self.frontier_size = len(self.nodes_to_process)
+        self.completed_cardinality = min(
+            self._cardinality(node.path_from_root)
+            for node in self.nodes_to_process) - 1
+        return True
+
+    def _may_expand(self, node: HsDagNode) -> bool:
+        return (node.label is not None
+                and (self._max_cardinality is None
+                     or self._cardinality(node.path_from_root)
+                     < self._max_cardinality))
+
     def reset(self):
         self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._kernel = None
         self.nodes_to_process.clear()
         self.root = None
         self._working_list_of_conflicts = None
+        self._nodes_by_path.clear()
+        self._ticked_paths.clear()
+        self._nodes_by_label.clear()
+        self._labels_in_use.clear()
+        self._level_batch = None
+        self._solve_options = None
+        self._free_nodes.clear()
+        self._detached_nodes.clear()
+        self.stats.reset()
+        self._max_nodes = None
+        self._deadline = None
+        self.is_complete = True
+        self.completed_cardinality = None
+        self.frontier_size = 0
+
+    def _clone_list_of_conflicts(self, sort, subsume=False, kernelize=False):
+        super()._clone_list_of_conflicts(sort, subsume, kernelize)
+        self._working_list_of_conflicts = _WorkingConflicts(
+            map(self._encoded, self._working_list_of_conflicts),
+            self._frozen)
 
-    def _prepare_to_process_nodes(self, sort: bool):
-        self._clone_list_of_conflicts(sort)
-        self.root = HsDagNode()
-        self.amount_of_nodes_constructed += 1
+    @staticmethod
+    def _encoded(conflict):
+        """Conflict in the representation used by the nodes."""
+        return conflict
+
+    @staticmethod
+    def _frozen(elements):
+        """Hashable key of a path or a label, used by the indexes."""
+        return frozenset(elements)
+
+    def _prepare_to_process_nodes(self, sort: bool, subsume: bool = False,
+                                  kernelize: bool = False):
+        self._clone_list_of_conflicts(sort, subsume, kernelize)
+        self.root = self._new_node()
+        self._node_created(self.root.path_from_root)
         self.nodes_to_process.append(self.root)
+        self._nodes_by_path[self._frozen(self.root.path_from_root)] = \
+            self.root
 
-    def _process_nodes(self, prune: bool):
+    def _process_nodes(self, prune: bool, vectorize: bool = False):
+        """Generator processing the queued nodes, providing the ticked ones
+        after their processing."""
+        limited = self._max_nodes is not None or self._deadline is not None
         while self.nodes_to_process:
+            if limited and self._limit_reached():
+                return
+            if len(self.nodes_to_process) > self.stats.peak_frontier:
+                self.stats.peak_frontier = len(self.nodes_to_process)
             node_in_processing = self.nodes_to_process.popleft()
-            self._attempt_closing_node(node_in_processing)
-            if node_in_processing.is_closed:
-                self._remove_closed_node(node_in_processing)
-                continue
-            self._label_node(node_in_processing)
-            if not self.root.is_childless and prune:
-                self._prune(node_in_processing)
-                if node_in_processing.is_not_in_dag:
-                    continue
-            if node_in_processing.label is not None:
-                self._create_children(node_in_processing)
-
-    def _attempt_closing_node(self, node_in_processing: HsDagNode):
-        for other_node in self.breadth_first_explore(self.root):
-            if (other_node.path_from_root < node_in_processing.path_from_root
-                    and other_node.is_ticked):
-                node_in_processing.close()
+            if vectorize and (self._level_batch is None or
+                              node_in_processing not in self._level_batch):
+                self._level_batch = self._batch_level(node_in_processing)
+            self._process_node(node_in_processing, prune)
+            ticked_in_dag = (node_in_processing.is_ticked
+                             and self._is_in_dag(node_in_processing))
+            self._recycle_detached_nodes()
+            if ticked_in_dag:
+                yield node_in_processing
+
+    def _process_node(self, node_in_processing: HsDagNode, prune: bool):
+        timed = self.stats.time_phases
+        if timed:
+            phase_start = time.perf_counter()
+        self._attempt_closing_node(node_in_processing)
+        if timed:
+            phase_start = self.stats.add_phase_time('close', phase_start)
+        if node_in_processing.is_closed:
+            self._remove_closed_node(node_in_processing)
+            return
+        self._label_node(node_in_processing)
+        if timed:
+            phase_start = self.stats.add_phase_time('label', phase_start)
+        if not self.root.is_childless and prune:
+            self._prune(node_in_processing)
+            if timed:
+                phase_start = self.stats.add_phase_time('prune', phase_start)
+            if node_in_processing.is_not_in_dag:
+                self._detached_nodes[node_in_processing] = None
                 return
+        if self._may_expand(node_in_processing):
+            self._create_children(node_in_processing)
+        if timed:
+            self.stats.add_phase_time('expand', phase_start)
+
+    def _node_created(self, path_from_root):
+        self.amount_of_nodes_constructed += 1
+        if self.hooks.on_node_created is not None:
+            self.hooks.on_node_created(self._decoded(path_from_root))
+
+    def _new_node(self) -> HsDagNode:
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            node.reinitialize()
+            return node
+        return self._node_class()
+
+    def _recycle_detached_nodes(self):
+        """Moves the nodes removed from the DAG to the free nodes, once they
+        are no longer referenced by the solver. Detached nodes that were not
+        processed yet are still in the queue of nodes to process."""
+        for node in self._detached_nodes:
+            if node.is_closed or node.is_ticked or node.label is not None:
+                if self._level_batch is not None:
+                    self._level_batch.discard(node)
+                self._free_nodes.append(node)
+        self._detached_nodes.clear()
+
+    def _batch_level(self, first_node: HsDagNode):
+        from . import vectorized
+        cardinality = self._cardinality(first_node.path_from_root)
+        level = [first_node]
+        for node in self.nodes_to_process:
+            if self._cardinality(node.path_from_root) != cardinality:
+                break
+            level.append(node)
+        return vectorized.LevelBatch(level,
+                                     self._working_list_of_conflicts.items(),
+                                     self._ticked_paths,
+                                     self._elements_of)
+
+    @staticmethod
+    def _cardinality(elements):
+        return len(elements)
 
     @staticmethod
-    def _remove_closed_node(node: HsDagNode):
+    def _path_with(path_from_root, conflict):
+        return path_from_root.union([conflict])
+
+    @staticmethod
+    def _elements_of(elements):
+        return elements
+
+    def _attempt_closing_node(self, node_in_processing: HsDagNode):
+        self.stats.close_attempts += 1
+        if (self._level_batch is not None and
+                not self._level_batch.may_be_closed(node_in_processing)):
+            return
+        if self._ticked_paths.has_subset_of(node_in_processing.path_from_root,
+                                            strict=True):
+            node_in_processing.close()
+            self.stats.closings += 1
+            if self.hooks.on_node_closed is not None:
+                self.hooks.on_node_closed(
+                    self._decoded(node_in_processing.path_from_root))
+
+    def _remove_closed_node(self, node: HsDagNode):
         for conflict, parent in node.parents.items():
             parent.children.pop(conflict)
         node.parents.clear()
+        self._forget_node(node)
+        self._detached_nodes[node] = None
+
+    def _forget_node(self, node: HsDagNode):
+        """Removes a node that is no longer part of the DAG from the index
+        of the nodes by their path from the root and from the ticked
+        paths."""
+        path = self._frozen(node.path_from_root)
+        if self._nodes_by_path.get(path) is node:
+            del self._nodes_by_path[path]
+        if node.is_ticked:
+            self._ticked_paths.discard(path)
+        else:
+            self._unindex_label(node)
+
+    def _is_in_dag(self, node: HsDagNode):
+        return node is self.root or not node.is_orphan
+
+    def _set_label(self, node: HsDagNode, new_label):
+        self._unindex_label(node)
+        node.label = new_label
+        if self._is_in_dag(node):
+            label = self._frozen(new_label)
+            nodes_with_label = self._nodes_by_label.get(label)
+            if nodes_with_label is None:
+                nodes_with_label = self._nodes_by_label[label] = dict()
+                self._labels_in_use.add(label)
+            nodes_with_label[node] = None  # Used as insertion-ordered set
+
+    def _unindex_label(self, node: HsDagNode):
+        if node.label is None:
+            return
+        label = self._frozen(node.label)
+        nodes_with_label = self._nodes_by_label.get(label)
+        if nodes_with_label is not None and node in nodes_with_label:
+            del nodes_with_label[node]
+            if not nodes_with_label:
+                del self._nodes_by_label[label]
+                self._labels_in_use.discard(label)
 
     def _label_node(self, node_in_processing: HsDagNode):
-        for conflict_set in self._working_list_of_conflicts:
-            if conflict_set.isdisjoint(node_in_processing.path_from_root):
-                node_in_processing.label = conflict_set
-                return
+        conflict_set = self._disjoint_conflict(node_in_processing)
+        if conflict_set is not None:
+            self._set_label(node_in_processing, conflict_set)
+            return
         node_in_processing.tick()
+        if self._is_in_dag(node_in_processing):
+            self._ticked_paths.add(node_in_processing.path_from_root)
+        if self.hooks.on_node_ticked is not None:
+            self.hooks.on_node_ticked(
+                self._decoded(node_in_processing.path_from_root))
+
+    def _disjoint_conflict(self, node_in_processing: HsDagNode):
+        """First working conflict disjoint from the path of the node,
+        None if the path hits all of them."""
+        if self._level_batch is not None:
+            position = self._level_batch.label_position(node_in_processing)
+            if position is None:
+                return None
+            conflict_set = self._working_list_of_conflicts.get(position)
+            if conflict_set is not None:
+                return conflict_set
+            # Label retired while processing the level: search again
+        return self._scan_for_disjoint_conflict(
+            node_in_processing.path_from_root)
+
+    def _scan_for_disjoint_conflict(self, path_from_root):
+        self.stats.label_scans += 1
+        examined = 0
+        for examined, conflict_set in enumerate(
+                self._working_list_of_conflicts, 1):
+            if conflict_set.isdisjoint(path_from_root):
+                self.stats.conflicts_examined += examined
+                return conflict_set
+        self.stats.conflicts_examined += examined
+        return None
 
     def _prune(self, node_in_processing: HsDagNode):
+        self.stats.prune_invocations += 1
         if not self._label_was_previously_used(node_in_processing):
-            for other_node in list(self.breadth_first_explore(self.root)):
-                if (other_node.label is not None
-                        and node_in_processing.label < other_node.label):
-                    self._relabel_and_trim(node_in_processing, other_node)
+            nodes_with_larger_labels = [
+                other_node
+                for larger_label in self._labels_in_use.supersets_of(
+                    node_in_processing.label, strict=True)
+                for other_node in self._nodes_by_label[larger_label]]
+            self.stats.relabels += len(nodes_with_larger_labels)
+            for other_node in nodes_with_larger_labels:
+                self._relabel_and_trim(node_in_processing, other_node)
 
     def _label_was_previously_used(self, node_in_processing: HsDagNode):
         if node_in_processing.label is None:
             return True
-        for node in self.breadth_first_explore(self.root):
-            if (node_in_processing is not node
-                    and node_in_processing.label == node.label):
+        nodes_with_label = self._nodes_by_label.get(
+            self._frozen(node_in_processing.label), ())
+        for node in nodes_with_label:
+            if node_in_processing is not node:
                 return True
         return False
 
@@ -213,13 +694,10 @@ class HsDag(mhs.MinimalHittingSetsProblem):
                           other_node: HsDagNode):
         difference = other_node.label.difference(node_in_processing.label)
         previous_label = other_node.label
-        other_node.label = node_in_processing.label
+        self._set_label(other_node, node_in_processing.label)
         for conflict in difference:
             self._trim_subdag(other_node, conflict)
-            try:
-                self._working_list_of_conflicts.remove(previous_label)
-            except ValueError as label_not_in_conflicts:
-                pass
+            self._working_list_of_conflicts.retire(previous_label)
 
     def _trim_subdag(self, parent_node: HsDagNode, edge_to_trim):
         try:
@@ -227,11 +705,19 @@ class HsDag(mhs.MinimalHittingSetsProblem):
             subdag_root_to_remove.parents.pop(edge_to_trim)
         except KeyError:
             return
-        for subdag_node in list(
-                self.breadth_first_explore(subdag_root_to_remove)):
+        subdag_nodes = list(self.breadth_first_explore(subdag_root_to_remove))
+        self.stats.trims += 1
+        self.stats.trimmed_nodes += len(subdag_nodes)
+        if len(subdag_nodes) > self.stats.largest_trim:
+            self.stats.largest_trim = len(subdag_nodes)
+        for subdag_node in subdag_nodes:
             self._unlink_immediate_children_from_parent(subdag_node)
             if subdag_node.is_orphan:
-                del subdag_node
+                self._forget_node(subdag_node)
+                self._detached_nodes[subdag_node] = None
+                if self.hooks.on_node_pruned is not None:
+                    self.hooks.on_node_pruned(
+                        self._decoded(subdag_node.path_from_root))
 
     @staticmethod
     def _unlink_immediate_children_from_parent(generation_parent):
@@ -279,12 +765,14 @@ class HsDag(mhs.MinimalHittingSetsProblem):
 
     def _edge_termination(self, node_in_processing: HsDagNode, conflict
                           ) -> HsDagNode:
-        path_with_conflict = node_in_processing.path_from_root.union(
-            [conflict])
-        for other_node in self.breadth_first_explore(self.root):
-            if other_node.path_from_root == path_with_conflict:
-                return other_node
-        self.amount_of_nodes_constructed += 1
-        new_node = HsDagNode()
+        path_with_conflict = self._frozen(
+            self._path_with(node_in_processing.path_from_root, conflict))
+        existing_node = self._nodes_by_path.get(path_with_conflict)
+        if existing_node is not None:
+            self.stats.node_reuses += 1
+            return existing_node
+        self._node_created(path_with_conflict)
+        new_node = self._new_node()
         self.nodes_to_process.append(new_node)
+        self._nodes_by_path[path_with_conflict] = new_node
         return new_node
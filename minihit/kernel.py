@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import itertools
+from typing import Generator, List
+
+from . import mhs
+
+
+class Kernel(object):
+    """
+    Reduction of a list of conflicts to a smaller one, whose minimal hitting
+    sets can be lifted back to the ones of the original list.
+
+    Two rules are applied:
+
+    - forced elements: the element of a conflict with a single element is
+      in every minimal hitting set, so it's removed together with every
+      conflict it hits. Every lifted solution contains all of them.
+    - dominated elements: an element contained in exactly the same
+      conflicts as another one (each dominates the other) can replace it in
+      any minimal hitting set, while they are never in the same one.
+      So only the first one of them is kept as representative. Every
+      lifted solution containing a representative is expanded into one
+      solution for each element dominated by it, replacing it.
+
+    Strict domination (the conflicts of an element being a strict subset of
+    the conflicts of another one) is not applied, as it preserves only the
+    minimal hitting sets of minimum cardinality, not all of them.
+    """
+
+    def __init__(self, list_of_conflicts: List[set]):
+        """
+        Reduces the list of conflicts.
+
+        Args:
+            list_of_conflicts (List[set]): conflicts to reduce. This input
+                list is never modified.
+        """
+        self.forced_elements = mhs.SolutionSet()
+        for conflict in list_of_conflicts:
+            if len(conflict) == 1:
+                self.forced_elements.update(conflict)
+        remaining_conflicts = [conflict for conflict in list_of_conflicts
+                               if self.forced_elements.isdisjoint(conflict)]
+        positions_by_element = dict()
+        for position, conflict in enumerate(remaining_conflicts):
+            for element in conflict:
+                positions_by_element.setdefault(element, []).append(position)
+        representative_by_positions = dict()
+        self.dominated_elements = dict()  # By representative
+        removed_elements = set()
+        for element, positions in positions_by_element.items():
+            representative = representative_by_positions.setdefault(
+                tuple(positions), element)
+            if representative != element:
+                self.dominated_elements.setdefault(
+                    representative, []).append(element)
+                removed_elements.add(element)
+        self.list_of_conflicts = [
+            conflict if removed_elements.isdisjoint(conflict)
+            else conflict.difference(removed_elements)
+            for conflict in remaining_conflicts]
+
+    def lifted(self, solution: mhs.SolutionSet
+               ) -> Generator[mhs.SolutionSet, None, None]:
+        """
+        Provides the minimal hitting sets of the original list of conflicts
+        corresponding to a minimal hitting set of the reduced one.
+
+        Args:
+            solution (SolutionSet): minimal hitting set of the reduced list
+                of conflicts.
+
+        Returns:
+            Generator[SolutionSet, None, None]: generator of the minimal
+                hitting sets of the original list of conflicts, starting
+                with the one containing the representatives.
+        """
+        for elements in itertools.product(*self.classes_of(solution)):
+            yield mhs.SolutionSet(elements)
+
+    def classes_of(self, solution: mhs.SolutionSet) -> List[list]:
+        """
+        Provides the minimal hitting sets of the original list of conflicts
+        corresponding to a minimal hitting set of the reduced one in
+        compressed form: every choice of one element from each class is one
+        of them.
+
+        Args:
+            solution (SolutionSet): minimal hitting set of the reduced list
+                of conflicts.
+
+        Returns:
+            List[list]: the classes, each one with a representative and the
+                elements dominated by it, followed by a class for each
+                forced element.
+        """
+        classes = [[element] + self.dominated_elements.get(element, [])
+                   for element in solution]
+        classes.extend([element] for element in self.forced_elements)
+        return classes
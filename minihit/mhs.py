@@ -6,7 +6,9 @@
 # This file is part of the MiniHit project which is released under
 # the BSD 3-clause license.
 import abc
-from typing import Generator
+from typing import Generator, List
+
+from . import settrie, verify
 
 
 class SolutionSet(set):
@@ -43,7 +45,11 @@ class SolutionSet(set):
         A hitting set of a collection of sets has a non-empty intersection
         with each set in the collection. A minimal hitting set is a hitting
         set that has no subsets that are still hitting sets for the same
-        collection.
+        collection, so each of its elements is the only one hitting at least
+        one set of the collection.
+
+        To check many sets against the same collection, `FamilyVerifier`
+        is faster.
 
         Args:
             sets (Iterable[set]): the collection to check against.
@@ -53,18 +59,48 @@ class SolutionSet(set):
         """
         if len(self) == 0:
             return False
-        used_elements = set()
+        elements_hitting_alone = set()
         for other_set in sets:
             intersection = self.intersection(other_set)
-            used_elements.update(intersection)
             if not intersection:
                 return False
-        return used_elements == self
+            if len(intersection) == 1:
+                elements_hitting_alone.update(intersection)
+        return len(elements_hitting_alone) == len(self)
 
     def __repr__(self):
         return '{' + ', '.join(map(str, self)) + '}'
 
 
+def remove_redundant_conflicts(list_of_conflicts: List[set]) -> List[set]:
+    """
+    Removes the duplicate conflicts and the conflicts that are strict
+    supersets of other conflicts, as every set hitting a conflict also hits
+    its supersets. The minimal hitting sets are therefore unchanged.
+
+    The conflicts are inserted into a set-trie from the smallest, so each
+    one is checked against the kept ones with a single subset query.
+
+    Args:
+        list_of_conflicts (List[set]): the conflicts to reduce. This input
+            list is never modified.
+
+    Returns:
+        List[set]: the kept conflicts, in their original order.
+    """
+    kept_conflicts = settrie.SetTrie()
+    is_kept = [False] * len(list_of_conflicts)
+    for position in sorted(range(len(list_of_conflicts)),
+                           key=lambda position: len(
+                               list_of_conflicts[position])):
+        conflict = list_of_conflicts[position]
+        if not kept_conflicts.has_subset_of(conflict):
+            kept_conflicts.add(conflict)
+            is_kept[position] = True
+    return [conflict
+            for conflict, kept in zip(list_of_conflicts, is_kept) if kept]
+
+
 class MinimalHittingSetsProblem(abc.ABC):
     """
     Representation of a minimal hitting set problem with a solver algorithm
@@ -83,16 +119,93 @@ class MinimalHittingSetsProblem(abc.ABC):
         self._working_list_of_conflicts = None
         self.list_of_conflicts = list_of_conflicts
         self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._max_cardinality = None
+        self._kernel = None
 
-    def _clone_list_of_conflicts(self, sort):
+    def _clone_list_of_conflicts(self, sort, subsume=False, kernelize=False):
+        if isinstance(self.list_of_conflicts, Generator):
+            self.list_of_conflicts = list(self.list_of_conflicts)
+        if subsume:
+            working_list_of_conflicts = remove_redundant_conflicts(
+                self.list_of_conflicts)
+            self.amount_of_conflicts_removed = \
+                len(self.list_of_conflicts) - len(working_list_of_conflicts)
+        else:
+            working_list_of_conflicts = self.list_of_conflicts.copy()
+            self.amount_of_conflicts_removed = 0
+        if kernelize:
+            from . import kernel
+            self._kernel = kernel.Kernel(working_list_of_conflicts)
+            working_list_of_conflicts = self._kernel.list_of_conflicts
+            if self._max_cardinality is not None:
+                self._max_cardinality -= len(self._kernel.forced_elements)
+        else:
+            self._kernel = None
         if sort:
             # noinspection PyTypeChecker
-            self._working_list_of_conflicts = sorted(self.list_of_conflicts,
-                                                    key=len)
-        else:
-            if isinstance(self.list_of_conflicts, Generator):
-                self.list_of_conflicts = list(self.list_of_conflicts)
-            self._working_list_of_conflicts = self.list_of_conflicts.copy()
+            working_list_of_conflicts.sort(key=len)
+        self._working_list_of_conflicts = working_list_of_conflicts
+
+    def _lifted(self, solutions):
+        """Generator of the minimal hitting sets of the list of conflicts
+        from the ones of the kernel, if the conflicts were kernelized."""
+        if self._kernel is None:
+            yield from solutions
+        elif self._kernel_may_have_solutions():
+            for solution in solutions:
+                yield from self._kernel.lifted(solution)
+
+    def _kernel_may_have_solutions(self) -> bool:
+        # The forced elements alone may exceed the maximum cardinality
+        return self._max_cardinality is None or self._max_cardinality >= 0
+
+    def _kernel_solutions(self):
+        """Generator of the minimal hitting sets of the working list of
+        conflicts, which is the kernel if the conflicts were kernelized.
+        Solvers not supporting the kernelization provide the solutions."""
+        return self.generate_minimal_hitting_sets()
+
+    def generate_minimal_hitting_set_classes(self):
+        """
+        Provides a generator of the minimal hitting sets computed by the
+        solving algorithm in compressed form, without expanding them.
+
+        Each compressed minimal hitting set is a list of classes of
+        interchangeable elements: every choice of one element from each
+        class is a minimal hitting set. The classes have more than one
+        element only for the elements contained in exactly the same
+        conflicts of a kernelized list of conflicts (see `kernel.Kernel`),
+        with the element used by the solver first.
+
+        Run `solve()` first to obtain any results.
+
+        Returns:
+            Generator[List[list], None, None]: generator of the lists of
+                classes of each minimal hitting set.
+        """
+        if self._kernel is None:
+            for solution in self._kernel_solutions():
+                yield [[element] for element in solution]
+        elif self._kernel_may_have_solutions():
+            for solution in self._kernel_solutions():
+                yield self._kernel.classes_of(solution)
+
+    def count_minimal_hitting_sets(self) -> int:
+        """
+        Counts the minimal hitting sets computed by the solving algorithm
+        from their compressed form, without expanding them.
+
+        Returns:
+            int: amount of minimal hitting sets.
+        """
+        amount = 0
+        for classes in self.generate_minimal_hitting_set_classes():
+            amount_for_classes = 1
+            for elements in classes:
+                amount_for_classes *= len(elements)
+            amount += amount_for_classes
+        return amount
 
     @abc.abstractmethod
     def solve(self, **kwargs):
@@ -108,6 +221,25 @@ class MinimalHittingSetsProblem(abc.ABC):
         """
         pass
 
+    def iter_solve(self, **kwargs):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts, providing each minimal hitting set as soon as
+        it is available.
+
+        Solvers that can find the solutions incrementally override this
+        method to stop working as soon as the iteration is stopped.
+
+        Args:
+            **kwargs: arguments the solving algorithm may take.
+
+        Returns:
+            Generator[SolutionSet, None, None]: generator of the solutions
+                (minimal hitting sets) of the list of conflicts.
+        """
+        self.solve(**kwargs)
+        yield from self.generate_minimal_hitting_sets()
+
     @abc.abstractmethod
     def reset(self):
         """
@@ -138,11 +270,10 @@ class MinimalHittingSetsProblem(abc.ABC):
 
         Returns:
             bool: True if the verification is successful, False otherwise.
+            Also False if a minimal hitting set is provided more than once.
         """
-        for mhs_candidate in self.generate_minimal_hitting_sets():
-            if not mhs_candidate.is_minimal_hitting(self.list_of_conflicts):
-                return False
-        return True
+        return verify.FamilyVerifier(self.list_of_conflicts).is_valid(
+            self.generate_minimal_hitting_sets())
 
     @abc.abstractmethod
     def render(self, out_file=None):
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import time
+
+from . import mhs
+
+
+class Mmcs(mhs.MinimalHittingSetsProblem):
+    """
+    Minimal hitting sets solver based on the MMCS algorithm by Murakami and
+    Uno, a depth-first search extending a candidate hitting set one element
+    at a time, without constructing a DAG.
+
+    For each element of the candidate it keeps its critical conflicts (hit
+    only by that element) and the set of the conflicts not hit yet. An
+    element is added only if every element of the candidate still has a
+    critical conflict, so only minimal hitting sets are ever found and each
+    of them only once.
+    """
+
+    def __init__(self, list_of_conflicts=None):
+        super().__init__(list_of_conflicts)
+        self._solutions = []
+        self._max_cardinality = None
+        self._conflicts_by_element = dict()
+        self._order_of_elements = dict()
+        self._uncovered = set()
+        self._critical = dict()
+        self._hitting = []  # Amount of candidate elements in each conflict
+
+    def generate_minimal_hitting_sets(self):
+        yield from self._lifted(self._kernel_solutions())
+
+    def _kernel_solutions(self):
+        return iter(self._solutions)
+
+    def render(self, out_file=None):
+        """MMCS constructs no graph, so there is nothing to render."""
+        pass
+
+    def solve(self, prune=True, sort=False, vectorize=False,
+              max_cardinality=None, subsume=False, kernelize=False):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts.
+
+        Args:
+            prune (bool): unused, as MMCS never constructs non-minimal
+                candidates. Accepted for compatibility with `HsDag.solve()`.
+            sort (bool): sorts the list of conflicts by cardinality of the
+                conflicts before executing the solving algorithm. It only
+                affects the order in which the minimal hitting sets are
+                found.
+            vectorize (bool): unused, as MMCS extends one candidate at a
+                time. Accepted for compatibility with `HsDag.solve()`.
+            max_cardinality (int): maximum cardinality of the minimal
+                hitting sets to find. Candidates of this cardinality are not
+                extended. None to find all of them.
+            subsume (bool): same as in `HsDag.solve()`.
+            kernelize (bool): same as in `HsDag.solve()`.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        start_time = time.time()
+        for _ in self.iter_solve(prune, sort, vectorize, max_cardinality,
+                                 subsume, kernelize):
+            pass
+        return time.time() - start_time
+
+    def iter_solve(self, prune=True, sort=False, vectorize=False,
+                   max_cardinality=None, subsume=False, kernelize=False):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts lazily, providing each minimal hitting set as
+        soon as it is found.
+
+        Stopping the iteration early also stops the search.
+
+        Args:
+            prune (bool): same as in `solve()`.
+            sort (bool): same as in `solve()`.
+            vectorize (bool): same as in `solve()`.
+            max_cardinality (int): same as in `solve()`.
+            subsume (bool): same as in `solve()`.
+            kernelize (bool): same as in `solve()`.
+
+        Returns:
+            Generator[SolutionSet, None, None]: generator of the solutions
+                (minimal hitting sets) in order of discovery.
+        """
+        self.reset()
+        if max_cardinality is not None and max_cardinality < 0:
+            raise ValueError("The maximum cardinality must be non-negative.")
+        self._max_cardinality = max_cardinality
+        if not self.list_of_conflicts:
+            return
+        self._clone_list_of_conflicts(sort, subsume, kernelize)
+        for position, conflict in enumerate(self._working_list_of_conflicts):
+            for element in conflict:
+                self._conflicts_by_element.setdefault(
+                    element, []).append(position)
+        self._order_of_elements = {
+            element: order
+            for order, element in enumerate(self._conflicts_by_element)}
+        self._uncovered = set(range(len(self._working_list_of_conflicts)))
+        self._hitting = [0] * len(self._working_list_of_conflicts)
+        yield from self._lifted(self._extend(
+            mhs.SolutionSet(), set(self._conflicts_by_element)))
+        self._working_list_of_conflicts = None  # To reduce used memory
+
+    def reset(self):
+        self.amount_of_nodes_constructed = 0
+        self.amount_of_conflicts_removed = 0
+        self._kernel = None
+        self._working_list_of_conflicts = None
+        self._solutions = []
+        self._max_cardinality = None
+        self._conflicts_by_element = dict()
+        self._order_of_elements = dict()
+        self._uncovered = set()
+        self._critical = dict()
+        self._hitting = []
+
+    def _extend(self, candidate: mhs.SolutionSet, elements_to_add: set):
+        """Generator of the minimal hitting sets that are supersets of the
+        candidate, extending it only with the elements to add."""
+        self.amount_of_nodes_constructed += 1
+        if not self._uncovered:
+            solution = mhs.SolutionSet(candidate)
+            self._solutions.append(solution)
+            yield solution
+            return
+        if (self._max_cardinality is not None
+                and len(candidate) >= self._max_cardinality):
+            return
+        # Branching on the uncovered conflict with the fewest elements to
+        # add keeps the search tree narrow
+        conflict = min(self._uncovered, key=lambda position: len(
+            elements_to_add.intersection(
+                self._working_list_of_conflicts[position])))
+        branching_elements = elements_to_add.intersection(
+            self._working_list_of_conflicts[conflict])
+        elements_to_add.difference_update(branching_elements)
+        for element in sorted(branching_elements,
+                              key=self._order_of_elements.get):
+            no_longer_critical = self._add(candidate, element)
+            if (self._critical[element] and
+                    all(self._critical[other]
+                        for other, _ in no_longer_critical)):
+                yield from self._extend(candidate, elements_to_add)
+            self._remove(candidate, element, no_longer_critical)
+            elements_to_add.add(element)
+
+    def _add(self, candidate: mhs.SolutionSet, element):
+        """Adds the element to the candidate, updating the uncovered and
+        critical conflicts. Provides the pairs of candidate element and
+        conflict that stopped being critical for it."""
+        no_longer_critical = []
+        self._critical[element] = set()
+        for position in self._conflicts_by_element[element]:
+            self._hitting[position] += 1
+            if self._hitting[position] == 1:
+                self._uncovered.remove(position)
+                self._critical[element].add(position)
+            elif self._hitting[position] == 2:
+                for other in candidate:
+                    if position in self._critical[other]:
+                        self._critical[other].remove(position)
+                        no_longer_critical.append((other, position))
+                        break
+        candidate.add(element)
+        return no_longer_critical
+
+    def _remove(self, candidate: mhs.SolutionSet, element,
+                no_longer_critical: list):
+        """Undoes `_add()`."""
+        candidate.remove(element)
+        for position in self._conflicts_by_element[element]:
+            self._hitting[position] -= 1
+            if self._hitting[position] == 0:
+                self._uncovered.add(position)
+        for other, position in no_longer_critical:
+            self._critical[other].add(position)
+        del self._critical[element]
@@ -6,15 +6,33 @@
 # This file is part of the MiniHit project which is released under
 # the BSD 3-clause license.
 
+import concurrent.futures
 import queue
+import time
 from typing import List
 
-from . import hsdag
+from . import hsdag, mhs, settrie
+
+
+def _solve_subtree(engine_class, list_of_conflicts: List[set],
+                   solve_options: dict):
+    """Solves the subproblem of a subtree in a worker process, providing
+    the minimal hitting sets and the amount of nodes constructed."""
+    engine = engine_class(list_of_conflicts)
+    engine.solve(**solve_options)
+    return ([frozenset(solution)
+             for solution in engine.generate_minimal_hitting_sets()],
+            engine.amount_of_nodes_constructed)
 
 
 class RcTreeNode(hsdag.HsDagNode):
-    def __init__(self):
-        super().__init__()
+    __slots__ = ('theta_c', 'theta')
+
+    def reinitialize(self):
+        super().reinitialize()
+        self.allow_all_edges()
+
+    def allow_all_edges(self):
         self.theta_c = set()
         self.theta = set()
 
@@ -53,29 +71,199 @@ class RcTreeNode(hsdag.HsDagNode):
 
 
 class RcTree(hsdag.HsDag):
+    _node_class = RcTreeNode
+
     def __init__(self, list_of_conflicts: List[set] = None):
         super().__init__(list_of_conflicts)
+        self._subtree_solutions = None
+        self._reopened_paths = None
+
+    def _kernel_solutions(self):
+        if self._subtree_solutions is None:
+            return super()._kernel_solutions()
+        else:
+            return iter(self._subtree_solutions)
+
+    def solve(self, prune=True, sort=False, vectorize=False,
+              max_cardinality=None, subsume=False, kernelize=False, *,
+              workers=None, timeout=None, max_nodes=None):
+        """
+        Runs the algorithm that finds the minimal hitting sets for the
+        list of conflicts.
+
+        Args:
+            prune (bool): same as in `HsDag.solve()`.
+            sort (bool): same as in `HsDag.solve()`.
+            vectorize (bool): same as in `HsDag.solve()`.
+            max_cardinality (int): same as in `HsDag.solve()`.
+            subsume (bool): same as in `HsDag.solve()`. Also applied to the
+                conflicts of each subtree solved in parallel.
+            kernelize (bool): same as in `HsDag.solve()`. Only the conflicts
+                are kernelized, not the ones of each subtree.
+            workers (int): keyword-only, amount of processes solving the
+                subtrees in parallel. The first level of the tree, or the
+                first two if the first one has less nodes than workers, is
+                constructed in this process. The subtree of each node at
+                the bottom of it is then solved by a separate RC-Tree in a
+                process pool and the results are merged, keeping only the
+                minimal ones. The constructed tree contains only the first
+                levels. None or 1 to construct the whole tree in this
+                process.
+            timeout (float): same as in `HsDag.solve()`. Not supported with
+                multiple workers.
+            max_nodes (int): same as in `HsDag.solve()`. Not supported with
+                multiple workers.
+
+        Returns:
+            float: elapsed execution time in seconds.
+        """
+        if workers is None or workers == 1:
+            return super().solve(prune, sort, vectorize, max_cardinality,
+                                 subsume, kernelize, timeout=timeout,
+                                 max_nodes=max_nodes)
+        if workers < 1:
+            raise ValueError("The amount of workers must be positive.")
+        if timeout is not None or max_nodes is not None:
+            raise ValueError("The limits are not supported with multiple "
+                             "workers.")
+        start_time = time.time()
+        self.reset()
+        self._set_max_cardinality(max_cardinality)
+        self._solve_options = dict(prune=prune, sort=sort,
+                                   vectorize=vectorize,
+                                   max_cardinality=max_cardinality,
+                                   subsume=subsume, kernelize=kernelize,
+                                   workers=workers, timeout=timeout,
+                                   max_nodes=max_nodes)
+        if self.list_of_conflicts:
+            self._prepare_to_process_nodes(sort, subsume, kernelize)
+            self._construct_levels(1)
+            if len(self.nodes_to_process) < workers:
+                self._construct_levels(2)
+            self._solve_subtrees_in_parallel(
+                workers, dict(prune=prune, sort=sort, vectorize=vectorize,
+                              subsume=subsume))
+            self._working_list_of_conflicts = None  # To reduce used memory
+        return time.time() - start_time
 
-    def _prepare_to_process_nodes(self, sort: bool):
-        self._clone_list_of_conflicts(sort)
-        self.root = RcTreeNode()
-        self.amount_of_nodes_constructed += 1
-        self.nodes_to_process.append(self.root)
+    def _construct_levels(self, amount_of_levels: int):
+        # No pruning: relabelling would change the thetas of the nodes
+        # at the bottom, whose subtrees are solved separately
+        while (self.nodes_to_process and
+               self._cardinality(self.nodes_to_process[0].path_from_root)
+               < amount_of_levels):
+            if len(self.nodes_to_process) > self.stats.peak_frontier:
+                self.stats.peak_frontier = len(self.nodes_to_process)
+            self._process_node(self.nodes_to_process.popleft(), prune=False)
+            self._recycle_detached_nodes()
+
+    def _solve_subtrees_in_parallel(self, workers: int, solve_options: dict):
+        """
+        The subtree of a node contains the minimal hitting sets that are
+        supersets of its path and contain no element of its theta, so it is
+        equivalent to a tree solving the conflicts not hit by the path,
+        without the elements of theta.
+        """
+        solutions = [mhs.SolutionSet(self._solution_of(node))
+                     for node in self.breadth_first_explore(self.root)
+                     if node.is_ticked]
+        if self._kernel is None:
+            list_of_conflicts = self.list_of_conflicts
+        else:
+            list_of_conflicts = self._kernel.list_of_conflicts
+        paths = []
+        subproblems = []
+        while self.nodes_to_process:
+            node = self.nodes_to_process.popleft()
+            path = self._solution_of(node)
+            excluded_elements = self._excluded_elements(node)
+            subproblem = []
+            for conflict in list_of_conflicts:
+                if path.isdisjoint(conflict):
+                    subproblem.append(set(conflict).difference(
+                        excluded_elements))
+            if not all(subproblem):
+                continue  # A conflict can't be hit in this subtree
+            if not subproblem:
+                solutions.append(path)
+                continue
+            paths.append(path)
+            subproblems.append(subproblem)
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = []
+            for path, subproblem in zip(paths, subproblems):
+                options = dict(solve_options)
+                if self._max_cardinality is not None:
+                    options['max_cardinality'] = \
+                        self._max_cardinality - len(path)
+                futures.append(executor.submit(
+                    _solve_subtree, type(self), subproblem, options))
+            for path, future in zip(paths, futures):
+                subtree_solutions, amount_of_nodes = future.result()
+                self.amount_of_nodes_constructed += amount_of_nodes
+                for subtree_solution in subtree_solutions:
+                    solutions.append(mhs.SolutionSet(
+                        path.union(subtree_solution)))
+        candidates = settrie.SetTrie(solutions)
+        provided_solutions = set()
+        self._subtree_solutions = []
+        for solution in solutions:
+            frozen_solution = frozenset(solution)
+            if (frozen_solution not in provided_solutions and
+                    not candidates.has_subset_of(solution, strict=True)):
+                provided_solutions.add(frozen_solution)
+                self._subtree_solutions.append(solution)
+
+    @staticmethod
+    def _excluded_elements(node: RcTreeNode):
+        return node.theta
+
+    def reset(self):
+        super().reset()
+        self._subtree_solutions = None
+
+    def _is_fully_constructed(self) -> bool:
+        return (self._subtree_solutions is None and
+                super()._is_fully_constructed())
 
     def _relabel_and_trim(self, node_in_processing: RcTreeNode,
                           other_node: RcTreeNode):
         difference = other_node.label.difference(node_in_processing.label)
         previous_label = other_node.label
-        other_node.label = node_in_processing.label
+        self._set_label(other_node, node_in_processing.label)
         for conflict in difference:
             other_node.theta_c.discard(conflict)
             self._trim_subdag(other_node, conflict)
         self._propagate_thetas_changes(other_node, difference)
         self._create_newly_allowed_descendants(other_node)
+        self._working_list_of_conflicts.retire(previous_label)
+
+    def add_conflict(self, conflict):
+        # Paths of the nodes created by the reopened ones during the update
+        self._reopened_paths = set()
         try:
-            self._working_list_of_conflicts.remove(previous_label)
-        except ValueError as label_not_in_conflicts:
-            pass
+            return super().add_conflict(conflict)
+        finally:
+            self._reopened_paths = None
+
+    def _reopen(self, node: RcTreeNode):
+        super()._reopen(node)
+        node.allow_all_edges()
+
+    def _create_children_of_reopened(self, node: RcTreeNode):
+        # The new nodes have no thetas: every edge is needed to find all
+        # the previous minimal hitting sets extended with an element
+        for conflict in self._elements_of(node.label):
+            path = self._frozen(self._path_with(node.path_from_root,
+                                                conflict))
+            if path in self._reopened_paths:
+                continue  # Another new node already has this path
+            self._reopened_paths.add(path)
+            node.children[conflict] = None
+            child_node = self._child_node(node, conflict)
+            child_node.allow_all_edges()
+            node.children[conflict] = child_node
+            self.nodes_to_process.append(child_node)
 
     def _propagate_thetas_changes(
             self, other_node: RcTreeNode, difference: set):
@@ -91,7 +279,8 @@ class RcTree(hsdag.HsDag):
         descendants = queue.deque(other_node.children.values())
         while descendants:
             descendant = descendants.popleft()
-            self._create_children(descendant)
+            if self._may_expand(descendant):
+                self._create_children(descendant)
             descendants.extend(descendant.children.values())
 
     @staticmethod
@@ -107,14 +296,15 @@ class RcTree(hsdag.HsDag):
             node_in_processing.label.difference(
                 node_in_processing.theta)
         for conflict in conflicts_generating_edges:
+            # Discard the outdated subtree, if the edge already existed
+            self._trim_subdag(node_in_processing, conflict)
             node_in_processing.children[conflict] = None
             child_node = self._child_node(node_in_processing, conflict)
             node_in_processing.children[conflict] = child_node
             self.nodes_to_process.append(child_node)
 
     def _child_node(self, node_in_processing: RcTreeNode, conflict):
-        child_node = RcTreeNode()
-        self.amount_of_nodes_constructed += 1
+        child_node = self._new_node()
         child_node.parents[conflict] = node_in_processing
         child_node.path_from_root.update(node_in_processing.path_from_root)
         child_node.path_from_root.add(conflict)
@@ -122,4 +312,5 @@ class RcTree(hsdag.HsDag):
             node_in_processing.label.intersection(
                 child_node.parent.children.keys())
         child_node.theta = child_node.theta_c.union(child_node.parent.theta)
+        self._node_created(child_node.path_from_root)
         return child_node
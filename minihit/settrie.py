@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+from typing import Generator, Iterable
+
+
+class _SetTrieNode(object):
+    def __init__(self):
+        self.children = dict()
+        self.stored_set = None  # Not None only if a set ends in this node
+
+
+class SetTrie(object):
+    """
+    Collection of sets stored as a trie, where each set is a path of its
+    elements in a fixed order, allowing fast subset and superset queries.
+
+    The elements can be any hashable object: they are ordered by the
+    moment they were first added to the trie, so they don't need to be
+    comparable between each other.
+    """
+
+    def __init__(self, sets: Iterable[set] = ()):
+        """
+        Constructs the trie, optionally initializing it with some sets.
+
+        Args:
+            sets: iterable of sets to add to the trie.
+        """
+        self._root = _SetTrieNode()
+        self._ranks = dict()
+        self._amount_of_sets = 0
+        for elements in sets:
+            self.add(elements)
+
+    def _rank(self, element):
+        return self._ranks.setdefault(element, len(self._ranks))
+
+    def _sorted(self, elements):
+        return sorted(elements, key=self._rank)
+
+    def _node_of(self, elements):
+        node = self._root
+        if any(element not in self._ranks for element in elements):
+            return None  # Contains an element that was never stored
+        for element in sorted(elements, key=self._ranks.__getitem__):
+            node = node.children.get(element)
+            if node is None:
+                return None
+        return node
+
+    def add(self, elements: Iterable) -> bool:
+        """
+        Stores a set in the trie.
+
+        Args:
+            elements: the set to store.
+
+        Returns:
+            bool: True if the set was added, False if it was already stored.
+        """
+        node = self._root
+        for element in self._sorted(elements):
+            child = node.children.get(element)
+            if child is None:
+                child = _SetTrieNode()
+                node.children[element] = child
+            node = child
+        if node.stored_set is not None:
+            return False
+        node.stored_set = frozenset(elements)
+        self._amount_of_sets += 1
+        return True
+
+    def discard(self, elements: Iterable) -> bool:
+        """
+        Removes a set from the trie, if stored.
+
+        Args:
+            elements: the set to remove.
+
+        Returns:
+            bool: True if the set was removed, False if it was not stored.
+        """
+        if any(element not in self._ranks for element in elements):
+            return False
+        nodes_on_path = [(None, self._root)]
+        for element in sorted(elements, key=self._ranks.__getitem__):
+            child = nodes_on_path[-1][1].children.get(element)
+            if child is None:
+                return False
+            nodes_on_path.append((element, child))
+        if nodes_on_path[-1][1].stored_set is None:
+            return False
+        nodes_on_path[-1][1].stored_set = None
+        self._amount_of_sets -= 1
+        # Remove the branch nodes that do not lead to any other set
+        for depth in range(len(nodes_on_path) - 1, 0, -1):
+            element, node = nodes_on_path[depth]
+            if node.children or node.stored_set is not None:
+                break
+            del nodes_on_path[depth - 1][1].children[element]
+        return True
+
+    def clear(self):
+        """
+        Removes all sets from the trie.
+        """
+        self._root = _SetTrieNode()
+        self._ranks.clear()
+        self._amount_of_sets = 0
+
+    def has_subset_of(self, elements: Iterable, strict: bool = False) -> bool:
+        """
+        Checks whether any stored set is a subset of the given one.
+
+        Args:
+            elements: the set to look for subsets of.
+            strict: set to True to ignore the stored set equal to the given
+                one.
+
+        Returns:
+            bool: True if at least one stored set is a (strict) subset of
+                the given one.
+        """
+        if not isinstance(elements, (set, frozenset)):
+            elements = frozenset(elements)
+        nodes_to_visit = [(self._root, 0)]
+        while nodes_to_visit:
+            node, depth = nodes_to_visit.pop()
+            if node.stored_set is not None and (
+                    not strict or depth < len(elements)):
+                return True
+            if len(node.children) <= len(elements):
+                for element, child in node.children.items():
+                    if element in elements:
+                        nodes_to_visit.append((child, depth + 1))
+            else:
+                for element in elements:
+                    child = node.children.get(element)
+                    if child is not None:
+                        nodes_to_visit.append((child, depth + 1))
+        return False
+
+    def supersets_of(self, elements: Iterable, strict: bool = False
+                     ) -> Generator[frozenset, None, None]:
+        """
+        Generator of the stored sets that are supersets of the given one.
+
+        Args:
+            elements: the set to look for supersets of.
+            strict: set to True to ignore the stored set equal to the given
+                one.
+
+        Returns:
+            Generator[frozenset, None, None]: the stored supersets.
+        """
+        ranks = []
+        for element in elements:
+            if element not in self._ranks:
+                return  # No stored set contains this element
+            ranks.append(self._ranks[element])
+        ranks.sort()
+        nodes_to_visit = [(self._root, 0, 0)]
+        while nodes_to_visit:
+            node, matched, depth = nodes_to_visit.pop()
+            if (matched == len(ranks) and node.stored_set is not None
+                    and (not strict or depth > len(ranks))):
+                yield node.stored_set
+            for element, child in node.children.items():
+                rank = self._ranks[element]
+                if matched == len(ranks) or rank < ranks[matched]:
+                    nodes_to_visit.append((child, matched, depth + 1))
+                elif rank == ranks[matched]:
+                    nodes_to_visit.append((child, matched + 1, depth + 1))
+
+    def __contains__(self, elements):
+        node = self._node_of(elements)
+        return node is not None and node.stored_set is not None
+
+    def __len__(self):
+        return self._amount_of_sets
+
+    def __iter__(self):
+        nodes_to_visit = [self._root]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node.stored_set is not None:
+                yield node.stored_set
+            nodes_to_visit.extend(node.children.values())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+import collections
+import time
+
+# Phases of the processing of each node, in order
+PHASES = ('close', 'label', 'prune', 'expand')
+
+
+class SolverStats(object):
+    """
+    Counters of the operations of the HSDAG and RC-Tree solvers, filled in
+    while solving and cleared when solving again.
+
+    The counters are always collected. The cumulative time spent in each
+    phase of the processing of the nodes is measured only if enabled, as
+    measuring it costs a few clock readings per node.
+    """
+    __slots__ = ('close_attempts', 'closings', 'label_scans',
+                 'conflicts_examined', 'prune_invocations', 'relabels',
+                 'trims', 'trimmed_nodes', 'largest_trim', 'node_reuses',
+                 'peak_frontier', 'phase_times', 'time_phases')
+
+    def __init__(self, time_phases: bool = False):
+        """
+        Constructs the cleared counters.
+
+        Args:
+            time_phases (bool): measures the cumulative time spent in each
+                phase of `PHASES` in `phase_times`.
+        """
+        self.time_phases = time_phases
+        self.reset()
+
+    def reset(self):
+        """Clears the counters, keeping the settings."""
+        self.close_attempts = 0  # Nodes checked for a ticked subset path
+        self.closings = 0  # Nodes closed by a ticked subset path
+        self.label_scans = 0  # Scans for a conflict disjoint from a path
+        self.conflicts_examined = 0  # Conflicts checked by the scans
+        self.prune_invocations = 0
+        self.relabels = 0  # Nodes relabelled with a smaller label
+        self.trims = 0  # Subdags removed by relabelling or re-expanding
+        self.trimmed_nodes = 0  # Total size of the removed subdags
+        self.largest_trim = 0
+        self.node_reuses = 0  # Edges terminating in an existing node
+        self.peak_frontier = 0  # Maximum amount of nodes to process
+        self.phase_times = collections.OrderedDict(
+            (phase, 0.0) for phase in PHASES)
+
+    def add_phase_time(self, phase: str, start_time: float) -> float:
+        """
+        Adds the time elapsed since the start time to the phase.
+
+        Args:
+            phase (str): one of `PHASES`.
+            start_time (float): `time.perf_counter()` at the start of the
+                phase.
+
+        Returns:
+            float: `time.perf_counter()` at the end of the phase, to be
+                used as start of the next one.
+        """
+        end_time = time.perf_counter()
+        self.phase_times[phase] += end_time - start_time
+        return end_time
+
+    def as_dict(self) -> dict:
+        """Provides the counters and the phase times by name."""
+        return collections.OrderedDict(
+            (name, getattr(self, name)) for name in self.__slots__
+            if name != 'time_phases')
+
+    def __repr__(self):
+        return '{:s}({:s})'.format(self.__class__.__name__, ', '.join(
+            '{:s}={:}'.format(name, value)
+            for name, value in self.as_dict().items()))
+
+
+class SolverHooks(object):
+    """
+    Optional callbacks notified by the HSDAG and RC-Tree solvers while
+    solving, each one called with the path from the root of the node as a
+    `SolutionSet`. Unset callbacks are None and cost a single check.
+
+    The callbacks are not called for the subtrees solved in worker
+    processes.
+
+    Attributes:
+        on_node_created: a node was constructed.
+        on_node_ticked: a node was ticked, its path is a hitting set.
+        on_node_closed: a node was closed, as its path is a superset of a
+            ticked one.
+        on_node_pruned: a node was removed from the DAG/Tree by pruning.
+    """
+    __slots__ = ('on_node_created', 'on_node_ticked', 'on_node_closed',
+                 'on_node_pruned')
+
+    def __init__(self, on_node_created=None, on_node_ticked=None,
+                 on_node_closed=None, on_node_pruned=None):
+        self.on_node_created = on_node_created
+        self.on_node_ticked = on_node_ticked
+        self.on_node_closed = on_node_closed
+        self.on_node_pruned = on_node_pruned
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Level-at-a-time labelling and closing of the nodes with NumPy.
+
+Requires NumPy, which is imported only when a level is processed.
+"""
+
+import itertools
+
+# Maximum amount of cells of each intermediate matrix, to bound the memory
+MAX_MATRIX_CELLS = 1 << 24
+
+
+class LevelBatch(object):
+    """
+    Labels and closing candidates of many nodes with the same path
+    cardinality (a level of the breadth-first search) computed at once
+    with matrix operations instead of a Python loop for each node.
+
+    The working conflicts can only be retired and the ticked paths of
+    smaller cardinality can only be discarded while the level is processed,
+    so the results are hints that the solver must confirm: a retired label
+    requires a new label search and a closing candidate requires a closing
+    check. A node that is not a closing candidate cannot be closed.
+    """
+
+    def __init__(self, nodes, working_conflicts, ticked_paths, elements_of):
+        """
+        Computes the labels and closing candidates of the nodes.
+
+        Args:
+            nodes (List[HsDagNode]): nodes with the same path cardinality.
+            working_conflicts (Iterable[Tuple[int, set]]): the position
+                of each conflict in the working conflicts with the conflict.
+            ticked_paths (Iterable[set]): paths of the ticked nodes.
+            elements_of (Callable): provides the elements of a path,
+                a conflict or a ticked path.
+        """
+        import numpy
+        self._label_positions = dict()
+        self._closing_candidates = set()
+        conflicts = list(working_conflicts)
+        ticked_paths = list(ticked_paths)
+        columns = dict()
+        conflict_rows = [self._columns(elements_of(conflict), columns, True)
+                         for _, conflict in conflicts]
+        ticked_rows = [self._columns(elements_of(path), columns, True)
+                       for path in ticked_paths]
+        path_rows = [self._columns(elements_of(node.path_from_root),
+                                   columns, False)
+                     for node in nodes]
+        path_cardinality = len(list(elements_of(nodes[0].path_from_root)))
+        conflicts_matrix = self._matrix(numpy, conflict_rows, len(columns))
+        ticked_matrix = self._matrix(numpy, ticked_rows, len(columns))
+        smaller_ticked = numpy.fromiter(
+            (len(row) < path_cardinality for row in ticked_rows),
+            dtype=bool, count=len(ticked_rows))
+        ticked_matrix = ticked_matrix[smaller_ticked]
+        positions = [position for position, _ in conflicts]
+        rows_per_chunk = max(1, MAX_MATRIX_CELLS // max(
+            1, len(conflicts), len(ticked_matrix)))
+        for start in range(0, len(nodes), rows_per_chunk):
+            chunk = nodes[start:start + rows_per_chunk]
+            paths_matrix = self._matrix(
+                numpy, path_rows[start:start + rows_per_chunk], len(columns))
+            if len(conflicts):
+                overlaps = paths_matrix @ conflicts_matrix.T
+                disjoint = overlaps == 0
+                has_disjoint = disjoint.any(axis=1)
+                first_disjoint = disjoint.argmax(axis=1)
+            for row, node in enumerate(chunk):
+                if len(conflicts) and has_disjoint[row]:
+                    self._label_positions[node] = \
+                        positions[first_disjoint[row]]
+                else:
+                    self._label_positions[node] = None
+            if len(ticked_matrix):
+                missing = ticked_matrix @ (1 - paths_matrix).T
+                closable = (missing == 0).any(axis=0)
+                self._closing_candidates.update(
+                    node for row, node in enumerate(chunk) if closable[row])
+
+    @staticmethod
+    def _columns(elements, columns, add_missing):
+        if add_missing:
+            return [columns.setdefault(element, len(columns))
+                    for element in elements]
+        # Elements of no conflict and no ticked path are irrelevant
+        return [columns[element] for element in elements
+                if element in columns]
+
+    @staticmethod
+    def _matrix(numpy, rows, amount_of_columns):
+        matrix = numpy.zeros((len(rows), amount_of_columns),
+                             dtype=numpy.float32)
+        row_indices = numpy.repeat(numpy.arange(len(rows)),
+                                   [len(row) for row in rows])
+        matrix[row_indices, list(itertools.chain.from_iterable(rows))] = 1
+        return matrix
+
+    def __contains__(self, node):
+        return node in self._label_positions
+
+    def discard(self, node):
+        """Forgets the results of a node that is going to be reused."""
+        self._label_positions.pop(node, None)
+        self._closing_candidates.discard(node)
+
+    def label_position(self, node):
+        """
+        Position in the working conflicts of the first conflict disjoint
+        from the path of the node, None if there is none.
+        """
+        return self._label_positions[node]
+
+    def may_be_closed(self, node):
+        """
+        False if no ticked path of smaller cardinality was a subset of the
+        path of the node.
+        """
+        return node in self._closing_candidates
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2018, Matjaž Guštin <dev@matjaz.it> https://matjaz.it
+# All rights reserved.
+# This file is part of the MiniHit project which is released under
+# the BSD 3-clause license.
+
+"""
+Verification of whole families of minimal hitting sets against a list of
+conflicts, indexing the conflicts by element once for all the sets.
+"""
+
+import collections
+from typing import Iterable, List, Tuple
+
+from . import settrie
+
+NOT_HITTING = 'not_hitting'
+NOT_MINIMAL = 'not_minimal'
+DUPLICATE = 'duplicate'
+SUPERSET = 'superset'
+
+Violation = collections.namedtuple(
+    'Violation', ['kind', 'index', 'solution', 'detail'])
+
+
+class FamilyVerifier(object):
+    """
+    Checks sets against a list of conflicts with an inverted index from each
+    element to the conflicts containing it, as a bitmask with the bit of the
+    position of each conflict set, so checking a set costs a few bitwise
+    operations per element, rather than an intersection per conflict.
+
+    A set is a minimal hitting set if it hits every conflict and each of its
+    elements has a private conflict, hit by no other element of the set:
+    without that element, the private conflict would not be hit, and any
+    strict subset misses at least one element.
+    """
+
+    def __init__(self, list_of_conflicts: Iterable[Iterable]):
+        """
+        Indexes the conflicts by element.
+
+        Args:
+            list_of_conflicts: the conflicts to check the sets against.
+                Later changes to it are not seen by the verifier.
+        """
+        self.amount_of_conflicts = 0
+        self._conflicts_of = dict()
+        for conflict in list_of_conflicts:
+            bit = 1 << self.amount_of_conflicts
+            for element in conflict:
+                self._conflicts_of[element] = \
+                    self._conflicts_of.get(element, 0) | bit
+            self.amount_of_conflicts += 1
+        self._all_conflicts = (1 << self.amount_of_conflicts) - 1
+
+    def _hits(self, solution) -> Tuple[int, int]:
+        """Bitmasks of the conflicts hit by the set and of the ones hit by
+        a single element of it."""
+        hit = 0
+        hit_more_than_once = 0
+        for element in solution:
+            conflicts = self._conflicts_of.get(element, 0)
+            hit_more_than_once |= hit & conflicts
+            hit |= conflicts
+        return hit, hit & ~hit_more_than_once
+
+    def _redundant_elements(self, solution, hit_once: int) -> list:
+        """Elements of the set without a private conflict."""
+        return [element for element in solution
+                if not self._conflicts_of.get(element, 0) & hit_once]
+
+    def is_hitting(self, solution) -> bool:
+        """
+        Checks whether the set hits every conflict.
+
+        Args:
+            solution (Iterable): the set to check. The empty set is never
+                considered hitting.
+
+        Returns:
+            bool: True if hitting, False otherwise.
+        """
+        return (len(solution) > 0 and
+                self._hits(solution)[0] == self._all_conflicts)
+
+    def is_minimal_hitting(self, solution) -> bool:
+        """
+        Checks whether the set hits every conflict and each of its elements
+        hits a conflict no other element hits.
+
+        Args:
+            solution (Iterable): the set to check. The empty set is never
+                considered hitting.
+
+        Returns:
+            bool: True if hitting and minimal, False otherwise.
+        """
+        if len(solution) == 0:
+            return False
+        hit, hit_once = self._hits(solution)
+        return (hit == self._all_conflicts and
+                not self._redundant_elements(solution, hit_once))
+
+    def violations(self, solutions: Iterable[Iterable]) -> List[Violation]:
+        """
+        Checks a family of minimal hitting sets as a whole.
+
+        Args:
+            solutions: the family to check.
+
+        Returns:
+            List[Violation]: each problem found, as the kind, the position
+                of the set in the family, the set and a detail:
+                - `NOT_HITTING`: the amount of conflicts not hit;
+                - `NOT_MINIMAL`: the list of elements without a private
+                  conflict;
+                - `DUPLICATE`: the position of the first equal set;
+                - `SUPERSET`: the position of a set that is a strict subset
+                  of this one.
+                Empty if every set is a minimal hitting set of the conflicts
+                and appears only once.
+        """
+        violations = []
+        positions = dict()
+        unique_solutions = dict()  # By position
+        for index, solution in enumerate(solutions):
+            frozen_solution = frozenset(solution)
+            if frozen_solution in positions:
+                violations.append(Violation(DUPLICATE, index, solution,
+                                            positions[frozen_solution]))
+                continue
+            positions[frozen_solution] = index
+            unique_solutions[index] = solution
+            hit, hit_once = self._hits(frozen_solution)
+            if not frozen_solution or hit != self._all_conflicts:
+                violations.append(Violation(
+                    NOT_HITTING, index, solution,
+                    self.amount_of_conflicts - bin(hit).count('1')))
+            redundant_elements = self._redundant_elements(frozen_solution,
+                                                          hit_once)
+            if redundant_elements:
+                violations.append(Violation(NOT_MINIMAL, index, solution,
+                                            redundant_elements))
+        if violations:
+            # A strict subset of a hitting set makes it not minimal, or is
+            # itself not hitting: valid families have no such pairs
+            trie = settrie.SetTrie(positions)
+            for frozen_solution, index in positions.items():
+                for superset in trie.supersets_of(frozen_solution,
+                                                  strict=True):
+                    superset_index = positions[superset]
+                    violations.append(Violation(
+                        SUPERSET, superset_index,
+                        unique_solutions[superset_index], index))
+            violations.sort(key=lambda violation: violation.index)
+        return violations
+
+    def is_valid(self, solutions: Iterable[Iterable]) -> bool:
+        """
+        Checks whether every set of the family is a minimal hitting set of
+        the conflicts and appears only once.
+
+        Args:
+            solutions: the family to check.
+
+        Returns:
+            bool: True if the family has no violations, False otherwise.
+        """
+        return not self.violations(solutions)
+
+
+def verify_family(list_of_conflicts: Iterable[Iterable],
+                  solutions: Iterable[Iterable]) -> List[Violation]:
+    """
+    Checks a family of minimal hitting sets against a list of conflicts.
+
+    Args:
+        list_of_conflicts: the conflicts the sets should be minimal hitting
+            sets of.
+        solutions: the family to check.
+
+    Returns:
+        List[Violation]: same as `FamilyVerifier.violations()`.
+    """
+    return FamilyVerifier(list_of_conflicts).violations(solutions)
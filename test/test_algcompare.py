@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+from unittest import TestCase
+
+from minihit.algcompare import ENGINES, solve_from_file, stream_from_file
+
+
+class TestSolveFromFile(TestCase):
+    def setUp(self):
+        self.input_file_name = os.path.join('parser_files', '11_combined.txt')
+        self.expected_mhs_by_line = {
+            2: [{1, 3}, {1, 4}, {2, 3}, {2, 4}],
+            3: [{1, 3}, {1, 4}],
+            4: [{1}],
+            5: [{2}, {1, 3}],
+            6: [{1}, {2}],
+            7: [{1, 3}, {1, 4}, {2, 3}, {2, 4}],
+        }
+
+    def test_results_in_line_order(self):
+        for engine in ENGINES:
+            for jobs in (1, 3):
+                results = list(solve_from_file(self.input_file_name,
+                                               engine=engine, jobs=jobs))
+                self.assertEqual(list(self.expected_mhs_by_line.keys()),
+                                 [result.line for result in results])
+                for result in results:
+                    self.assertEqual(
+                        set(map(frozenset,
+                                self.expected_mhs_by_line[result.line])),
+                        set(map(frozenset, result.solutions)))
+                    self.assertGreater(result.nodes_constructed, 0)
+                    self.assertGreaterEqual(result.elapsed, 0)
+                    self.assertEqual(0, result.conflicts_removed)
+
+    def test_chunks_of_lines(self):
+        for chunk_size in (1, 2, 100):
+            results = solve_from_file(self.input_file_name, jobs=2,
+                                      chunk_size=chunk_size)
+            first_result = next(results)
+            self.assertEqual(2, first_result.line)
+            self.assertEqual(list(self.expected_mhs_by_line.keys()),
+                             [first_result.line]
+                             + [result.line for result in results])
+        results = solve_from_file(self.input_file_name, jobs=2, chunk_size=1)
+        self.assertEqual(2, next(results).line)
+        results.close()  # Stops before solving every chunk
+
+    def test_max_cardinality(self):
+        results = list(solve_from_file(self.input_file_name,
+                                       max_cardinality=1))
+        self.assertEqual([[], [], [{1}], [{2}], [{1}, {2}], []],
+                         [sorted(result.solutions, key=sorted)
+                          for result in results])
+
+    def test_subsume(self):
+        results = list(solve_from_file(self.input_file_name, subsume=True))
+        self.assertEqual([1, 0, 1, 0, 0, 0],
+                         [result.conflicts_removed for result in results])
+        for result in results:
+            self.assertEqual(
+                set(map(frozenset, self.expected_mhs_by_line[result.line])),
+                set(map(frozenset, result.solutions)))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            solve_from_file(self.input_file_name, engine='unknown')
+        with self.assertRaises(ValueError):
+            solve_from_file(self.input_file_name, jobs=0)
+        with self.assertRaises(ValueError):
+            solve_from_file(self.input_file_name, chunk_size=0)
+
+
+class TestStreamFromFile(TestCase):
+    def setUp(self):
+        self.input_file_name = os.path.join('parser_files', '11_combined.txt')
+        self.expected_mhs_by_line = {
+            2: [{1, 3}, {1, 4}, {2, 3}, {2, 4}],
+            3: [{1, 3}, {1, 4}],
+            4: [{1}],
+            5: [{2}, {1, 3}],
+            6: [{1}, {2}],
+            7: [{1, 3}, {1, 4}, {2, 3}, {2, 4}],
+        }
+
+    def test_json_lines(self):
+        for engine in ENGINES:
+            output = io.StringIO()
+            amount = stream_from_file(self.input_file_name, engine=engine,
+                                      output=output, json_lines=True)
+            records = [json.loads(record)
+                       for record in output.getvalue().splitlines()]
+            self.assertEqual(len(records), amount)
+            mhs_by_line = {}
+            for record in records:
+                mhs_by_line.setdefault(record['line'], set()).add(
+                    frozenset(record['solution']))
+            self.assertEqual(
+                {line: set(map(frozenset, solutions))
+                 for line, solutions in self.expected_mhs_by_line.items()},
+                mhs_by_line)
+
+    def test_plain_lines(self):
+        output = io.StringIO()
+        stream_from_file(self.input_file_name, output=output, sort=True)
+        self.assertEqual(['2: 1 3', '2: 1 4', '2: 2 3', '2: 2 4',
+                          '3: 1 3', '3: 1 4', '4: 1', '5: 1 3', '5: 2'],
+                         sorted(output.getvalue().splitlines())[:9])
+
+    def test_each_solution_is_flushed(self):
+        class FlushRecordingOutput(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.flushed = []
+
+            def flush(self):
+                super().flush()
+                self.flushed.append(self.getvalue())
+
+        output = FlushRecordingOutput()
+        amount = stream_from_file(self.input_file_name, output=output)
+        self.assertEqual(amount, len(output.flushed))
+        self.assertEqual(list(range(1, amount + 1)),
+                         [len(flushed.splitlines())
+                          for flushed in output.flushed])
+
+    def test_limit(self):
+        for engine in ('rctree', 'mmcs'):
+            output = io.StringIO()
+            self.assertEqual(
+                11, stream_from_file(self.input_file_name, engine=engine,
+                                     output=output, limit=2))
+            lines = [record.split(':')[0]
+                     for record in output.getvalue().splitlines()]
+            self.assertEqual(['2', '2', '3', '3', '4', '5', '5', '6', '6',
+                              '7', '7'], lines)
+
+    def test_stats(self):
+        output = io.StringIO()
+        stream_from_file(self.input_file_name, output=output,
+                         json_lines=True, limit=1, print_stats=True)
+        records = [json.loads(record)
+                   for record in output.getvalue().splitlines()]
+        stats_records = [record for record in records
+                         if 'solution' not in record]
+        self.assertEqual(list(self.expected_mhs_by_line),
+                         [record['line'] for record in stats_records])
+        for record in stats_records:
+            self.assertEqual(1, record['solutions'])
+            self.assertGreater(record['nodes_constructed'], 0)
+            self.assertIn('close_attempts', record['stats'])
+        output = io.StringIO()
+        stream_from_file(self.input_file_name, engine='mmcs', output=output,
+                         print_stats=True)
+        stats_lines = [record for record in output.getvalue().splitlines()
+                       if record.startswith('#')]
+        self.assertEqual(len(self.expected_mhs_by_line), len(stats_lines))
+        self.assertTrue(stats_lines[0].startswith('# line=2 solutions=4 '))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            stream_from_file(self.input_file_name, engine='nonexistent')
+        with self.assertRaises(ValueError):
+            stream_from_file(self.input_file_name, limit=0)
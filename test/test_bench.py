@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import contextlib
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from minihit import bench
+
+
+class TestWorkloads(TestCase):
+    def test_make_workload(self):
+        workload = bench.make_workload('linear', amount_conflicts=3,
+                                       cardinality=2)
+        self.assertEqual('linear(amount_conflicts=3, cardinality=2)',
+                         workload.name)
+        self.assertEqual([{1, 2}, {2, 3}, {3, 4}], workload.list_of_conflicts)
+
+    def test_seeded_workloads_are_repeatable(self):
+        for family, parameters in bench.DEFAULT_WORKLOADS:
+            self.assertEqual(
+                bench.make_workload(family, **parameters),
+                bench.make_workload(family, **parameters))
+
+    def test_unknown_family(self):
+        with self.assertRaises(ValueError):
+            bench.make_workload('unknown')
+
+
+class TestRun(TestCase):
+    def setUp(self):
+        self.workloads = [
+            bench.make_workload('random', amount_conflicts=8,
+                                max_cardinality=5, seed=1),
+            bench.make_workload('linear', amount_conflicts=4, cardinality=3)]
+
+    def test_matrix_of_engines_and_options(self):
+        results = bench.run(self.workloads, ('hsdag', 'mmcs'),
+                            repeats=3, warmup=0)
+        self.assertEqual(2 * 2 * len(bench.DEFAULT_OPTIONS), len(results))
+        self.assertEqual(
+            [(workload.name, engine, prune, sort)
+             for workload in self.workloads
+             for engine in ('hsdag', 'mmcs')
+             for prune, sort in bench.DEFAULT_OPTIONS],
+            [(result.workload, result.engine, result.prune, result.sort)
+             for result in results])
+        for result in results:
+            self.assertEqual(3, result.repeats)
+            self.assertLessEqual(result.min, result.median)
+            self.assertGreaterEqual(result.stdev, 0)
+            self.assertGreater(result.nodes_constructed, 0)
+        solutions = {(result.workload, result.engine, result.sort):
+                     result.solutions for result in results}
+        for workload in self.workloads:
+            self.assertEqual(solutions[workload.name, 'hsdag', True],
+                             solutions[workload.name, 'mmcs', False])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            bench.run(self.workloads, ('unknown',))
+        with self.assertRaises(ValueError):
+            bench.run(self.workloads, repeats=0)
+        with self.assertRaises(ValueError):
+            bench.run(self.workloads, warmup=-1)
+
+
+class TestResultsFiles(TestCase):
+    def setUp(self):
+        self.results = bench.run(
+            [bench.make_workload('linear', amount_conflicts=3,
+                                 cardinality=2)],
+            ('rctree',), ((False, False), (True, True)), repeats=2)
+
+    def test_write_and_read(self):
+        for output_format in ('json', 'csv'):
+            output_file = io.StringIO()
+            bench.write_results(self.results, output_file, output_format)
+            output_file.seek(0)
+            self.assertEqual(self.results, bench.read_results(output_file))
+        with self.assertRaises(ValueError):
+            bench.write_results(self.results, io.StringIO(), 'xml')
+
+    def test_find_regressions(self):
+        slower = [result._replace(median=result.median * 2 + 1)
+                  for result in self.results]
+        self.assertEqual([], bench.find_regressions(self.results,
+                                                    self.results))
+        self.assertEqual([], bench.find_regressions(slower, self.results))
+        regressions = bench.find_regressions(self.results, slower)
+        self.assertEqual(['median [s]'] * 2,
+                         [regression.quantity for regression in regressions])
+        self.assertEqual([], bench.find_regressions(self.results, slower,
+                                                    min_difference=10))
+        more_nodes = self.results[:1] + [
+            self.results[1]._replace(
+                nodes_constructed=self.results[1].nodes_constructed + 1)]
+        regressions = bench.find_regressions(self.results, more_nodes)
+        self.assertEqual([('rctree', True, True, 'nodes constructed')],
+                         [(regression.engine, regression.prune,
+                           regression.sort, regression.quantity)
+                          for regression in regressions])
+
+    def test_compare_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline_file_name = os.path.join(directory, 'baseline.json')
+            current_file_name = os.path.join(directory, 'current.csv')
+            with open(baseline_file_name, 'w') as baseline_file:
+                bench.write_results(self.results, baseline_file, 'json')
+            with open(current_file_name, 'w', newline='') as current_file:
+                bench.write_results(
+                    [result._replace(median=result.median + 1)
+                     for result in self.results], current_file, 'csv')
+            self.assertEqual(0, bench.main(
+                ['compare', baseline_file_name, baseline_file_name]))
+            self.assertEqual(1, bench.main(
+                ['compare', baseline_file_name, current_file_name]))
+            self.assertEqual(2, bench.main(['compare', baseline_file_name]))
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(0, bench.main(
+                    ['compare', baseline_file_name, current_file_name,
+                     '--threshold', '0.1', '--min_difference', '2']))
+                self.assertEqual(1, bench.main(
+                    ['compare', baseline_file_name, current_file_name,
+                     '--min_difference=0.5']))
+
+    def test_invalid_command_line_options(self):
+        for options in (['--format=xml'], ['--format'], ['--repeats', 'x'],
+                        ['--repeats=0'], ['--warmup', '-1'],
+                        ['--engines', 'hsdag,unknown'],
+                        ['--threshold=high']):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(1, bench.main(['run'] + options))
+            self.assertIn('Usage:', output.getvalue())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import linear_conflicts, SolutionSet
+from minihit.hsdag import HsDag
+from minihit.berge import Berge
+
+
+class TestBerge(TestCase):
+    def setUp(self):
+        self.solve_options = [
+            (False, False),
+            (False, True),
+            (True, False),
+            (True, True),
+        ]
+        self.problems = [
+            ([{1, 3}, {1, 4}], [{1}, {3, 4}]),
+            ([{3, 4, 5}, {1}], [{1, 3}, {1, 4}, {1, 5}]),
+            ([{1, 2, 5}, {1, 2}, {3, 4}],
+             [{1, 3}, {1, 4}, {2, 3}, {2, 4}]),
+            ([{1, 2, 3, 4}, {3}, {2, 4}, {15}, {9, 2, 15}, {9, 3}, {8, 7},
+              {8, 9, 1, 7}],
+             [{8, 2, 3, 15}, {2, 3, 7, 15}, {8, 3, 4, 15}, {3, 4, 7, 15}]),
+            ([{1, 2, 3, 4, 7}, {1, 2, 4, 6, 8, 10}, {8, 9, 2, 10}, {10},
+              {3, 5, 6, 7, 10}, {4, 5, 8, 9, 10}, {1, 2, 5, 8, 9},
+              {3, 4, 5, 6, 7, 9, 10}, {8, 5, 6}, {3, 4, 5, 6, 10}],
+             [{8, 1, 10}, {8, 10, 2}, {8, 10, 3}, {8, 10, 4}, {8, 10, 7},
+              {1, 10, 5}, {10, 2, 5}, {10, 3, 5}, {10, 4, 5}, {10, 5, 7},
+              {1, 10, 6}, {10, 2, 6}, {9, 10, 3, 6}, {9, 10, 4, 6},
+              {9, 10, 6, 7}]),
+            ([{'a', 'b'}, {'b', 'c'}], [{'b'}, {'a', 'c'}]),
+        ]
+
+    def test_empty_list_of_conflicts_does_nothing(self):
+        berge = Berge([])
+        for solve_args in self.solve_options:
+            berge.solve(*solve_args)
+            self.assertEqual([], list(berge.generate_minimal_hitting_sets()))
+            self.assertTrue(berge.verify())
+
+    def test_solving(self):
+        for list_of_conflicts, expected_mhs in self.problems:
+            berge = Berge(list_of_conflicts)
+            for solve_args in self.solve_options:
+                berge.solve(*solve_args)
+                solutions = list(berge.generate_minimal_hitting_sets())
+                for solution in solutions:
+                    self.assertIsInstance(solution, SolutionSet)
+                self.assertEqual(len(expected_mhs), len(solutions))
+                self.assertEqual(set(map(frozenset, expected_mhs)),
+                                 set(map(frozenset, solutions)))
+                self.assertTrue(berge.verify())
+
+    def test_same_solutions_as_hsdag(self):
+        list_of_conflicts = list(linear_conflicts(6, 4, 2))
+        hs_dag = HsDag(list_of_conflicts)
+        hs_dag.solve(sort=True)
+        berge = Berge(list_of_conflicts)
+        berge.solve()
+        self.assertEqual(
+            set(map(frozenset, hs_dag.generate_minimal_hitting_sets())),
+            set(map(frozenset, berge.generate_minimal_hitting_sets())))
+
+    def test_add_conflict_to_solved(self):
+        for list_of_conflicts, expected_mhs in self.problems:
+            for solve_args in self.solve_options:
+                berge = Berge(list_of_conflicts[:1])
+                berge.solve(*solve_args)
+                for conflict in list_of_conflicts[1:]:
+                    berge.add_conflict(conflict)
+                solutions = list(berge.generate_minimal_hitting_sets())
+                self.assertEqual(len(expected_mhs), len(solutions))
+                self.assertEqual(set(map(frozenset, expected_mhs)),
+                                 set(map(frozenset, solutions)))
+                self.assertTrue(berge.verify())
+
+    def test_add_conflict_before_solving(self):
+        berge = Berge([{1, 2}])
+        berge.add_conflict({2, 3})
+        self.assertEqual([{1, 2}, {2, 3}], berge.list_of_conflicts)
+        self.assertEqual([], list(berge.generate_minimal_hitting_sets()))
+        berge.solve()
+        self.assertEqual(set(map(frozenset, [{2}, {1, 3}])),
+                         set(map(frozenset,
+                                 berge.generate_minimal_hitting_sets())))
+
+    def test_add_conflict_to_solved_empty_list_of_conflicts(self):
+        berge = Berge([])
+        berge.solve()
+        berge.add_conflict({1, 2})
+        self.assertEqual(set(map(frozenset, [{1}, {2}])),
+                         set(map(frozenset,
+                                 berge.generate_minimal_hitting_sets())))
+
+    def test_same_arguments_as_hsdag(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        hs_dag.solve(True, False, False, 3)
+        berge = Berge(list_of_conflicts)
+        berge.solve(True, False, True, 3)
+        self.assertEqual(
+            set(map(frozenset, hs_dag.generate_minimal_hitting_sets())),
+            set(map(frozenset, berge.generate_minimal_hitting_sets())))
+        berge.solve(vectorize=True)
+        self.assertTrue(berge.verify())
+
+    def test_max_cardinality(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        berge = Berge(list_of_conflicts)
+        berge.solve()
+        all_mhs = set(map(frozenset, berge.generate_minimal_hitting_sets()))
+        berge.solve(max_cardinality=3)
+        self.assertEqual(
+            set(mhs for mhs in all_mhs if len(mhs) <= 3),
+            set(map(frozenset, berge.generate_minimal_hitting_sets())))
+        berge.solve(max_cardinality=1)
+        self.assertEqual([], list(berge.generate_minimal_hitting_sets()))
+        with self.assertRaises(ValueError):
+            berge.solve(max_cardinality=-1)
+
+    def test_solving_does_not_alter_list_of_conflicts(self):
+        list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
+        original_list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
+        berge = Berge(list_of_conflicts)
+        for solve_args in self.solve_options:
+            berge.solve(*solve_args)
+            self.assertEqual(original_list_of_conflicts,
+                             berge.list_of_conflicts)
+
+    def test_resetting_deletes_everything(self):
+        berge = Berge([{1}, {3, 4, 5}])
+        berge.solve()
+        berge.reset()
+        self.assertEqual([], list(berge.generate_minimal_hitting_sets()))
+        self.assertEqual(0, berge.amount_of_nodes_constructed)
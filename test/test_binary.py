@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from unittest import TestCase
+
+from minihit import random_conflicts
+from minihit.binary import FamiliesReader, write_families
+from minihit.rctree import RcTree
+
+
+class TestBinaryFamilies(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'families.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        families = [[{1, 2}, {3, 4}, {1, 2, 5}], [], [{-3, 2 ** 40}, set()],
+                    [{7}]]
+        self.assertEqual(4, write_families(self.file_name, families))
+        with FamiliesReader(self.file_name) as reader:
+            self.assertEqual(4, len(reader))
+            self.assertEqual(families, list(reader))
+            self.assertEqual([{7}], reader[-1])
+            self.assertEqual([[1, 2], [3, 4], [1, 2, 5]],
+                             [view.tolist() for view in reader.views(0)])
+            with self.assertRaises(IndexError):
+                reader[4]
+
+    def test_empty(self):
+        self.assertEqual(0, write_families(self.file_name, []))
+        with FamiliesReader(self.file_name) as reader:
+            self.assertEqual(0, len(reader))
+            self.assertEqual([], list(reader))
+
+    def test_solving_and_writing_solutions(self):
+        problems = [list(random_conflicts(10, 6, seed=seed))
+                    for seed in range(5)]
+        write_families(self.file_name, problems)
+        with FamiliesReader(self.file_name) as reader:
+            solvers = [RcTree(list_of_conflicts)
+                       for list_of_conflicts in reader]
+        expected_solutions = []
+        for solver, list_of_conflicts in zip(solvers, problems):
+            solver.solve(prune=True, sort=True)
+            expected = RcTree(list_of_conflicts)
+            expected.solve(prune=True, sort=True)
+            expected_solutions.append(
+                list(expected.generate_minimal_hitting_sets()))
+        solutions_file_name = os.path.join(self.directory.name, 'mhs.bin')
+        write_families(solutions_file_name,
+                       (solver.generate_minimal_hitting_sets()
+                        for solver in solvers))
+        with FamiliesReader(solutions_file_name) as reader:
+            for solutions, expected in zip(reader, expected_solutions):
+                self.assertEqual(sorted(map(sorted, expected)),
+                                 sorted(map(sorted, solutions)))
+
+    def test_views_outliving_the_reader(self):
+        write_families(self.file_name, [[{1, 2}]])
+        reader = FamiliesReader(self.file_name)
+        views = reader.views(0)
+        reader.close()
+        self.assertEqual([1, 2], views[0].tolist())
+
+    def test_invalid_elements(self):
+        with self.assertRaises(ValueError):
+            write_families(self.file_name, [[{'a', 'b'}]])
+        with self.assertRaises(ValueError):
+            write_families(self.file_name, [[{2 ** 64}]])
+
+    def test_invalid_files(self):
+        for content in (b'', b'MHCS', b'XXXX' + bytes(40)):
+            with open(self.file_name, 'wb') as invalid_file:
+                invalid_file.write(content)
+            with self.assertRaises(ValueError):
+                FamiliesReader(self.file_name)
+        write_families(self.file_name, [[{1, 2}]])
+        with open(self.file_name, 'ab') as truncated_file:
+            truncated_file.write(b'\0')
+        with self.assertRaises(ValueError):
+            FamiliesReader(self.file_name)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+from unittest import TestCase
+
+from minihit import linear_conflicts, SolutionSet
+from minihit.bitset import (BitmaskFamily, BitsetHsDag, BitsetRcTree,
+                            bit_positions)
+from minihit.settrie import SetTrie
+
+
+class TestBitPositions(TestCase):
+    def test_bit_positions(self):
+        self.assertEqual([], list(bit_positions(0)))
+        self.assertEqual([0, 2, 5], list(bit_positions(0b100101)))
+        self.assertEqual([300], list(bit_positions(1 << 300)))
+
+
+class TestBitmaskFamily(TestCase):
+    def test_queries(self):
+        family = BitmaskFamily()
+        self.assertTrue(family.add(0b011))
+        self.assertTrue(family.add(0b100))
+        self.assertFalse(family.add(0b011))
+        self.assertEqual(2, len(family))
+        self.assertTrue(family.has_subset_of(0b111, strict=True))
+        self.assertTrue(family.has_subset_of(0b100))
+        self.assertFalse(family.has_subset_of(0b100, strict=True))
+        self.assertEqual([0b011], list(family.supersets_of(0b010)))
+        self.assertEqual([], list(family.supersets_of(0b011, strict=True)))
+        self.assertTrue(family.discard(0b011))
+        self.assertNotIn(0b011, family)
+
+    def test_same_answers_as_settrie(self):
+        rng = random.Random(7)
+        family = BitmaskFamily()
+        set_trie = SetTrie()
+        for _ in range(2000):
+            mask = rng.getrandbits(10) & rng.getrandbits(10)
+            elements = frozenset(bit_positions(mask))
+            if rng.random() < 0.4:  # Reuses the freed slots
+                self.assertEqual(set_trie.discard(elements),
+                                 family.discard(mask))
+            else:
+                self.assertEqual(set_trie.add(elements), family.add(mask))
+            for strict in (False, True):
+                self.assertEqual(set_trie.has_subset_of(elements, strict),
+                                 family.has_subset_of(mask, strict))
+                self.assertEqual(
+                    set(set_trie.supersets_of(elements, strict)),
+                    set(frozenset(bit_positions(superset)) for superset
+                        in family.supersets_of(mask, strict)))
+        self.assertEqual(len(set_trie), len(family))
+        family.clear()
+        self.assertEqual(0, len(family))
+        self.assertFalse(family.has_subset_of(0b1111111111))
+
+
+class TestBitsetEngines(TestCase):
+    def setUp(self):
+        self.solve_options = [
+            (False, False),
+            (False, True),
+            (True, False),
+            (True, True),
+        ]
+        self.problems = [
+            ([{1, 3}, {1, 4}], [{1}, {3, 4}]),
+            ([{3, 4, 5}, {1}], [{1, 3}, {1, 4}, {1, 5}]),
+            ([{1, 2, 5}, {1, 2}, {3, 4}],
+             [{1, 3}, {1, 4}, {2, 3}, {2, 4}]),
+            ([{'a', 'b'}, {'b', 'c'}], [{'b'}, {'a', 'c'}]),
+            (list(linear_conflicts(4, 3)),
+             [{3, 7}, {1, 4, 7}, {8, 1, 5}, {1, 5, 9}, {1, 5, 7}, {2, 4, 7},
+              {8, 2, 5}, {9, 2, 5}, {2, 5, 7}, {8, 3, 5}, {9, 3, 5},
+              {8, 3, 6}, {9, 3, 6}, {8, 1, 4, 6}, {1, 4, 6, 9},
+              {8, 2, 4, 6}, {9, 2, 4, 6}]),
+        ]
+
+    def test_empty_list_of_conflicts_does_nothing(self):
+        for engine_class in (BitsetHsDag, BitsetRcTree):
+            engine = engine_class([])
+            for solve_args in self.solve_options:
+                engine.solve(*solve_args)
+                self.assertEqual(
+                    [], list(engine.generate_minimal_hitting_sets()))
+                self.assertIsNone(engine.root)
+
+    def test_solving(self):
+        for engine_class in (BitsetHsDag, BitsetRcTree):
+            for list_of_conflicts, expected_mhs in self.problems:
+                engine = engine_class(list_of_conflicts)
+                for solve_args in self.solve_options:
+                    engine.solve(*solve_args)
+                    solutions = list(engine.generate_minimal_hitting_sets())
+                    for solution in solutions:
+                        self.assertIsInstance(solution, SolutionSet)
+                    self.assertEqual(set(map(frozenset, expected_mhs)),
+                                     set(map(frozenset, solutions)))
+                    self.assertTrue(engine.verify())
+
+    def test_parallel_solving(self):
+        for list_of_conflicts, expected_mhs in self.problems:
+            engine = BitsetRcTree(list_of_conflicts)
+            for solve_args in self.solve_options:
+                engine.solve(*solve_args, workers=2)
+                self.assertEqual(
+                    set(map(frozenset, expected_mhs)),
+                    set(map(frozenset,
+                            engine.generate_minimal_hitting_sets())))
+                self.assertTrue(engine.verify())
+
+    def test_resetting_deletes_everything(self):
+        for engine_class in (BitsetHsDag, BitsetRcTree):
+            engine = engine_class([{1}, {3, 4, 5}])
+            engine.solve()
+            engine.reset()
+            self.assertEqual(
+                [], list(engine.generate_minimal_hitting_sets()))
+            self.assertIsNone(engine.root)
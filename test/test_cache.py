@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from unittest import TestCase
+
+from minihit import linear_conflicts
+from minihit.algcompare import solve_from_file
+from minihit.cache import CachedProblem, SolutionsCache, canonical_form
+from minihit.mmcs import Mmcs
+from minihit.rctree import RcTree
+
+
+class TestCanonicalForm(TestCase):
+    def test_independent_of_order_and_duplicates(self):
+        family, elements = canonical_form([{1, 2}, {2, 3}, {3, 4, 5}])
+        reordered_family, reordered_elements = canonical_form(
+            [{5, 3, 4}, {3, 2}, {2, 1}, {1, 2}])
+        self.assertEqual(family, reordered_family)
+        self.assertEqual(elements, reordered_elements)
+        self.assertEqual(((0, 3), (1, 2, 4), (3, 4)), family)
+
+    def test_renamed_elements(self):
+        family, _ = canonical_form([{1, 2}, {2, 3}])
+        renamed_family, elements = canonical_form([{'b', 'c'}, {'a', 'b'}])
+        self.assertEqual(family, renamed_family)
+        self.assertEqual(['a', 'c', 'b'], elements)
+
+    def test_does_not_modify_input(self):
+        list_of_conflicts = [{1, 2}, {1, 2}]
+        canonical_form(list_of_conflicts)
+        self.assertEqual([{1, 2}, {1, 2}], list_of_conflicts)
+
+
+class TestSolutionsCache(TestCase):
+    def test_hits_and_misses(self):
+        solutions_cache = SolutionsCache()
+        self.assertIsNone(solutions_cache.get('a'))
+        solutions_cache.put('a', [[0], [1, 2]])
+        self.assertEqual([[0], [1, 2]], solutions_cache.get('a'))
+        self.assertEqual(1, solutions_cache.hits)
+        self.assertEqual(1, solutions_cache.misses)
+        self.assertEqual(1, len(solutions_cache))
+
+    def test_evicts_least_recently_used(self):
+        solutions_cache = SolutionsCache(max_size=6)
+        solutions_cache.put('a', [[0, 1]])
+        solutions_cache.put('b', [[0, 1]])
+        solutions_cache.get('a')
+        solutions_cache.put('c', [[0, 1]])
+        self.assertEqual(1, solutions_cache.evictions)
+        self.assertIsNone(solutions_cache.get('b'))
+        self.assertIsNotNone(solutions_cache.get('a'))
+        self.assertIsNotNone(solutions_cache.get('c'))
+        solutions_cache.clear()
+        self.assertEqual(0, len(solutions_cache))
+
+    def test_on_disk_tier(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SolutionsCache(directory=directory).put('a', [[0], [1, 2]])
+            solutions_cache = SolutionsCache(directory=directory)
+            self.assertEqual([[0], [1, 2]], solutions_cache.get('a'))
+            self.assertIsNone(solutions_cache.get('b'))
+            self.assertEqual(1, solutions_cache.hits)
+            self.assertEqual(1, solutions_cache.misses)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            SolutionsCache(max_size=-1)
+
+
+class TestCachedProblem(TestCase):
+    def setUp(self):
+        self.list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(self.list_of_conflicts)
+        rc_tree.solve(sort=True)
+        self.expected_mhs = set(map(frozenset,
+                                    rc_tree.generate_minimal_hitting_sets()))
+
+    def test_empty_list_of_conflicts_does_nothing(self):
+        problem = CachedProblem([])
+        problem.solve()
+        self.assertEqual([], list(problem.generate_minimal_hitting_sets()))
+        self.assertFalse(problem.was_cached)
+
+    def test_reuses_solutions_of_reordered_conflicts(self):
+        solutions_cache = SolutionsCache()
+        problem = CachedProblem(self.list_of_conflicts, Mmcs,
+                                solutions_cache)
+        problem.solve()
+        self.assertFalse(problem.was_cached)
+        self.assertGreater(problem.amount_of_nodes_constructed, 0)
+        self.assertEqual(self.expected_mhs, set(
+            map(frozenset, problem.generate_minimal_hitting_sets())))
+        problem = CachedProblem(
+            [set(reversed(sorted(conflict)))
+             for conflict in reversed(self.list_of_conflicts)],
+            Mmcs, solutions_cache)
+        problem.solve()
+        self.assertTrue(problem.was_cached)
+        self.assertEqual(0, problem.amount_of_nodes_constructed)
+        self.assertEqual(self.expected_mhs, set(
+            map(frozenset, problem.generate_minimal_hitting_sets())))
+        self.assertTrue(problem.verify())
+
+    def test_conflicts_removed_when_cached(self):
+        list_of_conflicts = [{1, 2}, {2, 1}, {1, 2, 3}, {3, 4}]
+        solutions_cache = SolutionsCache()
+        for expected_cached in (False, True):
+            problem = CachedProblem(list_of_conflicts, cache=solutions_cache)
+            problem.solve(subsume=True)
+            self.assertEqual(expected_cached, problem.was_cached)
+            self.assertEqual(2, problem.amount_of_conflicts_removed)
+        self.assertEqual(0, problem.amount_of_nodes_constructed)
+        problem.solve(subsume=False)
+        self.assertEqual(0, problem.amount_of_conflicts_removed)
+
+    def test_renamed_elements(self):
+        solutions_cache = SolutionsCache()
+        CachedProblem([{1, 2}, {2, 3}], cache=solutions_cache).solve()
+        problem = CachedProblem([{'a', 'b'}, {'b', 'c'}],
+                                cache=solutions_cache)
+        problem.solve()
+        self.assertTrue(problem.was_cached)
+        self.assertEqual({frozenset({'b'}), frozenset({'a', 'c'})}, set(
+            map(frozenset, problem.generate_minimal_hitting_sets())))
+
+    def test_different_options_are_not_reused(self):
+        solutions_cache = SolutionsCache()
+        problem = CachedProblem(self.list_of_conflicts, cache=solutions_cache)
+        problem.solve(max_cardinality=1)
+        problem.solve(max_cardinality=2)
+        self.assertFalse(problem.was_cached)
+        problem.solve(max_cardinality=2)
+        self.assertTrue(problem.was_cached)
+        self.assertEqual(
+            {solution for solution in self.expected_mhs
+             if len(solution) <= 2},
+            set(map(frozenset, problem.generate_minimal_hitting_sets())))
+
+
+    def test_partial_solutions_are_not_stored(self):
+        solutions_cache = SolutionsCache()
+        problem = CachedProblem(list(linear_conflicts(7, 4, 2)),
+                                cache=solutions_cache)
+        problem.solve(max_nodes=10)
+        self.assertFalse(problem.problem.is_complete)
+        self.assertEqual(0, len(solutions_cache))
+
+
+class TestSolveFromFileWithCache(TestCase):
+    def test_repeated_lines_are_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_file_name = os.path.join(directory, 'input.txt')
+            with open(input_file_name, 'w') as input_file:
+                input_file.write("1,2 | 2,3\n3,2 | 2,1 | 1,2\n5,6 | 6,7\n")
+            solutions_cache = SolutionsCache()
+            results = list(solve_from_file(input_file_name, jobs=1,
+                                           solutions_cache=solutions_cache))
+            self.assertEqual([False, True, True],
+                             [result.cached for result in results])
+            self.assertEqual([{frozenset({2}), frozenset({1, 3})},
+                              {frozenset({2}), frozenset({1, 3})},
+                              {frozenset({6}), frozenset({5, 7})}],
+                             [set(map(frozenset, result.solutions))
+                              for result in results])
+            self.assertEqual(2, solutions_cache.hits)
+            self.assertEqual(1, solutions_cache.misses)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import linear_conflicts, SolutionSet
+from minihit.components import Decomposition, connected_components
+from minihit.hsdag import HsDag
+from minihit.mmcs import Mmcs
+
+
+class TestConnectedComponents(TestCase):
+    def test_connected_components(self):
+        list_of_conflicts = [{1, 2}, {5, 6}, {3}, {2, 3}, set(), {6, 7},
+                             {8}]
+        self.assertEqual([[{1, 2}, {3}, {2, 3}], [{5, 6}, {6, 7}], [set()],
+                          [{8}]],
+                         connected_components(list_of_conflicts))
+        self.assertEqual(7, len(list_of_conflicts))
+
+    def test_single_component(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        self.assertEqual([list_of_conflicts],
+                         connected_components(list_of_conflicts))
+        self.assertEqual([], connected_components([]))
+
+
+class TestDecomposition(TestCase):
+    def setUp(self):
+        self.list_of_conflicts = (list(linear_conflicts(3, 3))
+                                  + [{10, 11}, {11, 12}, {20}])
+        hs_dag = HsDag(self.list_of_conflicts)
+        hs_dag.solve(sort=True)
+        self.expected_mhs = set(map(frozenset,
+                                    hs_dag.generate_minimal_hitting_sets()))
+
+    def test_empty_list_of_conflicts_does_nothing(self):
+        decomposition = Decomposition([])
+        decomposition.solve()
+        self.assertEqual([], list(decomposition.generate_minimal_hitting_sets()))
+        self.assertEqual([], decomposition.components)
+
+    def test_solving(self):
+        for engine_class in (HsDag, Mmcs):
+            decomposition = Decomposition(self.list_of_conflicts, engine_class)
+            for workers in (None, 2):
+                decomposition.solve(workers=workers, sort=True)
+                self.assertEqual(3, len(decomposition.components))
+                solutions = list(decomposition.generate_minimal_hitting_sets())
+                for solution in solutions:
+                    self.assertIsInstance(solution, SolutionSet)
+                self.assertEqual(len(self.expected_mhs), len(solutions))
+                self.assertEqual(self.expected_mhs,
+                                 set(map(frozenset, solutions)))
+                self.assertTrue(decomposition.verify())
+
+    def test_prune_and_sort_as_positional_arguments(self):
+        decomposition = Decomposition(self.list_of_conflicts)
+        for prune, sort in ((True, False), (False, True), (False, False)):
+            decomposition.solve(prune, sort)
+            self.assertEqual(
+                self.expected_mhs,
+                set(map(frozenset,
+                        decomposition.generate_minimal_hitting_sets())))
+        with self.assertRaises(TypeError):
+            decomposition.solve(True, False, 2)
+
+    def test_max_cardinality(self):
+        decomposition = Decomposition(self.list_of_conflicts)
+        decomposition.solve(max_cardinality=4)
+        self.assertEqual(
+            set(mhs for mhs in self.expected_mhs if len(mhs) <= 4),
+            set(map(frozenset, decomposition.generate_minimal_hitting_sets())))
+        decomposition.solve(max_cardinality=2)
+        self.assertEqual(
+            [], list(decomposition.generate_minimal_hitting_sets()))
+
+    def test_subsume_in_components(self):
+        decomposition = Decomposition(self.list_of_conflicts + [{1, 2, 3, 4},
+                                                                {20, 21}])
+        for workers in (None, 2):
+            decomposition.solve(workers=workers, subsume=True)
+            self.assertEqual(2, decomposition.amount_of_conflicts_removed)
+            self.assertEqual(
+                self.expected_mhs,
+                set(map(frozenset,
+                        decomposition.generate_minimal_hitting_sets())))
+
+    def test_invalid_amount_of_workers(self):
+        decomposition = Decomposition([{1}])
+        with self.assertRaises(ValueError):
+            decomposition.solve(workers=0)
+
+    def test_resetting_deletes_everything(self):
+        decomposition = Decomposition(self.list_of_conflicts)
+        decomposition.solve()
+        decomposition.reset()
+        self.assertEqual([], list(decomposition.generate_minimal_hitting_sets()))
+        self.assertEqual(0, decomposition.amount_of_nodes_constructed)
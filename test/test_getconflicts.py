@@ -1,49 +1,54 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import os
+import tempfile
 from unittest import TestCase
 
-from minihit.getconflicts import ConflictSetsFileParser, linear_conflicts
+from minihit.getconflicts import (ConflictSetsFileParser, linear_conflicts,
+                                  random_conflicts)
+
+
+FILES_AND_EXPECTED = {
+    '01_empty.txt': {},
+    '02_only_comments.txt': {},
+    '03_simple_one_line.txt': {1: [{1, 2}, {3, 4}, {1, 2, 5}]},
+    '04_redundant_values_in_first_set.txt': {1: [{1}, {3, 4}]},
+    '05_trailing_commas.txt': {1: [{1}, {1, 2}]},
+    '06_empty_last_set.txt': {1: [{1, 2}, {2, 3}]},
+    '07_empty_first_set.txt': {1: [{1, 2}]},
+    '08_empty_middle_set.txt': {1: [{1, 2}, {3, 4}]},
+    '09_simple_multiline.txt': {
+        1: [{1, 2}, {3, 4}, {1, 2, 5}],
+        2: [{2, 3}, {4, 5}, {1, 2, 5}]
+    },
+    '10_simple_multiline_with_comments.txt': {
+        1: [{1, 2}, {3, 4}, {1, 2, 5}],
+        3: [{2, 3}, {4, 5}, {1, 2, 5}]
+    },
+    '11_combined.txt': {
+        2: [{1, 2}, {3, 4}, {1, 2, 5}],
+        3: [{1}, {3, 4}],
+        4: [{1}, {1, 2}],
+        5: [{1, 2}, {2, 3}],
+        6: [{1, 2}],
+        7: [{1, 2}, {3, 4}],
+    },
+    '12_with_brackets.txt': {
+        1: [{1, 2}, {3, 4}, {1, 2, 5}],
+        2: [{2, 3}, {4, 5}, {1, 2, 5}]
+    },
+    '13_python_set_syntax.txt': {
+        1: [{1, 2, 3, 4, 7}, {1, 2, 4, 6, 8, 10}, {8, 9, 2, 10}, {10},
+            {3, 5, 6, 7, 10}, {4, 5, 8, 9, 10}, {1, 2, 5, 8, 9},
+            {3, 4, 5, 6, 7, 9, 10}, {8, 5, 6}, {3, 4, 5, 6, 10}],
+    }
+}
 
 
 class TestConflictSetsFileParser(TestCase):
     def setUp(self):
         self.input_files_folder = 'parser_files'
-        self.files_and_expected = {
-            '01_empty.txt': {},
-            '02_only_comments.txt': {},
-            '03_simple_one_line.txt': {1: [{1, 2}, {3, 4}, {1, 2, 5}]},
-            '04_redundant_values_in_first_set.txt': {1: [{1}, {3, 4}]},
-            '05_trailing_commas.txt': {1: [{1}, {1, 2}]},
-            '06_empty_last_set.txt': {1: [{1, 2}, {2, 3}]},
-            '07_empty_first_set.txt': {1: [{1, 2}]},
-            '08_empty_middle_set.txt': {1: [{1, 2}, {3, 4}]},
-            '09_simple_multiline.txt': {
-                1: [{1, 2}, {3, 4}, {1, 2, 5}],
-                2: [{2, 3}, {4, 5}, {1, 2, 5}]
-            },
-            '10_simple_multiline_with_comments.txt': {
-                1: [{1, 2}, {3, 4}, {1, 2, 5}],
-                3: [{2, 3}, {4, 5}, {1, 2, 5}]
-            },
-            '11_combined.txt': {
-                2: [{1, 2}, {3, 4}, {1, 2, 5}],
-                3: [{1}, {3, 4}],
-                4: [{1}, {1, 2}],
-                5: [{1, 2}, {2, 3}],
-                6: [{1, 2}],
-                7: [{1, 2}, {3, 4}],
-            },
-            '12_with_brackets.txt': {
-                1: [{1, 2}, {3, 4}, {1, 2, 5}],
-                2: [{2, 3}, {4, 5}, {1, 2, 5}]
-            },
-            '13_python_set_syntax.txt': {
-                1: [{1, 2, 3, 4, 7}, {1, 2, 4, 6, 8, 10}, {8, 9, 2, 10}, {10},
-                    {3, 5, 6, 7, 10}, {4, 5, 8, 9, 10}, {1, 2, 5, 8, 9},
-                    {3, 4, 5, 6, 7, 9, 10}, {8, 5, 6}, {3, 4, 5, 6, 10}],
-            }
-        }
+        self.files_and_expected = FILES_AND_EXPECTED
 
     def test_all(self):
         for file_name, expected in self.files_and_expected.items():
@@ -66,3 +71,59 @@ class TestLinearConflictsGenerator(TestCase):
         self.assertEqual(expected, obtained)
 
 
+class TestRandomConflictsGenerator(TestCase):
+    def test_seed_gives_same_conflicts(self):
+        obtained = list(random_conflicts(20, 8, seed=3))
+        self.assertEqual(obtained, list(random_conflicts(20, 8, seed=3)))
+        self.assertEqual(20, len(obtained))
+        for conflict in obtained:
+            self.assertTrue(1 <= len(conflict) <= 8)
+            self.assertTrue(conflict.issubset(range(1, 9)))
+
+
+class TestConflictSetsFileParserIterParse(TestCase):
+    def setUp(self):
+        self.input_files_folder = 'parser_files'
+
+    def test_all(self):
+        for file_name, expected in FILES_AND_EXPECTED.items():
+            relative_file_path = os.path.join(self.input_files_folder,
+                                              file_name)
+            parser = ConflictSetsFileParser()
+            for options in (dict(), dict(chunk_size=1),
+                            dict(workers=2, chunk_size=1),
+                            dict(workers=2, chunk_size=3)):
+                self.assertEqual(list(expected.items()),
+                                 list(parser.iter_parse(relative_file_path,
+                                                        **options)),
+                                 (file_name, options))
+
+    def test_lines_in_file(self):
+        parser = ConflictSetsFileParser()
+        parsed_lines = parser.iter_parse(os.path.join(
+            self.input_files_folder, '11_combined.txt'))
+        self.assertEqual(2, next(parsed_lines)[0])
+        self.assertEqual(2, parser.lines_in_file)
+        self.assertEqual(5, len(list(parsed_lines)))
+        self.assertEqual(7, parser.lines_in_file)
+
+    def test_custom_separators(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_file_name = os.path.join(directory, 'input.txt')
+            with open(input_file_name, 'w') as input_file:
+                input_file.write("a:b; c  // Comment\n\n{d}, {e}\n")
+            parser = ConflictSetsFileParser(comment_char='//',
+                                            set_separator=';',
+                                            element_separator=':',
+                                            element_caster_function=str)
+            self.assertEqual([(1, [{'a', 'b'}, {'c'}]),
+                              (3, [{'d'}, {'e'}])],
+                             list(parser.iter_parse(input_file_name)))
+
+    def test_invalid_arguments(self):
+        parser = ConflictSetsFileParser()
+        file_name = os.path.join(self.input_files_folder, '01_empty.txt')
+        with self.assertRaises(ValueError):
+            list(parser.iter_parse(file_name, workers=0))
+        with self.assertRaises(ValueError):
+            list(parser.iter_parse(file_name, chunk_size=0))
@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 from unittest import TestCase
 
-from minihit import linear_conflicts
-from minihit.hsdag import HsDag, HsDagNode
+from minihit import linear_conflicts, random_conflicts
+from minihit.bitset import BitsetHsDag, BitsetRcTree
+from minihit.hsdag import HsDag, HsDagNode, _WorkingConflicts
+from minihit.mmcs import Mmcs
+from minihit.rctree import RcTree
 
 
 class TestHsDagNode(TestCase):
@@ -58,6 +61,29 @@ class TestHsDagNode(TestCase):
         node.children = dict()
         self.assertTrue(node.is_childless)
 
+    def test_reinitialize(self):
+        node = HsDagNode()
+        other_node = HsDagNode()
+        node.path_from_root.add(3)
+        node.children[3] = other_node
+        node.parents[4] = other_node
+        node.label = {1, 2, 3}
+        node.close()
+        path_before_reinitialization = node.path_from_root
+        node.reinitialize()
+        self.assertFalse(node.is_closed)
+        self.assertFalse(node.is_ticked)
+        self.assertIsNone(node.label)
+        self.assertEqual(0, len(node.path_from_root))
+        self.assertEqual(0, len(node.children))
+        self.assertEqual(0, len(node.parents))
+        self.assertEqual({3}, path_before_reinitialization)
+
+    def test_no_instance_dict(self):
+        node = HsDagNode()
+        with self.assertRaises(AttributeError):
+            node.unknown_attribute = 1
+
 
 class TestHsDag(TestCase):
     def setUp(self):
@@ -195,6 +221,93 @@ class TestHsDag(TestCase):
                          list(hs_dag.generate_minimal_hitting_sets()))
         self.assertTrue(hs_dag.verify())
 
+    def test_nodes_with_same_path_are_reused(self):
+        list_of_conflicts = [{1, 3}, {1, 4}, {3, 4}]
+        expected_mhs = [{1, 3}, {1, 4}, {3, 4}]
+        hs_dag = HsDag(list_of_conflicts)
+        for solve_args in self.solve_options:
+            hs_dag.solve(*solve_args)
+            self.assertEqual(expected_mhs,
+                             list(hs_dag.generate_minimal_hitting_sets()))
+            self.assertEqual(6, hs_dag.amount_of_nodes_constructed)
+            self.assertEqual(6, len(list(
+                hs_dag.breadth_first_explore(hs_dag.root))))
+
+    def test_iter_solve_provides_same_solutions_as_solve(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        for solve_args in self.solve_options:
+            hs_dag.solve(*solve_args)
+            expected_mhs = list(hs_dag.generate_minimal_hitting_sets())
+            self.assertEqual(set(map(frozenset, expected_mhs)),
+                             set(map(frozenset, hs_dag.iter_solve(*solve_args))))
+
+    def test_stopping_iter_solve_stops_construction(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        hs_dag.solve(sort=True)
+        nodes_for_all_solutions = hs_dag.amount_of_nodes_constructed
+        solutions = hs_dag.iter_solve(sort=True)
+        self.assertEqual({3, 7}, next(solutions))
+        solutions.close()
+        self.assertLess(hs_dag.amount_of_nodes_constructed,
+                        nodes_for_all_solutions)
+
+    def test_iter_solve_empty_list_of_conflicts(self):
+        hs_dag = HsDag([])
+        self.assertEqual([], list(hs_dag.iter_solve()))
+
+    def test_max_cardinality(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        for solve_args in self.solve_options:
+            hs_dag.solve(*solve_args)
+            all_mhs = set(map(frozenset,
+                              hs_dag.generate_minimal_hitting_sets()))
+            nodes_without_bound = hs_dag.amount_of_nodes_constructed
+            hs_dag.solve(*solve_args, max_cardinality=3)
+            self.assertEqual(
+                set(mhs for mhs in all_mhs if len(mhs) <= 3),
+                set(map(frozenset, hs_dag.generate_minimal_hitting_sets())))
+            self.assertLess(hs_dag.amount_of_nodes_constructed,
+                            nodes_without_bound)
+            hs_dag.solve(*solve_args, max_cardinality=1)
+            self.assertEqual([], list(hs_dag.generate_minimal_hitting_sets()))
+
+    def test_negative_max_cardinality(self):
+        hs_dag = HsDag([{1}])
+        with self.assertRaises(ValueError):
+            hs_dag.solve(max_cardinality=-1)
+
+    def test_add_conflict_to_solved(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        for solve_args in self.solve_options:
+            solved_from_scratch = HsDag(list_of_conflicts + [{2, 6, 10}])
+            solved_from_scratch.solve(*solve_args)
+            expected_mhs = set(map(
+                frozenset, solved_from_scratch.generate_minimal_hitting_sets()))
+            hs_dag.list_of_conflicts = list_of_conflicts[:2]
+            hs_dag.solve(*solve_args)
+            hs_dag.add_conflict(list_of_conflicts[2])
+            hs_dag.add_conflict(list_of_conflicts[3])
+            hs_dag.add_conflict({2, 6, 10})
+            solutions = list(hs_dag.generate_minimal_hitting_sets())
+            self.assertEqual(len(expected_mhs), len(solutions))
+            self.assertEqual(expected_mhs, set(map(frozenset, solutions)))
+            self.assertTrue(hs_dag.verify())
+        self.assertEqual(4, len(list_of_conflicts))
+
+    def test_add_conflict_before_solving(self):
+        hs_dag = HsDag([{1, 2}])
+        hs_dag.add_conflict({2, 3})
+        self.assertEqual([{1, 2}, {2, 3}], hs_dag.list_of_conflicts)
+        self.assertEqual([], list(hs_dag.generate_minimal_hitting_sets()))
+        hs_dag.solve()
+        self.assertEqual(set(map(frozenset, [{2}, {1, 3}])),
+                         set(map(frozenset,
+                                 hs_dag.generate_minimal_hitting_sets())))
+
     def test_solving_does_not_alter_list_of_conflicts(self):
         list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
         original_list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
@@ -204,6 +317,21 @@ class TestHsDag(TestCase):
             self.assertEqual(original_list_of_conflicts,
                              hs_dag.list_of_conflicts)
 
+    def test_subsume_removes_redundant_conflicts(self):
+        list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}, {3, 4}, {1, 2, 3}]
+        expected_mhs = [{1, 3}, {1, 4}, {2, 3}, {2, 4}]
+        hs_dag = HsDag(list_of_conflicts)
+        for solve_args in self.solve_options:
+            hs_dag.solve(*solve_args, subsume=True)
+            self.assertEqual(3, hs_dag.amount_of_conflicts_removed)
+            self.assertEqual(set(map(frozenset, expected_mhs)),
+                             set(map(frozenset,
+                                     hs_dag.generate_minimal_hitting_sets())))
+            self.assertTrue(hs_dag.verify())
+            self.assertEqual(5, len(hs_dag.list_of_conflicts))
+            hs_dag.solve(*solve_args)
+            self.assertEqual(0, hs_dag.amount_of_conflicts_removed)
+
     def test_resetting_deletes_everything(self):
         list_of_conflicts_initial = [{1}, {3, 4, 5}]
         hs_dag = HsDag(list_of_conflicts_initial)
@@ -213,3 +341,227 @@ class TestHsDag(TestCase):
         self.assertIsNone(hs_dag.root)
         self.assertEqual(0, len(
             list(hs_dag.breadth_first_explore(hs_dag.root))))
+
+
+class _RecordingRelabels(object):
+    """Mixin recording each relabelling done by the pruning, as the path of
+    the relabelled node, its previous label and its new label."""
+
+    def reset(self):
+        super().reset()
+        self.relabels = []
+
+    def _relabel_and_trim(self, node_in_processing, other_node):
+        self.relabels.append((frozenset(other_node.path_from_root),
+                              frozenset(other_node.label),
+                              frozenset(node_in_processing.label)))
+        super()._relabel_and_trim(node_in_processing, other_node)
+
+
+class _LinearScanPruning(_RecordingRelabels):
+    """Mixin pruning with a scan of the whole DAG instead of the label
+    index."""
+
+    def _prune(self, node_in_processing):
+        if not self._label_was_previously_used(node_in_processing):
+            for other_node in list(self.breadth_first_explore(self.root)):
+                if (other_node.label is not None
+                        and node_in_processing.label < other_node.label):
+                    self._relabel_and_trim(node_in_processing, other_node)
+
+    def _label_was_previously_used(self, node_in_processing):
+        if node_in_processing.label is None:
+            return True
+        for node in self.breadth_first_explore(self.root):
+            if (node_in_processing is not node
+                    and node_in_processing.label == node.label):
+                return True
+        return False
+
+
+class _RecordingWorkingConflicts(_WorkingConflicts):
+    def __init__(self, conflicts, freeze, retires):
+        super().__init__(conflicts, freeze)
+        self.retires = retires
+
+    def retire(self, conflict):
+        before = list(self)
+        super().retire(conflict)
+        self.retires.append((before, list(self)))
+
+
+class _RecordingRetires(object):
+    """Mixin recording the working conflicts before and after each
+    retirement."""
+
+    def reset(self):
+        super().reset()
+        self.retires = []
+
+    def _clone_list_of_conflicts(self, sort, subsume=False, kernelize=False):
+        super()._clone_list_of_conflicts(sort, subsume, kernelize)
+        self._working_list_of_conflicts = _RecordingWorkingConflicts(
+            self._working_list_of_conflicts, self._frozen, self.retires)
+
+
+class _CheckingIndexes(object):
+    """Mixin recording after each processed node whether the label index
+    matches the labels of the nodes in the DAG."""
+
+    def reset(self):
+        super().reset()
+        self.inconsistencies = []
+
+    def _process_node(self, node_in_processing, prune):
+        super()._process_node(node_in_processing, prune)
+        nodes_by_label = dict()
+        for node in self.breadth_first_explore(self.root):
+            if node.label is not None:
+                nodes_by_label.setdefault(frozenset(node.label),
+                                          set()).add(node)
+        indexed_nodes_by_label = {label: set(nodes) for label, nodes
+                                  in self._nodes_by_label.items()}
+        if (nodes_by_label != indexed_nodes_by_label or
+                set(nodes_by_label) != set(self._labels_in_use)):
+            self.inconsistencies.append(
+                frozenset(node_in_processing.path_from_root))
+
+
+class TestPruningIndexes(TestCase):
+    def setUp(self):
+        self.lists_of_conflicts = [
+            [{1, 2, 5}, {3, 4}, {1, 2}],
+            [{1, 2, 3, 4}, {2, 3}, {1, 4}, {3, 4}, {2}],
+            [{1, 2, 3}, {1, 2, 3}, {1, 2}, {2, 4}, {1, 2, 4, 5}, {4}],
+        ] + [list(random_conflicts(10, 6, seed=seed)) for seed in range(20)]
+
+    def test_same_relabels_as_linear_scan(self):
+        for engine_class in (HsDag, RcTree):
+            indexed_class = type('Indexed', (_RecordingRelabels,
+                                             engine_class), {})
+            linear_class = type('Linear', (_LinearScanPruning,
+                                           engine_class), {})
+            total_relabels = 0
+            for list_of_conflicts in self.lists_of_conflicts:
+                indexed = indexed_class(list_of_conflicts)
+                indexed.solve(prune=True)
+                linear = linear_class(list_of_conflicts)
+                linear.solve(prune=True)
+                self.assertEqual(sorted(linear.relabels, key=repr),
+                                 sorted(indexed.relabels, key=repr))
+                self.assertEqual(
+                    set(map(frozenset,
+                            linear.generate_minimal_hitting_sets())),
+                    set(map(frozenset,
+                            indexed.generate_minimal_hitting_sets())))
+                total_relabels += len(indexed.relabels)
+            self.assertGreater(total_relabels, 0)
+
+    def test_retiring_duplicate_keeps_other_copy(self):
+        working_conflicts = _WorkingConflicts([{1, 2}, {3}, {2, 1}])
+        working_conflicts.retire({1, 2})
+        self.assertEqual([{3}, {1, 2}], list(working_conflicts))
+        self.assertIsNone(working_conflicts.get(0))
+        self.assertEqual({1, 2}, working_conflicts.get(2))
+        working_conflicts.retire({1, 2})
+        self.assertEqual([{3}], list(working_conflicts))
+        working_conflicts.retire({1, 2})
+        working_conflicts.retire({4})
+        self.assertEqual([{3}], list(working_conflicts))
+        self.assertEqual(1, len(working_conflicts))
+
+    def test_retiring_duplicate_while_solving(self):
+        # {1, 2, 3} labels the root and is retired when {1, 2} relabels it,
+        # while its copy is still a working conflict
+        list_of_conflicts = [{1, 2, 3}, {1, 2, 3}, {1, 2}, {3, 4}]
+        for engine_class in (HsDag, RcTree):
+            problem = type('Recording', (_RecordingRetires, engine_class),
+                           {})(list_of_conflicts)
+            problem.solve(prune=True)
+            self.assertTrue(problem.retires)
+            before, after = problem.retires[0]
+            self.assertEqual(2, before.count({1, 2, 3}))
+            self.assertEqual(1, after.count({1, 2, 3}))
+            self.assertEqual([[1, 3], [1, 4], [2, 3], [2, 4]], sorted(
+                map(sorted, problem.generate_minimal_hitting_sets())))
+
+    def test_label_index_matches_nodes_after_trims_and_closings(self):
+        for engine_class in (HsDag, RcTree):
+            checked_class = type('Checked', (_CheckingIndexes,
+                                             engine_class), {})
+            trims = 0
+            closings = 0
+            for list_of_conflicts in self.lists_of_conflicts:
+                for solve_args in ((True, False), (False, False),
+                                   (False, True)):
+                    problem = checked_class(list_of_conflicts)
+                    problem.solve(*solve_args)
+                    self.assertEqual([], problem.inconsistencies)
+                    trims += problem.stats.trims
+                    closings += problem.stats.closings
+            self.assertGreater(trims, 0)
+            self.assertGreater(closings, 0)
+
+
+class TestLimits(TestCase):
+    def setUp(self):
+        self.list_of_conflicts = list(linear_conflicts(7, 4, 2))
+        mmcs = Mmcs(self.list_of_conflicts)
+        mmcs.solve()
+        self.expected_mhs = set(map(frozenset,
+                                    mmcs.generate_minimal_hitting_sets()))
+
+    def test_max_nodes(self):
+        for engine_class in (HsDag, RcTree, BitsetHsDag, BitsetRcTree):
+            problem = engine_class(self.list_of_conflicts)
+            problem.solve(prune=False, max_nodes=40)
+            self.assertFalse(problem.is_complete)
+            self.assertGreaterEqual(problem.amount_of_nodes_constructed, 40)
+            self.assertEqual(len(problem.nodes_to_process),
+                             problem.frontier_size)
+            self.assertGreater(problem.frontier_size, 0)
+            solutions = set(map(frozenset,
+                                problem.generate_minimal_hitting_sets()))
+            self.assertTrue(solutions.issubset(self.expected_mhs))
+            self.assertEqual(
+                {solution for solution in self.expected_mhs
+                 if len(solution) <= problem.completed_cardinality},
+                {solution for solution in solutions
+                 if len(solution) <= problem.completed_cardinality})
+
+    def test_limits_not_reached(self):
+        for engine_class in (HsDag, RcTree):
+            problem = engine_class(self.list_of_conflicts)
+            problem.solve(sort=True, timeout=60, max_nodes=10 ** 6)
+            self.assertTrue(problem.is_complete)
+            self.assertIsNone(problem.completed_cardinality)
+            self.assertEqual(0, problem.frontier_size)
+            self.assertEqual(self.expected_mhs, set(
+                map(frozenset, problem.generate_minimal_hitting_sets())))
+
+    def test_timeout(self):
+        problem = HsDag(self.list_of_conflicts)
+        problem.solve(timeout=1e-9)
+        self.assertFalse(problem.is_complete)
+        self.assertEqual(-1, problem.completed_cardinality)
+        self.assertEqual(1, problem.frontier_size)
+        self.assertEqual([], list(problem.generate_minimal_hitting_sets()))
+        problem.solve()
+        self.assertTrue(problem.is_complete)
+
+    def test_iter_solve_and_add_conflict(self):
+        problem = RcTree(self.list_of_conflicts)
+        solutions = list(problem.iter_solve(sort=True, max_nodes=40))
+        self.assertFalse(problem.is_complete)
+        self.assertTrue(set(map(frozenset, solutions))
+                        .issubset(self.expected_mhs))
+        problem.add_conflict({1, 2})
+        self.assertFalse(problem.is_complete)
+        self.assertTrue(problem.verify())
+
+    def test_invalid_limits(self):
+        problem = HsDag([{1}])
+        with self.assertRaises(ValueError):
+            problem.solve(timeout=0)
+        with self.assertRaises(ValueError):
+            problem.solve(max_nodes=0)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import SolutionSet
+from minihit.kernel import Kernel
+
+
+class TestKernel(TestCase):
+    def test_forced_elements(self):
+        list_of_conflicts = [{1}, {1, 2, 3}, {2, 4}, {4, 6}, {5}, {4, 5, 6}]
+        kernel = Kernel(list_of_conflicts)
+        self.assertEqual({1, 5}, kernel.forced_elements)
+        self.assertEqual([{2, 4}, {4, 6}], kernel.list_of_conflicts)
+        self.assertEqual({}, kernel.dominated_elements)
+        self.assertEqual([{1, 4, 5}],
+                         list(kernel.lifted(SolutionSet({4}))))
+        self.assertEqual(6, len(list_of_conflicts))
+
+    def test_forced_elements_hitting_everything(self):
+        kernel = Kernel([{1}, {1, 2}])
+        self.assertEqual([], kernel.list_of_conflicts)
+        self.assertEqual([{1}], list(kernel.lifted(SolutionSet())))
+
+    def test_dominated_elements(self):
+        list_of_conflicts = [{1, 2, 3}, {2, 3, 4}, {5, 6}, {6, 7}]
+        kernel = Kernel(list_of_conflicts)
+        self.assertEqual(set(), kernel.forced_elements)
+        self.assertEqual({2: [3]}, kernel.dominated_elements)
+        self.assertEqual([{1, 2}, {2, 4}, {5, 6}, {6, 7}],
+                         kernel.list_of_conflicts)
+        self.assertEqual([{2, 6}, {3, 6}],
+                         list(kernel.lifted(SolutionSet({2, 6}))))
+        self.assertEqual([{1, 4, 6}],
+                         list(kernel.lifted(SolutionSet({1, 4, 6}))))
+        self.assertEqual({1, 2, 3}, list_of_conflicts[0])
+
+    def test_classes_of(self):
+        kernel = Kernel([{1}, {2, 3, 4}, {2, 3, 5}, {4, 6}])
+        self.assertEqual([[2, 3], [4], [1]],
+                         kernel.classes_of(SolutionSet({2, 4})))
+        self.assertEqual([{1, 2, 4}, {1, 3, 4}],
+                         list(kernel.lifted(SolutionSet({2, 4}))))
+
+    def test_nothing_to_reduce(self):
+        list_of_conflicts = [{1, 2}, {2, 3}]
+        kernel = Kernel(list_of_conflicts)
+        self.assertEqual(list_of_conflicts, kernel.list_of_conflicts)
+        self.assertEqual([{1, 3}], list(kernel.lifted(SolutionSet({1, 3}))))
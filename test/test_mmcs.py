@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import linear_conflicts, SolutionSet
+from minihit.hsdag import HsDag
+from minihit.mmcs import Mmcs
+
+
+class TestMmcs(TestCase):
+    def setUp(self):
+        self.solve_options = [
+            (False, False),
+            (False, True),
+            (True, False),
+            (True, True),
+        ]
+        self.problems = [
+            ([{1, 3}, {1, 4}], [{1}, {3, 4}]),
+            ([{3, 4, 5}, {1}], [{1, 3}, {1, 4}, {1, 5}]),
+            ([{1, 2, 5}, {1, 2}, {3, 4}],
+             [{1, 3}, {1, 4}, {2, 3}, {2, 4}]),
+            ([{1, 2, 3, 4}, {3}, {2, 4}, {15}, {9, 2, 15}, {9, 3}, {8, 7},
+              {8, 9, 1, 7}],
+             [{8, 2, 3, 15}, {2, 3, 7, 15}, {8, 3, 4, 15}, {3, 4, 7, 15}]),
+            ([{1, 2, 3, 4, 7}, {1, 2, 4, 6, 8, 10}, {8, 9, 2, 10}, {10},
+              {3, 5, 6, 7, 10}, {4, 5, 8, 9, 10}, {1, 2, 5, 8, 9},
+              {3, 4, 5, 6, 7, 9, 10}, {8, 5, 6}, {3, 4, 5, 6, 10}],
+             [{8, 1, 10}, {8, 10, 2}, {8, 10, 3}, {8, 10, 4}, {8, 10, 7},
+              {1, 10, 5}, {10, 2, 5}, {10, 3, 5}, {10, 4, 5}, {10, 5, 7},
+              {1, 10, 6}, {10, 2, 6}, {9, 10, 3, 6}, {9, 10, 4, 6},
+              {9, 10, 6, 7}]),
+            ([{'a', 'b'}, {'b', 'c'}], [{'b'}, {'a', 'c'}]),
+        ]
+
+    def test_empty_list_of_conflicts_does_nothing(self):
+        mmcs = Mmcs([])
+        for solve_args in self.solve_options:
+            mmcs.solve(*solve_args)
+            self.assertEqual([], list(mmcs.generate_minimal_hitting_sets()))
+            self.assertTrue(mmcs.verify())
+
+    def test_solving(self):
+        for list_of_conflicts, expected_mhs in self.problems:
+            mmcs = Mmcs(list_of_conflicts)
+            for solve_args in self.solve_options:
+                mmcs.solve(*solve_args)
+                solutions = list(mmcs.generate_minimal_hitting_sets())
+                for solution in solutions:
+                    self.assertIsInstance(solution, SolutionSet)
+                self.assertEqual(len(expected_mhs), len(solutions))
+                self.assertEqual(set(map(frozenset, expected_mhs)),
+                                 set(map(frozenset, solutions)))
+                self.assertTrue(mmcs.verify())
+
+    def test_same_solutions_as_hsdag(self):
+        list_of_conflicts = list(linear_conflicts(6, 4, 2))
+        hs_dag = HsDag(list_of_conflicts)
+        hs_dag.solve(sort=True)
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve()
+        self.assertEqual(
+            set(map(frozenset, hs_dag.generate_minimal_hitting_sets())),
+            set(map(frozenset, mmcs.generate_minimal_hitting_sets())))
+
+    def test_stopping_iter_solve_stops_search(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve()
+        nodes_for_all_solutions = mmcs.amount_of_nodes_constructed
+        solutions = mmcs.iter_solve()
+        self.assertTrue(next(solutions).is_minimal_hitting(list_of_conflicts))
+        solutions.close()
+        self.assertLess(mmcs.amount_of_nodes_constructed,
+                        nodes_for_all_solutions)
+
+    def test_max_cardinality(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve()
+        all_mhs = set(map(frozenset, mmcs.generate_minimal_hitting_sets()))
+        mmcs.solve(max_cardinality=3)
+        self.assertEqual(
+            set(mhs for mhs in all_mhs if len(mhs) <= 3),
+            set(map(frozenset, mmcs.generate_minimal_hitting_sets())))
+        mmcs.solve(max_cardinality=1)
+        self.assertEqual([], list(mmcs.generate_minimal_hitting_sets()))
+        with self.assertRaises(ValueError):
+            mmcs.solve(max_cardinality=-1)
+
+    def test_same_arguments_as_hsdag(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        hs_dag = HsDag(list_of_conflicts)
+        hs_dag.solve(True, False, False, 3)
+        expected_mhs = set(map(frozenset,
+                               hs_dag.generate_minimal_hitting_sets()))
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve(True, False, True, 3)
+        self.assertEqual(expected_mhs,
+                         set(map(frozenset,
+                                 mmcs.generate_minimal_hitting_sets())))
+        mmcs.solve(vectorize=True)
+        self.assertTrue(mmcs.verify())
+        self.assertEqual(expected_mhs,
+                         set(map(frozenset,
+                                 mmcs.iter_solve(True, False, True, 3))))
+
+    def test_minimal_hitting_set_classes(self):
+        redundant_elements = 4
+        list_of_conflicts = [set(range(redundant_elements)) | {10, 11},
+                             set(range(redundant_elements)) | {20},
+                             {10, 20}, {11, 20}]
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve()
+        expected_mhs = set(map(frozenset,
+                               mmcs.generate_minimal_hitting_sets()))
+        self.assertEqual(2 * redundant_elements + 2, len(expected_mhs))
+        self.assertEqual(len(expected_mhs), mmcs.count_minimal_hitting_sets())
+        mmcs.solve(kernelize=True)
+        self.assertEqual(4,
+                         len(list(mmcs.generate_minimal_hitting_set_classes())))
+        self.assertIn([list(range(redundant_elements)), [10], [11]],
+                      list(mmcs.generate_minimal_hitting_set_classes()))
+        self.assertEqual(len(expected_mhs), mmcs.count_minimal_hitting_sets())
+        self.assertEqual(expected_mhs,
+                         set(map(frozenset,
+                                 mmcs.generate_minimal_hitting_sets())))
+
+    def test_solving_does_not_alter_list_of_conflicts(self):
+        list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
+        original_list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
+        mmcs = Mmcs(list_of_conflicts)
+        for solve_args in self.solve_options:
+            mmcs.solve(*solve_args)
+            self.assertEqual(original_list_of_conflicts,
+                             mmcs.list_of_conflicts)
+
+    def test_resetting_deletes_everything(self):
+        mmcs = Mmcs([{1}, {3, 4, 5}])
+        mmcs.solve()
+        mmcs.reset()
+        self.assertEqual([], list(mmcs.generate_minimal_hitting_sets()))
+        self.assertEqual(0, mmcs.amount_of_nodes_constructed)
@@ -48,6 +48,16 @@ class TestRcTreeNode(TestCase):
         node.label = {9}
         self.assertEqual({9}, node.label)
 
+    def test_reinitialize(self):
+        node = RcTreeNode()
+        node.theta.add(1)
+        node.theta_c.add(1)
+        node.tick()
+        node.reinitialize()
+        self.assertFalse(node.is_ticked)
+        self.assertEqual(0, len(node.theta))
+        self.assertEqual(0, len(node.theta_c))
+
 
 class TestRcTree(TestCase):
     def setUp(self):
@@ -183,6 +193,147 @@ class TestRcTree(TestCase):
                          list(rc_tree.generate_minimal_hitting_sets()))
         self.assertTrue(rc_tree.verify())
 
+    def test_iter_solve_provides_same_solutions_as_solve(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts)
+        for solve_args in self.solve_options:
+            rc_tree.solve(*solve_args)
+            expected_mhs = list(rc_tree.generate_minimal_hitting_sets())
+            self.assertEqual(set(map(frozenset, expected_mhs)),
+                             set(map(frozenset, rc_tree.iter_solve(*solve_args))))
+
+    def test_stopping_iter_solve_stops_construction(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts)
+        rc_tree.solve(sort=True)
+        nodes_for_all_solutions = rc_tree.amount_of_nodes_constructed
+        solutions = rc_tree.iter_solve(sort=True)
+        self.assertEqual({3, 7}, next(solutions))
+        solutions.close()
+        self.assertLess(rc_tree.amount_of_nodes_constructed,
+                        nodes_for_all_solutions)
+
+    def test_iter_solve_empty_list_of_conflicts(self):
+        rc_tree = RcTree([])
+        self.assertEqual([], list(rc_tree.iter_solve()))
+
+    def test_max_cardinality(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts)
+        for solve_args in self.solve_options:
+            rc_tree.solve(*solve_args)
+            all_mhs = set(map(frozenset,
+                              rc_tree.generate_minimal_hitting_sets()))
+            nodes_without_bound = rc_tree.amount_of_nodes_constructed
+            rc_tree.solve(*solve_args, max_cardinality=3)
+            self.assertEqual(
+                set(mhs for mhs in all_mhs if len(mhs) <= 3),
+                set(map(frozenset, rc_tree.generate_minimal_hitting_sets())))
+            self.assertLess(rc_tree.amount_of_nodes_constructed,
+                            nodes_without_bound)
+            rc_tree.solve(*solve_args, max_cardinality=1)
+            self.assertEqual([], list(rc_tree.generate_minimal_hitting_sets()))
+
+    def test_negative_max_cardinality(self):
+        rc_tree = RcTree([{1}])
+        with self.assertRaises(ValueError):
+            rc_tree.solve(max_cardinality=-1)
+
+    def test_add_conflict_to_solved(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts)
+        for solve_args in self.solve_options:
+            solved_from_scratch = RcTree(list_of_conflicts + [{2, 6, 10}])
+            solved_from_scratch.solve(*solve_args)
+            expected_mhs = set(map(
+                frozenset, solved_from_scratch.generate_minimal_hitting_sets()))
+            rc_tree.list_of_conflicts = list_of_conflicts[:2]
+            rc_tree.solve(*solve_args)
+            rc_tree.add_conflict(list_of_conflicts[2])
+            rc_tree.add_conflict(list_of_conflicts[3])
+            rc_tree.add_conflict({2, 6, 10})
+            solutions = list(rc_tree.generate_minimal_hitting_sets())
+            self.assertEqual(len(expected_mhs), len(solutions))
+            self.assertEqual(expected_mhs, set(map(frozenset, solutions)))
+            self.assertTrue(rc_tree.verify())
+        self.assertEqual(4, len(list_of_conflicts))
+
+    def test_add_conflict_before_solving(self):
+        rc_tree = RcTree([{1, 2}])
+        rc_tree.add_conflict({2, 3})
+        self.assertEqual([{1, 2}, {2, 3}], rc_tree.list_of_conflicts)
+        self.assertEqual([], list(rc_tree.generate_minimal_hitting_sets()))
+        rc_tree.solve()
+        self.assertEqual(set(map(frozenset, [{2}, {1, 3}])),
+                         set(map(frozenset,
+                                 rc_tree.generate_minimal_hitting_sets())))
+
+    def test_parallel_solving_provides_same_solutions(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts)
+        for solve_args in self.solve_options:
+            rc_tree.solve(*solve_args)
+            expected_mhs = set(map(frozenset,
+                                   rc_tree.generate_minimal_hitting_sets()))
+            for max_cardinality in (None, 3):
+                rc_tree.solve(*solve_args, max_cardinality=max_cardinality,
+                              workers=2)
+                solutions = list(rc_tree.generate_minimal_hitting_sets())
+                self.assertEqual(
+                    set(mhs for mhs in expected_mhs
+                        if max_cardinality is None
+                        or len(mhs) <= max_cardinality),
+                    set(map(frozenset, solutions)))
+                self.assertEqual(len(set(map(frozenset, solutions))),
+                                 len(solutions))
+                self.assertTrue(rc_tree.verify())
+
+    def test_parallel_solving_then_add_conflict(self):
+        list_of_conflicts = list(linear_conflicts(4, 3))
+        rc_tree = RcTree(list_of_conflicts[:3])
+        rc_tree.solve(workers=2)
+        rc_tree.add_conflict(list_of_conflicts[3])
+        solved_serially = RcTree(list_of_conflicts)
+        solved_serially.solve(sort=True)
+        self.assertEqual(
+            set(map(frozenset,
+                    solved_serially.generate_minimal_hitting_sets())),
+            set(map(frozenset, rc_tree.generate_minimal_hitting_sets())))
+
+    def test_invalid_amount_of_workers(self):
+        rc_tree = RcTree([{1}])
+        with self.assertRaises(ValueError):
+            rc_tree.solve(workers=0)
+
+    def test_options_after_kernelize_are_keyword_only(self):
+        rc_tree = RcTree([{1}])
+        with self.assertRaises(TypeError):
+            rc_tree.solve(True, False, False, None, False, False, 2)
+        rc_tree.solve(True, False, False, None, False, False, workers=1,
+                      timeout=2.0)
+        self.assertEqual([{1}], list(rc_tree.generate_minimal_hitting_sets()))
+
+    def test_limits_with_workers(self):
+        rc_tree = RcTree([{1}])
+        with self.assertRaises(ValueError):
+            rc_tree.solve(workers=2, max_nodes=10)
+
+    def test_kernelize(self):
+        list_of_conflicts = [{1}, {1, 2, 3}, {2, 3, 4}, {5, 6}, {6, 7},
+                             {6, 8, 9}, {5, 7, 8, 9}]
+        rc_tree = RcTree(list_of_conflicts)
+        for solve_args in self.solve_options:
+            rc_tree.solve(*solve_args)
+            expected_mhs = set(map(frozenset,
+                                   rc_tree.generate_minimal_hitting_sets()))
+            rc_tree.solve(*solve_args, kernelize=True)
+            solutions = list(rc_tree.generate_minimal_hitting_sets())
+            self.assertEqual(len(expected_mhs), len(solutions))
+            self.assertEqual(expected_mhs, set(map(frozenset, solutions)))
+            self.assertTrue(rc_tree.verify())
+            rc_tree.solve(*solve_args, max_cardinality=1, kernelize=True)
+            self.assertEqual([], list(rc_tree.generate_minimal_hitting_sets()))
+
     def test_solving_does_not_alter_list_of_conflicts(self):
         list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
         original_list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit.settrie import SetTrie
+
+
+class TestSetTrie(TestCase):
+    def setUp(self):
+        self.set_trie = SetTrie([{1, 2}, {3}, {2, 4, 5}, {'a', 1}])
+
+    def test_empty(self):
+        set_trie = SetTrie()
+        self.assertEqual(0, len(set_trie))
+        self.assertEqual([], list(set_trie))
+        self.assertFalse(set_trie.has_subset_of({1, 2, 3}))
+        self.assertEqual([], list(set_trie.supersets_of({1})))
+
+    def test_contains_only_added_sets(self):
+        self.assertEqual(4, len(self.set_trie))
+        self.assertIn({2, 1}, self.set_trie)
+        self.assertIn({5, 4, 2}, self.set_trie)
+        self.assertNotIn({2, 4}, self.set_trie)
+        self.assertNotIn({99}, self.set_trie)
+        self.assertEqual({frozenset({1, 2}), frozenset({3}),
+                          frozenset({2, 4, 5}), frozenset({'a', 1})},
+                         set(self.set_trie))
+
+    def test_adding_twice_stores_once(self):
+        self.assertFalse(self.set_trie.add({2, 1}))
+        self.assertEqual(4, len(self.set_trie))
+
+    def test_discard(self):
+        self.assertTrue(self.set_trie.discard({1, 2}))
+        self.assertFalse(self.set_trie.discard({1, 2}))
+        self.assertFalse(self.set_trie.discard({1, 99}))
+        self.assertNotIn({1, 2}, self.set_trie)
+        self.assertIn({1, 'a'}, self.set_trie)
+        self.assertEqual(3, len(self.set_trie))
+
+    def test_has_subset_of(self):
+        self.assertTrue(self.set_trie.has_subset_of({1, 2, 7}))
+        self.assertTrue(self.set_trie.has_subset_of({3}))
+        self.assertTrue(self.set_trie.has_subset_of({5, 4, 9, 2}))
+        self.assertFalse(self.set_trie.has_subset_of({1, 4, 5}))
+        self.assertFalse(self.set_trie.has_subset_of(set()))
+
+    def test_has_strict_subset_of(self):
+        self.assertFalse(self.set_trie.has_subset_of({3}, strict=True))
+        self.assertFalse(self.set_trie.has_subset_of({1, 2}, strict=True))
+        self.assertTrue(self.set_trie.has_subset_of({1, 2, 3}, strict=True))
+
+    def test_supersets_of(self):
+        self.assertEqual({frozenset({1, 2}), frozenset({2, 4, 5})},
+                         set(self.set_trie.supersets_of({2})))
+        self.assertEqual({frozenset({1, 2})},
+                         set(self.set_trie.supersets_of({1, 2})))
+        self.assertEqual(set(), set(self.set_trie.supersets_of({1, 2},
+                                                               strict=True)))
+        self.assertEqual(set(), set(self.set_trie.supersets_of({99})))
+        self.assertEqual(4, len(list(self.set_trie.supersets_of(set()))))
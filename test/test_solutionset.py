@@ -3,7 +3,7 @@
 
 from unittest import TestCase
 
-from minihit.mhs import SolutionSet
+from minihit.mhs import SolutionSet, remove_redundant_conflicts
 
 
 class TestSolutionSet(TestCase):
@@ -44,7 +44,11 @@ class TestSolutionSet(TestCase):
     def test_is_minimal_hitting_when_minimal_with_single_element_conflict_set(
             self):
         solution_set = SolutionSet([1, 3])
-        self.assertTrue(solution_set.is_minimal_hitting([{1}, {1, 3, 4}]))
+        self.assertTrue(solution_set.is_minimal_hitting([{1}, {3, 4}]))
+
+    def test_is_not_minimal_hitting_without_private_conflict(self):
+        solution_set = SolutionSet([1, 3])
+        self.assertFalse(solution_set.is_minimal_hitting([{1}, {1, 3, 4}]))
 
     def test_equality_between_solutionsets(self):
         solution_set_1 = SolutionSet()
@@ -61,3 +65,18 @@ class TestSolutionSet(TestCase):
         solution_set_1 = SolutionSet([1, 2])
         set_2 = {1, 2}
         self.assertEqual(solution_set_1, set_2)
+
+
+class TestRemoveRedundantConflicts(TestCase):
+    def test_removes_duplicates_and_supersets(self):
+        list_of_conflicts = [{1, 2, 5}, {3, 4}, {1, 2}, {3, 4}, {6},
+                             {4, 6, 7}, {1, 3}]
+        self.assertEqual([{3, 4}, {1, 2}, {6}, {1, 3}],
+                         remove_redundant_conflicts(list_of_conflicts))
+        self.assertEqual(7, len(list_of_conflicts))
+
+    def test_nothing_to_remove(self):
+        list_of_conflicts = [{1, 2}, {2, 3}, {'a'}]
+        self.assertEqual(list_of_conflicts,
+                         remove_redundant_conflicts(list_of_conflicts))
+        self.assertEqual([], remove_redundant_conflicts([]))
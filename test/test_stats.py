@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import linear_conflicts
+from minihit.bitset import BitsetHsDag, BitsetRcTree
+from minihit.hsdag import HsDag
+from minihit.rctree import RcTree
+from minihit.stats import PHASES, SolverHooks, SolverStats
+
+ENGINE_CLASSES = (HsDag, RcTree, BitsetHsDag, BitsetRcTree)
+
+
+class TestSolverStats(TestCase):
+    def test_counters_without_pruning(self):
+        for engine_class in ENGINE_CLASSES:
+            problem = engine_class([{1, 2}, {3, 4}, {1, 2, 5}, {2, 3}])
+            problem.solve(prune=False)
+            stats = problem.stats
+            self.assertEqual(problem.amount_of_nodes_constructed,
+                             stats.close_attempts)
+            self.assertGreater(stats.closings, 0)
+            self.assertEqual(stats.close_attempts - stats.closings,
+                             stats.label_scans)
+            self.assertGreaterEqual(stats.conflicts_examined,
+                                    stats.label_scans)
+            self.assertEqual(0, stats.prune_invocations)
+            self.assertEqual(0, stats.relabels)
+            self.assertEqual(4, stats.peak_frontier)
+
+    def test_pruning_counters(self):
+        for engine_class in ENGINE_CLASSES:
+            problem = engine_class([{1, 2, 5}, {3, 4}, {1, 2}])
+            problem.solve(prune=True)
+            stats = problem.stats
+            self.assertGreater(stats.prune_invocations, 0)
+            self.assertEqual(1, stats.relabels)
+            self.assertGreater(stats.trims, 0)
+            self.assertGreaterEqual(stats.trimmed_nodes, stats.trims)
+            self.assertEqual(3, stats.largest_trim)
+
+    def test_node_reuses_in_dag_only(self):
+        list_of_conflicts = [{1, 2}, {2, 3}, {3, 4}, {1, 4}]
+        for engine_class, node_reuses in ((HsDag, 1), (RcTree, 0)):
+            problem = engine_class(list_of_conflicts)
+            problem.solve(prune=True)
+            self.assertEqual(node_reuses, problem.stats.node_reuses)
+
+    def test_cleared_when_solving_again(self):
+        problem = RcTree(list(linear_conflicts(4, 3)))
+        problem.solve()
+        counters = problem.stats.as_dict()
+        problem.solve()
+        self.assertEqual(counters, problem.stats.as_dict())
+
+    def test_phase_times(self):
+        problem = HsDag(list(linear_conflicts(4, 3)))
+        problem.solve()
+        self.assertEqual([0.0] * len(PHASES),
+                         list(problem.stats.phase_times.values()))
+        problem.stats = SolverStats(time_phases=True)
+        problem.solve()
+        self.assertEqual(list(PHASES), list(problem.stats.phase_times))
+        for phase in PHASES:
+            self.assertGreater(problem.stats.phase_times[phase], 0)
+        problem.solve()
+        self.assertTrue(problem.stats.time_phases)
+
+
+class TestSolverHooks(TestCase):
+    def test_hooks(self):
+        for engine_class in ENGINE_CLASSES:
+            events = []
+            problem = engine_class([{1, 2, 5}, {3, 4}, {1, 2}, {2, 3}])
+            problem.hooks = SolverHooks(
+                on_node_created=lambda path: events.append(('created', path)),
+                on_node_ticked=lambda path: events.append(('ticked', path)),
+                on_node_closed=lambda path: events.append(('closed', path)),
+                on_node_pruned=lambda path: events.append(('pruned', path)))
+            problem.solve(prune=True)
+            created_paths = [path for event, path in events
+                             if event == 'created']
+            self.assertEqual(problem.amount_of_nodes_constructed,
+                             len(created_paths))
+            self.assertEqual(set(), created_paths[0])
+            self.assertEqual(problem.stats.closings, len(
+                [path for event, path in events if event == 'closed']))
+            self.assertIn(('pruned', {5}), events)
+            ticked_paths = set(frozenset(path) for event, path in events
+                               if event == 'ticked')
+            self.assertTrue(set(map(frozenset,
+                                    problem.generate_minimal_hitting_sets()))
+                            .issubset(ticked_paths))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+from unittest import TestCase
+
+from minihit import (linear_conflicts, random_conflicts, HsDag, RcTree,
+                     BitsetHsDag, BitsetRcTree)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestVectorizedSolving(TestCase):
+    def setUp(self):
+        self.solve_options = [
+            (False, False),
+            (False, True),
+            (True, False),
+            (True, True),
+        ]
+        random.seed(1)
+        self.problems = [
+            [{1, 3}, {1, 4}],
+            [{3, 4, 5}, {1}],
+            [{1, 2, 5}, {1, 2}, {3, 4}],
+            list(linear_conflicts(4, 3)),
+            list(random_conflicts(10, 8)),
+            list(random_conflicts(15, 6)),
+        ]
+
+    def test_same_result_as_node_by_node(self):
+        for engine_class in (HsDag, RcTree, BitsetHsDag, BitsetRcTree):
+            for list_of_conflicts in self.problems:
+                for solve_args in self.solve_options:
+                    engine = engine_class(list_of_conflicts)
+                    engine.solve(*solve_args)
+                    expected_mhs = list(engine.generate_minimal_hitting_sets())
+                    expected_nodes = engine.amount_of_nodes_constructed
+                    engine.solve(*solve_args, vectorize=True)
+                    self.assertEqual(
+                        expected_mhs,
+                        list(engine.generate_minimal_hitting_sets()))
+                    self.assertEqual(expected_nodes,
+                                     engine.amount_of_nodes_constructed)
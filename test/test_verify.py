@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from minihit import random_conflicts
+from minihit.mmcs import Mmcs
+from minihit.mhs import SolutionSet
+from minihit.verify import (DUPLICATE, NOT_HITTING, NOT_MINIMAL, SUPERSET,
+                            FamilyVerifier, verify_family)
+
+
+class TestFamilyVerifier(TestCase):
+    def setUp(self):
+        self.list_of_conflicts = [{1, 2}, {3, 4}, {1, 2, 5}]
+        self.verifier = FamilyVerifier(self.list_of_conflicts)
+
+    def test_valid_family(self):
+        self.assertEqual([], self.verifier.violations(
+            [{1, 3}, {1, 4}, {2, 3}, {2, 4}]))
+        self.assertTrue(self.verifier.is_valid([]))
+
+    def test_single_sets(self):
+        self.assertTrue(self.verifier.is_hitting({1, 2, 3}))
+        self.assertFalse(self.verifier.is_hitting({99}))
+        self.assertFalse(self.verifier.is_hitting(set()))
+        self.assertTrue(self.verifier.is_minimal_hitting({1, 3}))
+        self.assertFalse(self.verifier.is_minimal_hitting({1, 2, 3}))
+        self.assertFalse(self.verifier.is_minimal_hitting({1}))
+        self.assertFalse(self.verifier.is_minimal_hitting(set()))
+
+    def test_private_conflicts(self):
+        # Every element hits some conflict, but 3 hits none alone
+        verifier = FamilyVerifier([{1}, {1, 3, 4}])
+        self.assertFalse(verifier.is_minimal_hitting({1, 3}))
+        self.assertEqual([(NOT_MINIMAL, 0, {1, 3}, [3])],
+                         verifier.violations([{1, 3}]))
+
+    def test_violations(self):
+        violations = self.verifier.violations(
+            [{1, 3}, {5}, {1, 2, 3}, {3, 1}, {2, 4}])
+        self.assertEqual([
+            (NOT_HITTING, 1, {5}, 2),
+            (NOT_MINIMAL, 2, {1, 2, 3}, [1, 2]),
+            (SUPERSET, 2, {1, 2, 3}, 0),
+            (DUPLICATE, 3, {3, 1}, 0),
+        ], violations)
+
+    def test_matches_solution_set(self):
+        for seed in range(10):
+            list_of_conflicts = list(random_conflicts(8, 5, seed=seed))
+            verifier = FamilyVerifier(list_of_conflicts)
+            for candidate in random_conflicts(30, 5, seed=seed + 100):
+                self.assertEqual(
+                    SolutionSet(candidate).is_minimal_hitting(
+                        list_of_conflicts),
+                    verifier.is_minimal_hitting(candidate))
+
+    def test_solver_output(self):
+        list_of_conflicts = list(random_conflicts(20, 8, seed=1))
+        mmcs = Mmcs(list_of_conflicts)
+        mmcs.solve()
+        solutions = list(mmcs.generate_minimal_hitting_sets())
+        self.assertEqual([], verify_family(list_of_conflicts, solutions))
+        self.assertEqual([DUPLICATE], [
+            violation.kind for violation
+            in verify_family(list_of_conflicts, solutions + solutions[:1])])